@@ -4,16 +4,22 @@
 import re
 import os
 import json
+import sys
 import urllib
-import numpy as np
+import hashlib
+import mmap
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 import pandas as pd
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base
 from pylatexenc.latex2text import LatexNodes2Text
 import bibtexparser
+from scripts.tables import bulk_load, frame_from_records, normalize_empty_strings
 
 # entries in the 'track' column that do not correspond to actual tracks
-no_tracks = [
+no_tracks = frozenset([
     'application', 
     'proceedings', 
     'poster', 
@@ -31,9 +37,9 @@ no_tracks = [
     'XHARD',
     'coordinators',
     'overviews',
-]
+])
 
-no_tasks =  [
+no_tasks = frozenset([
     'human?',
     'N/A',
     'reco',
@@ -49,9 +55,9 @@ no_tasks =  [
     'opt',
     'required2',
     '2',
-]
+])
 
-no_type = [
+no_type = frozenset([
     'automatic', 
     'auto', 
     'automatic-mi', 
@@ -76,7 +82,7 @@ no_type = [
     'clueweb12full', 
     'SSOAR', 
     'CiteSeerX'
-]
+])
 
 summary_prefixes = [
     'summary.trec_eval.', 
@@ -157,6 +163,87 @@ summary_suffixes = [
     '.txt', # trec23/microblog
 ]
 
+
+def trie_pattern(words):
+    # regular expression of a prefix trie of the words, matches the longest word
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def pattern(node):
+        branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        branch = branches[0] if len(branches) == 1 else '(?:{})'.format('|'.join(branches))
+        return '(?:{})?'.format(branch) if '' in node else branch
+
+    return pattern(trie)
+
+
+# affixes of the summary file names, the prefix is matched with a trie and the suffix from the end
+summary_affixes = tuple(summary_prefixes + summary_suffixes)
+summary_prefix_pattern = re.compile('(?:{})?'.format(trie_pattern(summary_prefixes)))
+summary_suffix_list = tuple(sorted(set(summary_suffixes), key=len, reverse=True))
+summary_affix_search = re.compile('|'.join(re.escape(affix) for affix in set(summary_affixes)))
+# parts of affixes that would overlap a matched prefix (or suffix) if the runid starts (or ends) with them
+summary_affix_overlaps = {
+    matched: tuple({
+        affix[k:] if matched in summary_prefixes else affix[:-k]
+        for affix in summary_affixes for k in range(1, min(len(affix), len(matched)))
+        if (matched[-k:] == affix[:k] if matched in summary_prefixes else matched[:k] == affix[-k:])
+    })
+    for matched in set(summary_affixes)
+}
+
+# measure files of the TREC-COVID rounds and the measures they hold
+covid_measures = {
+    'round1': [('means-bpref', 'bpref'), ('means-map', 'map'), ('means-ndcg', 'ndcg'), ('means-P5', 'P_5')],
+    'round2': [('means-bpref', 'bpref'), ('means-map', 'map'), ('means-ndcg', 'ndcg'), ('means-P5', 'P_5'), ('means-rbp_p5', 'rbp_p5')],
+    'round3': [('means-bpref', 'bpref'), ('means-map', 'map'), ('means-ndcg', 'ndcg'), ('means-P5', 'P_5'), ('means-rbp_p5', 'rbp_p5')],
+    'round4': [('mean-bpref', 'bpref'), ('mean-map', 'map'), ('mean-ndcg20', 'ndcg_20'), ('mean-P20', 'P_20'), ('mean-rbp_p5', 'rbp_p5')],
+    'round5': [('mean-bpref', 'bpref'), ('mean-map', 'map'), ('mean-ndcg20', 'ndcg_20'), ('mean-P20', 'P_20'), ('mean-rbp_p5', 'rbp_p5')],
+}
+
+# eval types that are detected from the summary file name, if more than one keyword matches the last one wins
+eval_types = {
+    ('trec31', 'cast'): [('lenient', 'lenient'), ('strict', 'strict')],
+    ('trec31', 'deep'): [('ndcg', 'ndcg')],
+    ('trec30', 'podcast'): [('.QD.', 'QD'), ('.QE.', 'QE'), ('.QR.', 'QR'), ('.QS.', 'QS')],
+    ('trec30', 'deep'): [('passages-eval', 'passages-eval')],
+    ('trec29', 'deep'): [('passages-eval', 'passages-eval')],
+    ('trec28', 'deep'): [('passages-eval', 'passages-eval')],
+    ('trec23', 'web'): [('risk-rm-a0-gd', 'risk-rm-a0-gd'), ('risk-rm-a0-nd', 'risk-rm-a0-nd'), ('risk-rm-a5-gd', 'risk-rm-a5-gd'), ('risk-rm-a5-nd', 'risk-rm-a5-nd'), ('risk-terrier-a0-gd', 'risk-terrier-a0-gd'), ('risk-terrier-a0-nd', 'risk-terrier-a0-nd'), ('risk-terrier-a5-gd', 'risk-terrier-a5-gd'), ('risk-terrier-a5-nd', 'risk-terrier-a5-nd'), ('std-gd', 'std-gd'), ('std-nd', 'std-nd')],
+    ('trec23', 'microblog'): [('adhoc', 'adhoc'), ('ttg', 'ttg')],
+    ('trec22', 'web'): [('risk-a0-gd', 'risk-a0-gd'), ('risk-a0-nd', 'risk-a0-nd'), ('risk-a1-gd', 'risk-a1-gd'), ('risk-a1-nd', 'risk-a1-nd'), ('risk-a5-gd', 'risk-a5-gd'), ('risk-a5-nd', 'risk-a5-nd'), ('risk-a10-gd', 'risk-a10-gd'), ('risk-a10-nd', 'risk-a10-nd'), ('std-nd', 'std-nd'), ('std-gd', 'std-gd')],
+    ('trec20', 'session'): [('allsubtopics', 'allsubtopics'), ('lastquerysubtopics', 'lastquerysubtopics')],
+    ('trec20', 'microblog'): [('allrel', 'allrel'), ('highrel', 'highrel')],
+    ('trec19', 'blog'): [('baseline', 'baseline'), ('first', 'first'), ('second', 'second')],
+    ('trec19', 'chemical'): [('full', 'full'), ('small', 'small')],
+    ('trec18', 'blog'): [('headline', 'headline'), ('first', 'first'), ('second', 'second'), ('none', 'none')],
+    ('trec18', 'legal'): [('eval', 'eval'), ('evalH', 'evalH')],
+    ('trec18', 'chemical'): [('full', 'full'), ('small', 'small'), ('eval', 'eval')],
+    ('trec17', 'enterprise'): [('document', 'document'), ('expert', 'expert')],
+    ('trec17', 'blog'): [('feed', 'feed'), ('opinion', 'opinion'), ('positive', 'positive'), ('negative', 'negative'), ('topicrel', 'topicrel')],
+    ('trec17', 'legal'): [('adhoc', 'adhoc'), ('adhocH', 'adhocH'), ('resid', 'resid'), ('residH', 'residH')],
+    ('trec16', 'blog'): [('feed', 'feed'), ('opinion', 'opinion'), ('polarity', 'polarity'), ('topicrel', 'topicrel')],
+    ('trec16', 'enterprise'): [('doc-promotion', 'doc-promotion'), ('doc-residual', 'doc-residual'), ('document', 'document'), ('experts', 'experts')],
+    ('trec15', 'blog'): [('opinion', 'opinion'), ('topicrel', 'topicrel')],
+    ('trec29', 'pm'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec28', 'pm'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec27', 'pm'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec26', 'pm'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec25', 'clinical'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec24', 'clinical'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec23', 'clinical'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec21', 'medical'): [('sample-eval', 'sample-eval'), ('evidence', 'evidence-eval')],
+    ('trec21', 'web'): [('gdeval', 'gdeval'), ('ndeval', 'ndeval')],
+    ('trec20', 'web'): [('gdeval', 'gdeval'), ('ndeval', 'ndeval')],
+    ('trec19', 'web'): [('gdeval', 'gdeval'), ('ndeval', 'ndeval')],
+}
+
 field_names_runs = [
     'runid', 
     'pid', 
@@ -211,6 +298,17 @@ field_names_covid = [
     'notes'
 ] 
 
+# field names of the runs and participants tables
+table_field_names = {
+    'runs': field_names_runs,
+    'participants': field_names_participants,
+    'covid-runs': field_names_covid,
+    'covid-participants': field_names_covid,
+}
+
+# withdrawn runs are marked in the first field of the runs table
+dropout_pattern = re.compile('DROPOUT|dropout|DROP-OUT')
+
 run_types = [
     'automatic', 
     'auto', 
@@ -238,7 +336,7 @@ run_types = [
     'CiteSeerX'
 ]
 
-xligualalt_special_url = [
+xligualalt_special_url = frozenset([
     'RaliHanE2EF', 
     'RaliHanF2EF', 
     'RaliWebE2EF', 
@@ -249,7 +347,7 @@ xligualalt_special_url = [
     'tno8mx', 
     'TW8E2F', 
     'TW8F2E'
-]
+])
 
 # measures that will be parsed from the summary files if available
 trec_eval_measures = [
@@ -280,7 +378,7 @@ sample_eval_measures = [
 ]
 
 # older summaries with different formatting
-old_summary = [
+old_summary = frozenset([
     ('trec14', 'robust'),
     ('trec14', 'qa'),
     ('trec14', 'HARD'),
@@ -325,10 +423,10 @@ old_summary = [
     ('trec3', 'routing'),
     ('trec2', 'adhoc'),
     ('trec2', 'routing')
-]
+])
 
 # no datasets available
-no_data = [
+no_data = frozenset([
     ('trec33', 'avs'),
     ('trec33', 'vtt'),
     ('trec33', 'medvidqa'),
@@ -358,10 +456,10 @@ no_data = [
     ('trec5', 'nlp'),
     ('trec5', 'filtering'),
     ('trec5', 'dbmerge')
-]
+])
 
 # no summaries are available
-no_summary = [ 
+no_summary = frozenset([
     ('trec33', 'actev'),
     ('trec33', 'avs'),
     ('trec33', 'biogen'),
@@ -429,10 +527,10 @@ no_summary = [
     ('trec5', 'confusion'),
     ('trec5', 'interactive'),
     ('trec4', 'filtering')
-]
+])
 
 # summaries are available but no parsing is implemented
-no_summary_parsing = [ 
+no_summary_parsing = frozenset([
     ('trec31', 'crisis'),
     ('trec31', 'fair'),
     ('trec30', 'fair'),
@@ -458,10 +556,10 @@ no_summary_parsing = [
     ('trec8', 'qa'),
     ('trec7', 'filtering'),
     ('trec4', 'filtering'),
-]
+])
 
 # no appendix files available
-no_appendix = [
+no_appendix = frozenset([
     ('trec29', 'incident'),
     ('trec27', 'car'),
     ('trec27', 'news'),
@@ -481,10 +579,10 @@ no_appendix = [
     ('trec8', 'query'),
     ('trec7', 'interactive'),
     ('trec4', 'filtering'),
-]
+])
 
 # no input files available
-no_input = [
+no_input = frozenset([
     ('trec33', 'avs'),
     ('trec33', 'actev'),
     ('trec33', 'ccu'),
@@ -528,10 +626,10 @@ no_input = [
     ('trec6', 'interactive'),  # *.docs and *.search exist
     ('trec5', 'interactive'),
     ('trec4', 'filtering'),
-]
+])
 
 # no proceedings available
-no_proceedings = [
+no_proceedings = frozenset([
     ('trec-covid', 'round5'),
     ('trec-covid', 'round4'),
     ('trec-covid', 'round3'),
@@ -540,27 +638,70 @@ no_proceedings = [
     ('trec4', 'filtering'),
     ('trec1', 'adhoc'),
     ('trec1', 'routing'),
-]
+])
 
 # no runs page in the browser
-no_runs = [
+no_runs = frozenset([
     ('trec6', 'vlc'),
     ('trec4', 'filtering'),
     ('trec1', 'adhoc'),
     ('trec1', 'routing'),
-]
+])
 
 # no participants page in the browser
-no_participants = [
+no_participants = frozenset([
     ('trec6', 'vlc'),
     ('trec4', 'filtering'),
     ('trec1', 'adhoc'),
     ('trec1', 'routing'),
-]
+])
+
+# track identifiers that differ between the runs tables and the rest of the metadata
+track_renames = {
+    ('trec28', 'converse'): 'cast',
+    ('trec12', 'genome'): 'genomics',
+    ('trec6', 'high-prec'): 'hp',
+}
+
+# tracks with a task field that is taken from another column
+task_field_fixes = frozenset([
+    ('trec7', 'xlingual'),
+    ('trec25', 'recall'),
+    ('trec24', 'recall'),
+    ('trec23', 'session'),
+    ('trec22', 'session'),
+])
+
+# tracks without a meaningful fields column (besides the car track of every year)
+no_fields = frozenset([
+    ('trec27', 'core'),
+    ('trec26', 'core'),
+    ('trec25', 'recall'),
+    ('trec23', 'web'),
+    ('trec21', 'microblog'),
+    ('trec20', 'crowd'),
+    ('trec9', 'filtering'),
+    ('trec5', 'confusion'),
+])
+
+# tracks without run descriptions
+no_description = frozenset([
+    ('trec14', 'terabyte'),
+])
 
 
 results_url = 'https://trec.nist.gov/results'
 
+# per-conference bibtex shards and their converted entries
+bibtex_shards = os.path.join('bibtex', 'single')
+bibtex_cache = os.path.join('.cache', 'bibtex')
+
+# per-track ledgers of the parsed summary files and the rows they produced
+results_ledger = os.path.join('.cache', 'results')
+
+# optional per-topic scores, one file per track next to the conference's metadata (see write_topic_results)
+topic_results_path = os.path.join('metadata', '{trec}', 'topics', '{track}.feather')
+
 
 def trec_year(trec_name):
     if trec_name == 'trec-covid':
@@ -569,52 +710,30 @@ def trec_year(trec_name):
     return 1991 + int(iteration[0])
 
 
-def parse_line(fields, _type='runs'):
-    for i in range(len(fields)):
-        # some entries in runs_table files have more than the typical 18 fields (trec24 to trec29)
-        if _type == 'runs' and i < len(field_names_runs):
-            yield field_names_runs[i], fields[i] 
-        if _type == 'participants':
-            yield field_names_participants[i], fields[i] 
-        if _type in ['covid-runs', 'covid-participants']:
-            yield field_names_covid[i], fields[i] 
-
-
-def metadata_line(fields, _type='runs'):
-    return dict(parse_line(fields, _type=_type))
-
-
-def     table_list(f_path, _type='runs'):
-    data = []
+def iter_table(f_path, _type='runs'):
+    # reads the table lazily and filters out comments, dropouts, registrations and non-tracks in the same pass
+    field_names = table_field_names.get(_type, [])
     with open(f_path, encoding='utf8', errors='ignore') as f_in:
-        lines = f_in.readlines()
-        for line in lines:
+        for line in f_in:
             if line[0] == '#':
                 continue
-            else:
-                fields = line.split(':')
-                if any(d in fields[0] for d in ['DROPOUT', 'dropout', 'DROP-OUT']):
-                    continue 
-                if _type == 'participants':
-                    fields = fields[:14] 
-                line = metadata_line(fields, _type=_type)
-                if line.get('task') == 'registration':
-                    continue
-                if line.get('track') not in no_tracks:
-                    data.append(line) 
-    return data
+            fields = line.split(':')
+            if dropout_pattern.search(fields[0]):
+                continue 
+            if _type == 'participants':
+                fields = fields[:14] 
+            # some entries in runs_table files have more than the typical 18 fields (trec24 to trec29)
+            if _type != 'runs' and len(fields) > len(field_names):
+                raise IndexError('{} has more fields than expected: {}'.format(f_path, line))
+            item = dict(zip(field_names, fields))
+            if item.get('task') == 'registration':
+                continue
+            if item.get('track') not in no_tracks:
+                yield item
 
 
 def rename_track_identifier(item):
-    if item['trec'] == 'trec28':
-        if item['track'] == 'converse':
-            item['track'] = 'cast'
-    if item['trec'] == 'trec12':
-        if item['track'] == 'genome':
-            item['track'] = 'genomics'
-    if item['trec'] == 'trec6':
-        if item['track'] == 'high-prec':
-            item['track'] = 'hp'
+    item['track'] = track_renames.get((item['trec'], item['track']), item['track'])
     return item 
 
 
@@ -633,27 +752,60 @@ def adjust_task_field(item):
     return item
 
 
-def parse_description(item):
-    if item['trec'] == 'trec32':
-        if item['track'] == 'tot':
-            desc = '\n'.join([item['description'], item['of_1']])
-            item['description'] = desc.strip()
-        if item['track'] == 'product':
-            item['description'] = item['of_4']
-    if item['trec'] in ['trec32', 'trec31', 'trec30'] and item['track'] == 'trials':
-        if len(item['description']) == 0:
-            item['description'] = item['of_4']
-    if item['trec'] in ['trec29', 'trec28'] and item['track'] == 'pm':
-        if len(item['description']) == 0:
-            item['description'] = item['of_4']
-    if item['trec'] == 'trec12':
-        item['description'] = item['of_5']
-    if item['trec'] == 'trec11' and item['track'] != 'filtering':
-        item['description'] = item['of_5']
-    if item['trec'] == 'trec10':
+def description_trec32(item):
+    if item['track'] == 'tot':
+        desc = '\n'.join([item['description'], item['of_1']])
+        item['description'] = desc.strip()
+    if item['track'] == 'product':
         item['description'] = item['of_4']
-    if item['year'] < 1998:
-        item['description'] = None
+    return item
+
+
+def description_trec32_trec31_trec30_trials(item):
+    if len(item['description']) == 0:
+        item['description'] = item['of_4']
+    return item
+
+
+def description_trec29_trec28_pm(item):
+    if len(item['description']) == 0:
+        item['description'] = item['of_4']
+    return item
+
+
+def description_trec12(item):
+    item['description'] = item['of_5']
+    return item
+
+
+def description_trec11(item):
+    item['description'] = item['of_5']
+    return item
+
+
+def description_trec10(item):
+    item['description'] = item['of_4']
+    return item
+
+
+def description_before_1998(item):
+    item['description'] = None
+    return item
+
+
+# fix-ups of the description of a run, with the (trec, track) pairs they apply to
+description_rules = [
+    (description_trec32, lambda trec, track: trec == 'trec32' and track in ['tot', 'product']),
+    (description_trec32_trec31_trec30_trials, lambda trec, track: trec in ['trec32', 'trec31', 'trec30'] and track == 'trials'),
+    (description_trec29_trec28_pm, lambda trec, track: trec in ['trec29', 'trec28'] and track == 'pm'),
+    (description_trec12, lambda trec, track: trec == 'trec12'),
+    (description_trec11, lambda trec, track: trec == 'trec11' and track != 'filtering'),
+    (description_trec10, lambda trec, track: trec == 'trec10'),
+    (description_before_1998, lambda trec, track: trec_year(trec) < 1998),
+]
+
+
+def parse_description(item):
     if item.get('description'): 
         item['description'] = urllib.parse.unquote(item['description'])
         item['description'] = re.sub(r'[^\x00-\x7F]+','', item['description'])
@@ -694,1640 +846,1950 @@ def add_implementation_and_hardware(item):
 
 ## TREC 33 TO HERE
 
-def make_input(item):
-    # common input
-    input = '.'.join(['input', item['runid'], 'gz'])
-    
-    # TREC-30 input
-    if item['trec'] == 'trec30':
-        if item['track'] == 'podcast':
-            if item['task'] == 'summarization':
-                input = '.'.join(['input', item['runid'], 'tgz'])
-
-    # TREC-29 input            
-    if item['trec'] == 'trec29':
-        if item['track'] == 'fair':
-            input = '.'.join(['input', item['runid'], 'gz'])
-        if item['track'] == 'podcast':
-            if item['task'] == 'summarization':
-                input = '.'.join(['input', item['runid'], 'tgz'])
-    
-    # TREC-26 input
-    if item['trec'] == 'trec26':
-        if item['track'] in ['rts', 'task', 'domain']:
-            input = '.'.join([item['runid'], 'gz'])
-    
-    # TREC-25 input
-    if item['trec'] == 'trec25':
-        if item['track'] in ['task', 'domain', 'realtime', 'qa']:
-            input = '.'.join([item['runid'], 'gz'])
-        if item['track'] == 'qa':
-            input = '.'.join([item['runid'], 'txt'])
-    
-    # TREC-24 input
-    if item['trec'] == 'trec24':
-        if item['track'] in ['microblog', 'task', 'domain']:
-            input = '.'.join([item['runid'], 'gz'])
-    
-    # TREC-23 input
-    if item['trec'] == 'trec23':
-        if item['track'] in ['context', 'microblog', 'federated', 'tempsumm']:
-            input = '.'.join([item['runid'], 'gz'])
-        if item['track'] == 'kba':
-            input = '.'.join([item['pid'], 'tar', 'gz'])
-        if item['track'] == 'session':
-            _input = '.'.join([item['runid'], 'gz'])
-            input = '-'.join(['input', _input])
-    
-    # TREC-22 input
-    if item['trec'] == 'trec22':
-        if item['track'] in ['context', 'federated']:
-            input = '.'.join([item['runid'], 'gz'])
-        if item['track'] == 'kba':
-            input = '.'.join([item['pid'], 'tar'])
-        if item['track'] == 'session':
-            _input = '.'.join([item['runid'], 'gz'])
-            input = '-'.join(['input', _input])
-    
-    # TREC-21 input
-    if item['trec'] == 'trec21': 
-        if item['track'] == 'context':
-            input = '.'.join([item['runid'], 'xml', 'gz'])
-    
-    # TREC-19 input
-    if item['trec'] == 'trec19': 
-        if item['track'] == 'web':
-            if item['task'] == 'spam':
-                input = '.'.join([item['runid'], 'bz2'])
-    
+# TREC-30 input
+def input_trec30(item, input):
+    if item['track'] == 'podcast':
+        if item['task'] == 'summarization':
+            input = '.'.join(['input', item['runid'], 'tgz'])
     return input
 
 
-def make_input_url(item, input):
-    # common input_url
-    input_url = '/'.join([results_url, item['trec'], item['track'], input])
+# TREC-29 input            
+def input_trec29(item, input):
+    if item['track'] == 'fair':
+        input = '.'.join(['input', item['runid'], 'gz'])
+    if item['track'] == 'podcast':
+        if item['task'] == 'summarization':
+            input = '.'.join(['input', item['runid'], 'tgz'])
+    return input
 
-    # TREC-COVID
-    if item['trec'] == 'trec-covid':
-        if item['track'] in ['round4', 'round5']:
-            input = '.'.join([item['runid'], 'gz'])
-            input_url = '/'.join(['https://ir.nist.gov/trec-covid/archive', item['track'], input])
-        else:
-            input_url = '/'.join(['https://ir.nist.gov/trec-covid/archive', item['track'], item['runid']])
-
-    # TREC-28 input_url 
-    if item['trec'] == 'trec28':
-        if item['track'] == 'decisions':
-            input_url = '/'.join([results_url, item['trec'], 'decision', input])
-
-    # TREC-24 input_url         
-    if item['trec'] == 'trec24':
-        if item['track'] == 'qa':
-            if item['runid'] == 'system7':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/ADAPT.DCU-system7'
-            if item['runid'] == 'CMUOAQA':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/CMUOAQA-CarnegieMellonUniversityOAQAteam'
-            if item['runid'] == 'dfkiqa':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/DFKI-dfkiqa'
-            if item['runid'] == 'ecnucs':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/EastChinaNormalUniversity-ecnucs'            
-            if item['runid'] == 'ECNU_ICA_2':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/ECNU-ECNU_ICA_2'
-            if item['runid'] == 'Out-of-mEmory':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/emory-Out-of-mEmory'
-            if item['runid'] == 'HIT_SCIR_QA_Grp':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/harbininstituteoftechnology-HIT_SCIR_QA_Grp'
-            if item['runid'] == 'NUDTMDP1':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP1'
-            if item['runid'] == 'NUDTMDP2':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP2'
-            if item['runid'] == 'NUDTMDP3':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP3'
-            if item['runid'] == 'QU1':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/QatarUniversity-QU1'
-            if item['runid'] == 'system2':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-system2'
-            if item['runid'] == 'RMIT1':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT1'
-            if item['runid'] == 'RMIT2':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT2'
-            if item['runid'] == 'RMIT3':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT3'
-            if item['runid'] == 'SantaClaraUniversity':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/SCU-SantaClaraUniversity'
-            if item['runid'] == 'CLIP1':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP1'
-            if item['runid'] == 'CLIP2':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP2'
-            if item['runid'] == 'CLIP3':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP3'
-            if item['runid'] == 'system4':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/uwaterlooclarke-system4'
-            if item['runid'] == 'Exp1':
-                input_url = 'https://trec.nist.gov/results/trec24/qa/Yahoo-Exp1'
-
-    # TREC-20 input_url         
-    if item['trec'] == 'trec20':
-        if item['track'] == 'entity':
-            if item['task'] != 'ref':
-                input_url = None    
-    
-    # TREC-16 input_url 
-    if item['trec'] == 'trec16':
-        if item['track'] == 'spam':
-            if item['task'] == 'filter':
-                input_url = None
 
-    # TREC-15 input_url 
-    if item['trec'] == 'trec15':
-        if item['track'] == 'spam':
-            if item['task'] == 'filter':
-                input_url = None
-        if item['track'] == 'blog':
-            if item['task'] == 'open_task':
-                input_url = None    
-    
-    # TREC-12 input_url 
-    if item['trec'] == 'trec12':
-        if item['track'] in ['genomics', 'hard', 'qa', 'novelty', 'qa', 'web']:
-            input = '.'.join(['input', item['runid']])
+# TREC-26 input
+def input_trec26(item, input):
+    if item['track'] in ['rts', 'task', 'domain']:
+        input = '.'.join([item['runid'], 'gz'])
+    return input
+
+
+# TREC-25 input
+def input_trec25(item, input):
+    if item['track'] in ['task', 'domain', 'realtime', 'qa']:
+        input = '.'.join([item['runid'], 'gz'])
+    if item['track'] == 'qa':
+        input = '.'.join([item['runid'], 'txt'])
+    return input
+
+
+# TREC-24 input
+def input_trec24(item, input):
+    if item['track'] in ['microblog', 'task', 'domain']:
+        input = '.'.join([item['runid'], 'gz'])
+    return input
+
+
+# TREC-23 input
+def input_trec23(item, input):
+    if item['track'] in ['context', 'microblog', 'federated', 'tempsumm']:
+        input = '.'.join([item['runid'], 'gz'])
+    if item['track'] == 'kba':
+        input = '.'.join([item['pid'], 'tar', 'gz'])
+    if item['track'] == 'session':
+        _input = '.'.join([item['runid'], 'gz'])
+        input = '-'.join(['input', _input])
+    return input
+
+
+# TREC-22 input
+def input_trec22(item, input):
+    if item['track'] in ['context', 'federated']:
+        input = '.'.join([item['runid'], 'gz'])
+    if item['track'] == 'kba':
+        input = '.'.join([item['pid'], 'tar'])
+    if item['track'] == 'session':
+        _input = '.'.join([item['runid'], 'gz'])
+        input = '-'.join(['input', _input])
+    return input
+
+
+# TREC-21 input
+def input_trec21(item, input):
+    if item['track'] == 'context':
+        input = '.'.join([item['runid'], 'xml', 'gz'])
+    return input
+
+
+# TREC-19 input
+def input_trec19(item, input):
+    if item['track'] == 'web':
+        if item['task'] == 'spam':
+            input = '.'.join([item['runid'], 'bz2'])
+    return input
+
+
+# fix-ups of the input file name of a run, with the (trec, track) pairs they apply to
+input_rules = [
+    (input_trec30, lambda trec, track: trec == 'trec30' and track == 'podcast'),
+    (input_trec29, lambda trec, track: trec == 'trec29' and track in ['fair', 'podcast']),
+    (input_trec26, lambda trec, track: trec == 'trec26' and track in ['rts', 'task', 'domain']),
+    (input_trec25, lambda trec, track: trec == 'trec25' and track in ['task', 'domain', 'realtime', 'qa']),
+    (input_trec24, lambda trec, track: trec == 'trec24' and track in ['microblog', 'task', 'domain']),
+    (input_trec23, lambda trec, track: trec == 'trec23' and track in ['context', 'microblog', 'federated', 'tempsumm', 'kba', 'session']),
+    (input_trec22, lambda trec, track: trec == 'trec22' and track in ['context', 'federated', 'kba', 'session']),
+    (input_trec21, lambda trec, track: trec == 'trec21' and track == 'context'),
+    (input_trec19, lambda trec, track: trec == 'trec19' and track == 'web'),
+]
+
+
+
+# TREC-COVID
+def input_url_trec_covid(item, input, input_url):
+    if item['track'] in ['round4', 'round5']:
+        input = '.'.join([item['runid'], 'gz'])
+        input_url = '/'.join(['https://ir.nist.gov/trec-covid/archive', item['track'], input])
+    else:
+        input_url = '/'.join(['https://ir.nist.gov/trec-covid/archive', item['track'], item['runid']])
+    return input_url
+
+
+# TREC-28 input_url 
+def input_url_trec28(item, input, input_url):
+    if item['track'] == 'decisions':
+        input_url = '/'.join([results_url, item['trec'], 'decision', input])
+    return input_url
+
+
+# TREC-24 input_url         
+def input_url_trec24(item, input, input_url):
+    if item['track'] == 'qa':
+        if item['runid'] == 'system7':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/ADAPT.DCU-system7'
+        if item['runid'] == 'CMUOAQA':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/CMUOAQA-CarnegieMellonUniversityOAQAteam'
+        if item['runid'] == 'dfkiqa':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/DFKI-dfkiqa'
+        if item['runid'] == 'ecnucs':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/EastChinaNormalUniversity-ecnucs'            
+        if item['runid'] == 'ECNU_ICA_2':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/ECNU-ECNU_ICA_2'
+        if item['runid'] == 'Out-of-mEmory':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/emory-Out-of-mEmory'
+        if item['runid'] == 'HIT_SCIR_QA_Grp':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/harbininstituteoftechnology-HIT_SCIR_QA_Grp'
+        if item['runid'] == 'NUDTMDP1':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP1'
+        if item['runid'] == 'NUDTMDP2':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP2'
+        if item['runid'] == 'NUDTMDP3':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/MassiveDataProcessingLab-NUDTMDP3'
+        if item['runid'] == 'QU1':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/QatarUniversity-QU1'
+        if item['runid'] == 'system2':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-system2'
+        if item['runid'] == 'RMIT1':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT1'
+        if item['runid'] == 'RMIT2':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT2'
+        if item['runid'] == 'RMIT3':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/RMIT-RMIT3'
+        if item['runid'] == 'SantaClaraUniversity':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/SCU-SantaClaraUniversity'
+        if item['runid'] == 'CLIP1':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP1'
+        if item['runid'] == 'CLIP2':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP2'
+        if item['runid'] == 'CLIP3':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/UniversityofMaryland-CLIP3'
+        if item['runid'] == 'system4':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/uwaterlooclarke-system4'
+        if item['runid'] == 'Exp1':
+            input_url = 'https://trec.nist.gov/results/trec24/qa/Yahoo-Exp1'
+    return input_url
+
+
+# TREC-20 input_url         
+def input_url_trec20(item, input, input_url):
+    if item['track'] == 'entity':
+        if item['task'] != 'ref':
+            input_url = None    
+    return input_url
+
+
+# TREC-16 input_url 
+def input_url_trec16(item, input, input_url):
+    if item['track'] == 'spam':
+        if item['task'] == 'filter':
+            input_url = None
+    return input_url
+
+
+# TREC-15 input_url 
+def input_url_trec15(item, input, input_url):
+    if item['track'] == 'spam':
+        if item['task'] == 'filter':
+            input_url = None
+    if item['track'] == 'blog':
+        if item['task'] == 'open_task':
+            input_url = None    
+    return input_url
+
+
+# TREC-12 input_url 
+def input_url_trec12(item, input, input_url):
+    if item['track'] in ['genomics', 'hard', 'qa', 'novelty', 'qa', 'web']:
+        input = '.'.join(['input', item['runid']])
+    input_url = '/'.join([results_url, item['trec'], item['track'], 'inputs', input])
+    return input_url
+
+
+# TREC-11 input_url 
+def input_url_trec11(item, input, input_url):
+    if item['track'] in ['filtering', 'novelty', 'qa', 'web']:
         input_url = '/'.join([results_url, item['trec'], item['track'], 'inputs', input])
-    
-    # TREC-11 input_url 
-    if item['trec'] == 'trec11':
-        if item['track'] in ['filtering', 'novelty', 'qa', 'web']:
-            input_url = '/'.join([results_url, item['trec'], item['track'], 'inputs', input])
-    
-    # TREC-10 input_url 
-    if item['trec'] == 'trec10':
-        if item['track'] in ['xlingual']:
-            input_url = '/'.join([results_url, item['trec'], 'xling_inputs', input])
-    
-    # TREC-8 input_url 
-    if item['trec'] == 'trec8':
-        url_part = '.'.join([item['trec'], 'results', 'input'])
-        if item['track'] == 'adhoc':
-            input_url = '/'.join([results_url, item['trec'], url_part, item['track'], input])
-        else:
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
-        if item['track'] == 'query':
-            input_url = 'https://trec.nist.gov/results/trec8/trec8.results.input/tracks/query/query_runs.tar.gz'
-        if item['track'] == 'web':
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'smweb', input])
-    
-    # TREC-7 input_url 
-    if item['trec'] == 'trec7':
-        url_part = '.'.join([item['trec'], 'results', 'input'])
-        if item['track'] == 'adhoc':
-            input_url = '/'.join([results_url, item['trec'], url_part, item['track'], input])
-        else:
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
-        if item['track'] == 'hp':
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'high_prec', input])
-        if item['runid'] in xligualalt_special_url:
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'xligualalt', input])
-        if item['track'] == 'xlingual':
-            if item['task'].strip() == 'EF':
-                input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], 'ef', input])
-            if item['task'].strip() == 'EFGI':
-                input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], 'efgi', input])
-            else: 
-                input_url = None
-    
-    # TREC-6 input_url 
-    if item['trec'] == 'trec6':
-        url_part = '.'.join([item['trec'], 'results', 'input'])
-        if item['track'] in ['adhoc', 'routing']:
-            category = 'Category' + item['task'].upper()
-            input_url = '/'.join([results_url, item['trec'], url_part, item['track'], category, input])
-        else:
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
-        if item['track'] == 'clir':
-            target_lang = item['task'].split('-')[1].replace('(Trans)', '').lower()
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], target_lang, input])
-        if item['track'] == 'hp':
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'high_prec', input])
-    
-    # TREC-5 input_url 
-    if item['trec'] == 'trec5':
-        url_part = '.'.join([item['trec'], 'results', 'input'])
-        if item['track'] in ['adhoc', 'routing']:
-            category = 'Category' + item['task'].upper()
-            input_url = '/'.join([results_url, item['trec'], url_part, item['track'], category, input])
-        else:
-            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
-    
-    # TREC-4 input_url 
-    if item['trec'] == 'trec4':
-        input = '.'.join(['input', item['runid'], 'Z'])
-        if item['track'] in ['adhoc', 'routing']:
-            _p = ''.join([item['trec'], '.results.input'])
-            category = ''.join(['Category', item['task']])
-            input_url = '/'.join([results_url, item['trec'], _p, item['track'], category, input])
-        if item['track'] in ['confusion', 'dbmerge']:
-            _p = ''.join([item['trec'], '.results.input'])
-            input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], input])
-        if item['track'] in ['interactive']:
-            input = '.'.join(['input', item['runid']])
-            _p = ''.join([item['trec'], '.results.input'])
-            input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'TASK1', input])
-        if item['track'] in ['spanish']:
-            _p = ''.join([item['trec'], '.results.input'])
-            input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], item['task'], input])
-    
-    # TREC-3 input_url 
-    # TREC-2 input_url 
-    if item['trec'] in ['trec3', 'trec2']:
-        input = '.'.join(['input', item['runid'], 'gz'])
-        if item['track'] in ['adhoc', 'routing']:
-            _p = ''.join([item['trec'], '.results.input'])
-            input_url = '/'.join([results_url, item['trec'], _p, item['track'], input])
-    
     return input_url
 
 
-def make_summary(item):
-    # common summary
-    summary = '.'.join(['summary', item['runid']])
+# TREC-10 input_url 
+def input_url_trec10(item, input, input_url):
+    if item['track'] in ['xlingual']:
+        input_url = '/'.join([results_url, item['trec'], 'xling_inputs', input])
+    return input_url
 
-    # TREC-32 summaries
-    if item['trec'] == 'trec32':
-        if item['track'] == 'atomic':
-            summary = f'summary.{item["runid"]}.eval'
-        if item['track'] == 'deep':
-            summary = f'treceval.{item["runid"]}.eval'
-        if item['track'] == 'ikat':
-            summary = {
-                'Summary (doc ranking)': f'summary.{item["runid"]}.doc-eval',
-                'Summary (PTKB ranking)': f'summary.{item["runid"]}.ptkb-eval'
-            }
-        if item['track'] == 'neuclir':
-            summary = f'summary.{item["runid"]}.eval'
-        if item['track'] == 'product':
-            summary = f'{item["runid"]}.eval'
-        if item['track'] == 'tot':
-            summary = f'treceval.{item["runid"]}.eval'
-        if item['track'] == 'trials':
-            summary = {
-                'Summary (trec_eval)': f'{item["runid"]}.treceval',
-                'Summary (nDCG)': f'{item["runid"]}.ndcg-eval'
-            }
 
-    # TREC-31 summary
-    if item['trec'] == 'trec31':
-        if item['track'] == 'deep':
-            if item['task'] == 'docs':
-                summary = '.'.join(['summary', item['runid']])
-            if item['task'] == 'passages':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', item['runid'], 'trec_eval']),
-                    'Summary (ndcg)': '.'.join(['summary', item['runid'], 'ndcg'])
-                }
-        if item['track'] == 'neuclir':
-            summary = '.'.join(['summary', item['runid'], 'trec_eval'])
-        if item['track'] == 'cast':              
-            summary = {
-                'Summary (strict)': '.'.join(['summary', item['runid'], 'strict']),
-                'Summary (lenient)': '.'.join(['summary', item['runid'], 'lenient'])
-            }
-        if item['track'] == 'fair':                         
-            if item['task'] == 'coordinators': 
-                summary = '.'.join(['summary', item['runid'], 'coord', 'tsv'])
-            if item['task'] == 'editors': 
-                summary = '.'.join(['summary', item['runid'], 'editors', 'tsv'])
-        if item['track'] == 'crisis':                       
-            summary = {
-                'Summary (auto)': '.'.join(['summary', item['runid'], 'auto', 'csv']),
-                'Summary (manual)': '.'.join(['summary', item['runid'], 'manual', 'tar', 'gz'])
-            }
+# TREC-8 input_url 
+def input_url_trec8(item, input, input_url):
+    url_part = '.'.join([item['trec'], 'results', 'input'])
+    if item['track'] == 'adhoc':
+        input_url = '/'.join([results_url, item['trec'], url_part, item['track'], input])
+    else:
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
+    if item['track'] == 'query':
+        input_url = 'https://trec.nist.gov/results/trec8/trec8.results.input/tracks/query/query_runs.tar.gz'
+    if item['track'] == 'web':
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'smweb', input])
+    return input_url
 
-    # TREC-30 summary
-    if item['trec'] == 'trec30':
-        if item['track'] == 'incident':
-            summary = '.'.join(['summary', item['runid'], 'html'])
-        if item['track'] == 'deep':
-            if item['task'] == 'passages':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                    'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
-                }
-            else:
-                summary = '.'.join(['summary', 'treceval', item['runid']])
-        if item['track'] == 'podcast':
-            summary = '.'.join(['summary', 'QD', item['runid']])
+
+# TREC-7 input_url 
+def input_url_trec7(item, input, input_url):
+    url_part = '.'.join([item['trec'], 'results', 'input'])
+    if item['track'] == 'adhoc':
+        input_url = '/'.join([results_url, item['trec'], url_part, item['track'], input])
+    else:
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
+    if item['track'] == 'hp':
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'high_prec', input])
+    if item['runid'] in xligualalt_special_url:
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'xligualalt', input])
+    if item['track'] == 'xlingual':
+        if item['task'].strip() == 'EF':
+            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], 'ef', input])
+        if item['task'].strip() == 'EFGI':
+            input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], 'efgi', input])
+        else: 
+            input_url = None
+    return input_url
+
+
+# TREC-6 input_url 
+def input_url_trec6(item, input, input_url):
+    url_part = '.'.join([item['trec'], 'results', 'input'])
+    if item['track'] in ['adhoc', 'routing']:
+        category = 'Category' + item['task'].upper()
+        input_url = '/'.join([results_url, item['trec'], url_part, item['track'], category, input])
+    else:
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
+    if item['track'] == 'clir':
+        target_lang = item['task'].split('-')[1].replace('(Trans)', '').lower()
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], target_lang, input])
+    if item['track'] == 'hp':
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', 'high_prec', input])
+    return input_url
+
+
+# TREC-5 input_url 
+def input_url_trec5(item, input, input_url):
+    url_part = '.'.join([item['trec'], 'results', 'input'])
+    if item['track'] in ['adhoc', 'routing']:
+        category = 'Category' + item['task'].upper()
+        input_url = '/'.join([results_url, item['trec'], url_part, item['track'], category, input])
+    else:
+        input_url = '/'.join([results_url, item['trec'], url_part, 'tracks', item['track'], input])
+    return input_url
+
+
+# TREC-4 input_url 
+def input_url_trec4(item, input, input_url):
+    input = '.'.join(['input', item['runid'], 'Z'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.input'])
+        category = ''.join(['Category', item['task']])
+        input_url = '/'.join([results_url, item['trec'], _p, item['track'], category, input])
+    if item['track'] in ['confusion', 'dbmerge']:
+        _p = ''.join([item['trec'], '.results.input'])
+        input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], input])
+    if item['track'] in ['interactive']:
+        input = '.'.join(['input', item['runid']])
+        _p = ''.join([item['trec'], '.results.input'])
+        input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'TASK1', input])
+    if item['track'] in ['spanish']:
+        _p = ''.join([item['trec'], '.results.input'])
+        input_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], item['task'], input])
+    return input_url
+
+
+# TREC-3 input_url 
+# TREC-2 input_url 
+def input_url_trec3_trec2(item, input, input_url):
+    input = '.'.join(['input', item['runid'], 'gz'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.input'])
+        input_url = '/'.join([results_url, item['trec'], _p, item['track'], input])
+    return input_url
+
+
+# fix-ups of the input url of a run, with the (trec, track) pairs they apply to
+input_url_rules = [
+    (input_url_trec_covid, lambda trec, track: trec == 'trec-covid'),
+    (input_url_trec28, lambda trec, track: trec == 'trec28' and track == 'decisions'),
+    (input_url_trec24, lambda trec, track: trec == 'trec24' and track == 'qa'),
+    (input_url_trec20, lambda trec, track: trec == 'trec20' and track == 'entity'),
+    (input_url_trec16, lambda trec, track: trec == 'trec16' and track == 'spam'),
+    (input_url_trec15, lambda trec, track: trec == 'trec15' and track in ['spam', 'blog']),
+    (input_url_trec12, lambda trec, track: trec == 'trec12'),
+    (input_url_trec11, lambda trec, track: trec == 'trec11' and track in ['filtering', 'novelty', 'qa', 'web']),
+    (input_url_trec10, lambda trec, track: trec == 'trec10' and track == 'xlingual'),
+    (input_url_trec8, lambda trec, track: trec == 'trec8'),
+    (input_url_trec7, lambda trec, track: trec == 'trec7'),
+    (input_url_trec6, lambda trec, track: trec == 'trec6'),
+    (input_url_trec5, lambda trec, track: trec == 'trec5'),
+    (input_url_trec4, lambda trec, track: trec == 'trec4'),
+    (input_url_trec3_trec2, lambda trec, track: trec in ['trec3', 'trec2']),
+]
+
+
+
+# TREC-32 summaries
+def summary_trec32(item, summary):
+    if item['track'] == 'atomic':
+        summary = f'summary.{item["runid"]}.eval'
+    if item['track'] == 'deep':
+        summary = f'treceval.{item["runid"]}.eval'
+    if item['track'] == 'ikat':
+        summary = {
+            'Summary (doc ranking)': f'summary.{item["runid"]}.doc-eval',
+            'Summary (PTKB ranking)': f'summary.{item["runid"]}.ptkb-eval'
+        }
+    if item['track'] == 'neuclir':
+        summary = f'summary.{item["runid"]}.eval'
+    if item['track'] == 'product':
+        summary = f'{item["runid"]}.eval'
+    if item['track'] == 'tot':
+        summary = f'treceval.{item["runid"]}.eval'
+    if item['track'] == 'trials':
+        summary = {
+            'Summary (trec_eval)': f'{item["runid"]}.treceval',
+            'Summary (nDCG)': f'{item["runid"]}.ndcg-eval'
+        }
+    return summary
+
+
+# TREC-31 summary
+def summary_trec31(item, summary):
+    if item['track'] == 'deep':
+        if item['task'] == 'docs':
+            summary = '.'.join(['summary', item['runid']])
+        if item['task'] == 'passages':
             summary = {
-                'Summary (QD)': '.'.join(['summary', 'QD', item['runid']]),
-                'Summary (QE)': '.'.join(['summary', 'QE', item['runid']]),
-                'Summary (QR)': '.'.join(['summary', 'QR', item['runid']]),
-                'Summary (QS)': '.'.join(['summary', 'QS', item['runid']])
+                'Summary (trec_eval)': '.'.join(['summary', item['runid'], 'trec_eval']),
+                'Summary (ndcg)': '.'.join(['summary', item['runid'], 'ndcg'])
             }
+    if item['track'] == 'neuclir':
+        summary = '.'.join(['summary', item['runid'], 'trec_eval'])
+    if item['track'] == 'cast':              
+        summary = {
+            'Summary (strict)': '.'.join(['summary', item['runid'], 'strict']),
+            'Summary (lenient)': '.'.join(['summary', item['runid'], 'lenient'])
+        }
+    if item['track'] == 'fair':                         
+        if item['task'] == 'coordinators': 
+            summary = '.'.join(['summary', item['runid'], 'coord', 'tsv'])
+        if item['task'] == 'editors': 
+            summary = '.'.join(['summary', item['runid'], 'editors', 'tsv'])
+    if item['track'] == 'crisis':                       
+        summary = {
+            'Summary (auto)': '.'.join(['summary', item['runid'], 'auto', 'csv']),
+            'Summary (manual)': '.'.join(['summary', item['runid'], 'manual', 'tar', 'gz'])
+        }
+    return summary
 
-    # TREC-29 summary
-    if item['trec'] == 'trec29':
-        if item['track'] == 'deep':
-            if item['task'] == 'passages':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                    'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
-                }
-            else:
-                summary = '.'.join(['summary', 'treceval', item['runid']])
-        if item['track'] == 'misinfo':
-            summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'cast':   
-            summary = '.'.join(['summary', 'treceval', item['runid']])
-        if item['track'] == 'pm':   
+
+# TREC-30 summary
+def summary_trec30(item, summary):
+    if item['track'] == 'incident':
+        summary = '.'.join(['summary', item['runid'], 'html'])
+    if item['track'] == 'deep':
+        if item['task'] == 'passages':
             summary = {
                 'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']]),
-                'Summary (evidence-eval)': '.'.join(['summary', 'evidence-eval', item['runid']])
+                'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
             }
-        if item['track'] == 'podcast': 
-            if item['task'] == 'summarization':
-                summary = {
-                    'Summary (manual)': '.'.join(['summary', 'manual', item['runid']]),
-                    'Summary (rouge)': '.'.join(['summary', 'rouge', item['runid'], 'tgz'])
-                }
-            else:
-                summary = '.'.join(['summary', 'treceval', item['runid']]) # treceval, manual, rouge 
-    
-    # TREC-28 summary
-    if item['trec'] == 'trec28':
-        if item['track'] == 'deep':
-            if item['task'] == 'passages':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                    'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
-                }
-            else:
-                summary = '.'.join(['summary', 'treceval', item['runid']]) # treceval, passages-eval
-        if item['track'] == 'pm':
+        else:
+            summary = '.'.join(['summary', 'treceval', item['runid']])
+    if item['track'] == 'podcast':
+        summary = '.'.join(['summary', 'QD', item['runid']])
+        summary = {
+            'Summary (QD)': '.'.join(['summary', 'QD', item['runid']]),
+            'Summary (QE)': '.'.join(['summary', 'QE', item['runid']]),
+            'Summary (QR)': '.'.join(['summary', 'QR', item['runid']]),
+            'Summary (QS)': '.'.join(['summary', 'QS', item['runid']])
+        }
+    return summary
+
+
+# TREC-29 summary
+def summary_trec29(item, summary):
+    if item['track'] == 'deep':
+        if item['task'] == 'passages':
             summary = {
                 'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+                'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
             }
-        if item['track'] in ['cast', 'converse']:
+        else:
             summary = '.'.join(['summary', 'treceval', item['runid']])
-            item['track'] = 'cast'
-        if item['track'] == 'fair':
-            summary = {
-                'Summary (level)': '.'.join(['summary', 'level', item['runid']]),
-                'Summary (hindex)': '.'.join(['summary', 'hindex', item['runid']])
-            }
-        if item['track'] == 'incident':
-            summary = '.'.join(['summary', item['runid'], 'results', 'overall', 'txt']) # overall, perevent, pertopic
+    if item['track'] == 'misinfo':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] == 'cast':   
+        summary = '.'.join(['summary', 'treceval', item['runid']])
+    if item['track'] == 'pm':   
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']]),
+            'Summary (evidence-eval)': '.'.join(['summary', 'evidence-eval', item['runid']])
+        }
+    if item['track'] == 'podcast': 
+        if item['task'] == 'summarization':
             summary = {
-                'Summary (overall)': '.'.join(['summary', item['runid'], 'results', 'overall', 'txt']),
-                'Summary (perevent)': '.'.join(['summary', item['runid'], 'results', 'perevent', 'txt']),
-                'Summary (pertopic)': '.'.join(['summary', item['runid'], 'results', 'pertopic', 'txt'])
+                'Summary (manual)': '.'.join(['summary', 'manual', item['runid']]),
+                'Summary (rouge)': '.'.join(['summary', 'rouge', item['runid'], 'tgz'])
             }
+        else:
+            summary = '.'.join(['summary', 'treceval', item['runid']]) # treceval, manual, rouge 
+    return summary
 
-    # TREC-27 summary
-    if item['trec'] == 'trec27':
-        if item['track'] == 'pm':
+
+# TREC-28 summary
+def summary_trec28(item, summary):
+    if item['track'] == 'deep':
+        if item['task'] == 'passages':
             summary = {
                 'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+                'Summary (passages-eval)': '.'.join(['summary', 'passages-eval', item['runid']])
             }
-        if item['track'] == 'core':
-            summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'car':
-            summary = 'http://trec-car.cs.unh.edu/results/'
-    
-    if item['trec'] == 'trec26':
-        if item['track'] == 'core':
-            summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'pm':
-            if item['task'] == 'abstracts':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                    'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
-                }
-            if item['task'] == 'trials':
-                summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'rts':
-            if item['task'] == 'a':
-                summary = {
-                    'Summary (Batch)': ''.join(['summary-batchA-', item['runid'], '.txt']),
-                    'Summary (Mobile)': ''.join(['summary-mobileA-', item['runid'], '.txt'])
-                }
-            if item['task'] == 'b':
-                summary = ''.join(['summary-batchB-', item['runid'], '.txt'])
-        if item['track'] == 'task':
-            summary = ''.join(['summary-', item['runid'], '.txt'])
-    
-    # TREC-25 summary
-    if item['trec'] == 'trec25':
-        if item['track'] == 'clinical':
+        else:
+            summary = '.'.join(['summary', 'treceval', item['runid']]) # treceval, passages-eval
+    if item['track'] == 'pm':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] in ['cast', 'converse']:
+        summary = '.'.join(['summary', 'treceval', item['runid']])
+        item['track'] = 'cast'
+    if item['track'] == 'fair':
+        summary = {
+            'Summary (level)': '.'.join(['summary', 'level', item['runid']]),
+            'Summary (hindex)': '.'.join(['summary', 'hindex', item['runid']])
+        }
+    if item['track'] == 'incident':
+        summary = '.'.join(['summary', item['runid'], 'results', 'overall', 'txt']) # overall, perevent, pertopic
+        summary = {
+            'Summary (overall)': '.'.join(['summary', item['runid'], 'results', 'overall', 'txt']),
+            'Summary (perevent)': '.'.join(['summary', item['runid'], 'results', 'perevent', 'txt']),
+            'Summary (pertopic)': '.'.join(['summary', item['runid'], 'results', 'pertopic', 'txt'])
+        }
+    return summary
+
+
+# TREC-27 summary
+def summary_trec27(item, summary):
+    if item['track'] == 'pm':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] == 'core':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] == 'car':
+        summary = 'http://trec-car.cs.unh.edu/results/'
+    return summary
+
+
+def summary_trec26(item, summary):
+    if item['track'] == 'core':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] == 'pm':
+        if item['task'] == 'abstracts':
             summary = {
                 'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
                 'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
             }
-        if item['track'] == 'context':
+        if item['task'] == 'trials':
             summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] in ['rts', 'realtime']:
-            if item['task'] == 'a':
-                summary = {
-                    'Summary (Batch)': ''.join(['summary-batchA-', item['runid'], '.txt']),
-                    'Summary (Mobile)': ''.join(['summary-mobileA-', item['runid'], '.txt'])
-                }
-            if item['task'] == 'b':
-                summary = ''.join(['summary-batchB-', item['runid'], '.txt'])
-        if item['track'] == 'task':
-            summary = ''.join(['summary-', item['runid'], '.txt'])
-
-    # TREC-24 summary
-    if item['trec'] == 'trec24':
-        if item['track'] == 'clinical':
+    if item['track'] == 'rts':
+        if item['task'] == 'a':
             summary = {
-                'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+                'Summary (Batch)': ''.join(['summary-batchA-', item['runid'], '.txt']),
+                'Summary (Mobile)': ''.join(['summary-mobileA-', item['runid'], '.txt'])
             }
-        if item['track'] == 'context':
-            summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'microblog':
-            summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
-        if item['track'] == 'tempsumm':
-            summary = '.'.join([item['pid'], 'all', 'tsv'])
-        if item['track'] == 'task':
-            summary = ''.join(['summary-', item['runid'], '.txt'])
-        if item['track'] == 'domain':
-            summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
-
-    # TREC-23 summary
-    if item['trec'] == 'trec23':
-        if item['track'] == 'clinical':
+        if item['task'] == 'b':
+            summary = ''.join(['summary-batchB-', item['runid'], '.txt'])
+    if item['track'] == 'task':
+        summary = ''.join(['summary-', item['runid'], '.txt'])
+    return summary
+
+
+# TREC-25 summary
+def summary_trec25(item, summary):
+    if item['track'] == 'clinical':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] == 'context':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] in ['rts', 'realtime']:
+        if item['task'] == 'a':
             summary = {
-                'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+                'Summary (Batch)': ''.join(['summary-batchA-', item['runid'], '.txt']),
+                'Summary (Mobile)': ''.join(['summary-mobileA-', item['runid'], '.txt'])
             }
-        if item['track'] == 'microblog':
-            summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
-        if item['track'] == 'web':
-            if item['task'] == 'adhoc':
-                summary = {
-                    'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
-                    'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']])
-                } 
-            if item['task'] == 'risk':
-                summary = {
-                    'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
-                    'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']]),
-                    'Summary (risk-rm-a0-gd)': '.'.join(['summary', 'risk-rm-a0-gd', item['runid']]),
-                    'Summary (risk-rm-a0-nd)': '.'.join(['summary', 'risk-rm-a0-nd', item['runid']]),
-                    'Summary (risk-rm-a5-gd)': '.'.join(['summary', 'risk-rm-a5-gd', item['runid']]),
-                    'Summary (risk-rm-a5-nd)': '.'.join(['summary', 'risk-rm-a5-nd', item['runid']]),
-                    'Summary (risk-terrier-a0-gd)': '.'.join(['summary', 'risk-terrier-a0-gd', item['runid']]),
-                    'Summary (risk-terrier-a0-nd)': '.'.join(['summary', 'risk-terrier-a0-nd', item['runid']]),
-                    'Summary (risk-terrier-a5-gd)': '.'.join(['summary', 'risk-terrier-a5-gd', item['runid']]),
-                    'Summary (risk-terrier-a5-nd)': '.'.join(['summary', 'risk-terrier-a5-nd', item['runid']])
-                } 
-        if item['track'] == 'tempsumm':
-            summary = '.'.join([item['runid'], 'tsv'])     
-        if item['track'] == 'session':
-            _runid ='.'.join(item['runid'].split('.')[:-1])
-            summary = ''.join(['summary-', _runid, '.txt'])                   
-
-    # TREC-22 summary
-    if item['trec'] == 'trec22':
-        if item['track'] == 'web':
+        if item['task'] == 'b':
+            summary = ''.join(['summary-batchB-', item['runid'], '.txt'])
+    if item['track'] == 'task':
+        summary = ''.join(['summary-', item['runid'], '.txt'])
+    return summary
+
+
+# TREC-24 summary
+def summary_trec24(item, summary):
+    if item['track'] == 'clinical':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] == 'context':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] == 'microblog':
+        summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
+    if item['track'] == 'tempsumm':
+        summary = '.'.join([item['pid'], 'all', 'tsv'])
+    if item['track'] == 'task':
+        summary = ''.join(['summary-', item['runid'], '.txt'])
+    if item['track'] == 'domain':
+        summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
+    return summary
+
+
+# TREC-23 summary
+def summary_trec23(item, summary):
+    if item['track'] == 'clinical':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] == 'microblog':
+        summary = ''.join(['summary-', item['task'], '-', item['runid'], '.txt'])
+    if item['track'] == 'web':
+        if item['task'] == 'adhoc':
             summary = {
-                    'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
-                    'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']]),
-                    'Summary (risk-risk-a0-gd)': '.'.join(['summary', 'risk-a0-gd', item['runid']]),
-                    'Summary (risk-risk-a0-nd)': '.'.join(['summary', 'risk-a0-nd', item['runid']]),
-                    'Summary (risk-risk-a1-gd)': '.'.join(['summary', 'risk-a1-gd', item['runid']]),
-                    'Summary (risk-risk-a1-nd)': '.'.join(['summary', 'risk-a1-nd', item['runid']]),
-                    'Summary (risk-risk-a5-nd)': '.'.join(['summary', 'risk-a5-nd', item['runid']]),
-                    'Summary (risk-risk-a5-nd)': '.'.join(['summary', 'risk-a5-nd', item['runid']]),
-                    'Summary (risk-risk-a10-gd)': '.'.join(['summary', 'risk-a10-gd', item['runid']]),
-                    'Summary (risk-risk-a10-nd)': '.'.join(['summary', 'risk-a10-nd', item['runid']]),
-                } 
-        if item['track'] == 'federated':
-            summary = '.'.join([item['runid'], 'pdf'])
-        if item['track'] == 'session':
-            summary = ''.join(['summary-', '.'.join(item['runid'].split('.')[:-1]), '.txt']) 
-
-    # TREC-21 summary
-    if item['trec'] == 'trec21':
-        if item['track'] == 'microblog':
-            if item['task'] == 'adhoc':
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
-                    'Summary (roc)': '.'.join(['summary', 'roc', item['runid']])
-                }  
-            if item['task'] == 'filtering':
-                summary = '.'.join(['summary', 'filtereval', item['runid']]) 
-        if item['track'] == 'web':
+                'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
+                'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']])
+            } 
+        if item['task'] == 'risk':
             summary = {
-                'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                'Summary (ndeval)': '.'.join(['summary', 'ndeval', item['runid']]),
-                'Summary (gdeval)': '.'.join(['summary', 'gdeval', item['runid']])
+                'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
+                'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']]),
+                'Summary (risk-rm-a0-gd)': '.'.join(['summary', 'risk-rm-a0-gd', item['runid']]),
+                'Summary (risk-rm-a0-nd)': '.'.join(['summary', 'risk-rm-a0-nd', item['runid']]),
+                'Summary (risk-rm-a5-gd)': '.'.join(['summary', 'risk-rm-a5-gd', item['runid']]),
+                'Summary (risk-rm-a5-nd)': '.'.join(['summary', 'risk-rm-a5-nd', item['runid']]),
+                'Summary (risk-terrier-a0-gd)': '.'.join(['summary', 'risk-terrier-a0-gd', item['runid']]),
+                'Summary (risk-terrier-a0-nd)': '.'.join(['summary', 'risk-terrier-a0-nd', item['runid']]),
+                'Summary (risk-terrier-a5-gd)': '.'.join(['summary', 'risk-terrier-a5-gd', item['runid']]),
+                'Summary (risk-terrier-a5-nd)': '.'.join(['summary', 'risk-terrier-a5-nd', item['runid']])
+            } 
+    if item['track'] == 'tempsumm':
+        summary = '.'.join([item['runid'], 'tsv'])     
+    if item['track'] == 'session':
+        _runid ='.'.join(item['runid'].split('.')[:-1])
+        summary = ''.join(['summary-', _runid, '.txt'])                   
+    return summary
+
+
+# TREC-22 summary
+def summary_trec22(item, summary):
+    if item['track'] == 'web':
+        summary = {
+                'Summary (std-gd)': '.'.join(['summary', 'std-gd', item['runid']]),
+                'Summary (std-nd)': '.'.join(['summary', 'std-nd', item['runid']]),
+                'Summary (risk-risk-a0-gd)': '.'.join(['summary', 'risk-a0-gd', item['runid']]),
+                'Summary (risk-risk-a0-nd)': '.'.join(['summary', 'risk-a0-nd', item['runid']]),
+                'Summary (risk-risk-a1-gd)': '.'.join(['summary', 'risk-a1-gd', item['runid']]),
+                'Summary (risk-risk-a1-nd)': '.'.join(['summary', 'risk-a1-nd', item['runid']]),
+                'Summary (risk-risk-a5-nd)': '.'.join(['summary', 'risk-a5-nd', item['runid']]),
+                'Summary (risk-risk-a5-nd)': '.'.join(['summary', 'risk-a5-nd', item['runid']]),
+                'Summary (risk-risk-a10-gd)': '.'.join(['summary', 'risk-a10-gd', item['runid']]),
+                'Summary (risk-risk-a10-nd)': '.'.join(['summary', 'risk-a10-nd', item['runid']]),
+            } 
+    if item['track'] == 'federated':
+        summary = '.'.join([item['runid'], 'pdf'])
+    if item['track'] == 'session':
+        summary = ''.join(['summary-', '.'.join(item['runid'].split('.')[:-1]), '.txt']) 
+    return summary
+
+
+# TREC-21 summary
+def summary_trec21(item, summary):
+    if item['track'] == 'microblog':
+        if item['task'] == 'adhoc':
+            summary = {
+                'Summary (trec_eval)': '.'.join(['summary', 'treceval', item['runid']]),
+                'Summary (roc)': '.'.join(['summary', 'roc', item['runid']])
             }  
-        if item['track'] == 'medical':
+        if item['task'] == 'filtering':
+            summary = '.'.join(['summary', 'filtereval', item['runid']]) 
+    if item['track'] == 'web':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (ndeval)': '.'.join(['summary', 'ndeval', item['runid']]),
+            'Summary (gdeval)': '.'.join(['summary', 'gdeval', item['runid']])
+        }  
+    if item['track'] == 'medical':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+        }
+    if item['track'] == 'session':
+        summary = '.'.join(['summary', item['runid'].split('.')[0]]) 
+    return summary
+
+
+# TREC-20 summary
+def summary_trec20(item, summary):
+    if item['track'] == 'microblog':
+        summary = {
+            'Summary (highrel)': '.'.join(['summary', 'highrel', item['runid']]),
+            'Summary (allrel)': '.'.join(['summary', 'allrel', item['runid']])
+        } 
+    if item['track'] == 'web':
+        summary = {
+            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+            'Summary (ndeval)': '.'.join(['summary', 'ndeval', item['runid']]),
+            'Summary (gdeval)': '.'.join(['summary', 'gdeval', item['runid']])
+        }  
+    if item['track'] == 'medical':
+        summary = '.'.join(['summary', 'trec_eval', item['runid']])
+    if item['track'] == 'session':
+        _runid = '.'.join(item['runid'].split('.')[:-1])
+        summary = {
+            'Summary (allsubtopics)': '.'.join(['summary', 'allsubtopics', _runid]),
+            'Summary (lastquerysubtopics)': '.'.join(['summary', 'lastquerysubtopics', _runid])
+        }
+    return summary
+
+
+# TREC-19 summary
+def summary_trec19(item, summary):
+    if item['track'] == 'blog':
+        if item['task'] == 'feed':
             summary = {
-                'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                'Summary (sample-eval)': '.'.join(['summary', 'sample-eval', item['runid']])
+                'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
+                'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
             }
-        if item['track'] == 'session':
-            summary = '.'.join(['summary', item['runid'].split('.')[0]]) 
-
-    # TREC-20 summary
-    if item['trec'] == 'trec20':
-        if item['track'] == 'microblog':
+        if item['task'] == 'blfeed':
             summary = {
-                'Summary (highrel)': '.'.join(['summary', 'highrel', item['runid']]),
-                'Summary (allrel)': '.'.join(['summary', 'allrel', item['runid']])
-            } 
-        if item['track'] == 'web':
+                'Summary (baseline)': '.'.join(['summary', 'baseline', item['runid'], 'gz']),
+                'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
+                'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
+            }
+        if item['task'] == 'topstories':
+            summary = {
+                'Summary (business)': '.'.join(['summary', 'business', item['runid'], 'gz']),
+                'Summary (scitech)': '.'.join(['summary', 'fiscitechrst', item['runid'], 'gz']),
+                'Summary (sport)': '.'.join(['summary', 'sport', item['runid'], 'gz']),
+                'Summary (us)': '.'.join(['summary', 'us', item['runid'], 'gz']),
+                'Summary (world)': '.'.join(['summary', 'world', item['runid'], 'gz'])
+            }
+        if item['task'] == 'newsblogpost':
+            summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'web':
+        if item['task'] in ['adhoc', 'diversity']:
             summary = {
                 'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
                 'Summary (ndeval)': '.'.join(['summary', 'ndeval', item['runid']]),
                 'Summary (gdeval)': '.'.join(['summary', 'gdeval', item['runid']])
             }  
-        if item['track'] == 'medical':
-            summary = '.'.join(['summary', 'trec_eval', item['runid']])
-        if item['track'] == 'session':
-            _runid = '.'.join(item['runid'].split('.')[:-1])
-            summary = {
-                'Summary (allsubtopics)': '.'.join(['summary', 'allsubtopics', _runid]),
-                'Summary (lastquerysubtopics)': '.'.join(['summary', 'lastquerysubtopics', _runid])
-            }
+        if item['task'] == 'spam':
+            summary = '.'.join(['summary', 'spam', item['runid'], 'gz'])
+    if item['track'] == 'session': 
+        summary = '.'.join(['summary', item['pid'], 'tgz']) 
+    if item['track'] == 'entity':
+        summary = '.'.join(['summary', item['runid'], 'gz']) 
+    return summary
 
-    # TREC-19 summary
-    if item['trec'] == 'trec19':
-        if item['track'] == 'blog':
-            if item['task'] == 'feed':
-                summary = {
-                    'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
-                    'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
-                }
-            if item['task'] == 'blfeed':
-                summary = {
-                    'Summary (baseline)': '.'.join(['summary', 'baseline', item['runid'], 'gz']),
-                    'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
-                    'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
-                }
-            if item['task'] == 'topstories':
-                summary = {
-                    'Summary (business)': '.'.join(['summary', 'business', item['runid'], 'gz']),
-                    'Summary (scitech)': '.'.join(['summary', 'fiscitechrst', item['runid'], 'gz']),
-                    'Summary (sport)': '.'.join(['summary', 'sport', item['runid'], 'gz']),
-                    'Summary (us)': '.'.join(['summary', 'us', item['runid'], 'gz']),
-                    'Summary (world)': '.'.join(['summary', 'world', item['runid'], 'gz'])
-                }
-            if item['task'] == 'newsblogpost':
-                summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'web':
-            if item['task'] in ['adhoc', 'diversity']:
-                summary = {
-                    'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-                    'Summary (ndeval)': '.'.join(['summary', 'ndeval', item['runid']]),
-                    'Summary (gdeval)': '.'.join(['summary', 'gdeval', item['runid']])
-                }  
-            if item['task'] == 'spam':
-                summary = '.'.join(['summary', 'spam', item['runid'], 'gz'])
-        if item['track'] == 'session': 
-            summary = '.'.join(['summary', item['pid'], 'tgz']) 
-        if item['track'] == 'entity':
-            summary = '.'.join(['summary', item['runid'], 'gz']) 
-
-    # TREC-18 summary
-    if item['trec'] == 'trec18':
-        if item['track'] == 'relfdbk':    
-            summary = '.'.join(['summary', 'eval', item['runid'], 'gz'])
-        if item['track'] == 'chemical':   
-            if item['task'] == 'techsurv':
-                summary = '.'.join(['summary', 'eval', item['runid'], 'gz'])
-            if item['task'] == 'priorart':
-                summary = {
-                    'Summary (full)': '.'.join(['summary', 'full', item['runid'], 'gz']),
-                    'Summary (small)': '.'.join(['summary', 'small', item['runid'], 'gz'])
-                }  
-            if item['task'] == 'priorart_sm':
-                summary = '.'.join(['summary', 'small', item['runid'], 'gz'])
-        if item['track'] == 'legal':  
-            if item['task'] == 'batch':
-                summary = {
-                    'Summary (eval)': '.'.join(['summary', 'eval', item['runid'], 'gz']),
-                    'Summary (evalH)': '.'.join(['summary', 'evalH', item['runid'], 'gz'])
-                }  
-        if item['track'] == 'web':
-            if item['task'] == 'adhoc':
-                summary = '.'.join(['summary', 'adhoc', item['pid'], 'tgz'])
-            if item['task'] == 'diversity':    
-                summary = '.'.join(['summary', 'diversity', item['runid'], 'gz'])
-        if item['track'] == 'million-query':
-            summary = '.'.join(['summary', item['pid'], 'tgz'])
-        if item['track'] == 'blog':
-            if item['task'] == 'topstories':
-                summary = {
-                    'Summary (headline)': '.'.join(['summary', 'headline', item['runid'], 'gz']),
-                    'Summary (blogpost)': '.'.join(['summary', 'blogpost', item['runid'], 'gz'])
-                }  
-            if item['task'] == 'feed':
-                summary = {
-                    'Summary (none)': '.'.join(['summary', 'none', item['runid'], 'gz']),
-                    'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
-                    'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
-                }  
-        if item['track'] == 'entity':
+
+# TREC-18 summary
+def summary_trec18(item, summary):
+    if item['track'] == 'relfdbk':    
+        summary = '.'.join(['summary', 'eval', item['runid'], 'gz'])
+    if item['track'] == 'chemical':   
+        if item['task'] == 'techsurv':
             summary = '.'.join(['summary', 'eval', item['runid'], 'gz'])
+        if item['task'] == 'priorart':
+            summary = {
+                'Summary (full)': '.'.join(['summary', 'full', item['runid'], 'gz']),
+                'Summary (small)': '.'.join(['summary', 'small', item['runid'], 'gz'])
+            }  
+        if item['task'] == 'priorart_sm':
+            summary = '.'.join(['summary', 'small', item['runid'], 'gz'])
+    if item['track'] == 'legal':  
+        if item['task'] == 'batch':
+            summary = {
+                'Summary (eval)': '.'.join(['summary', 'eval', item['runid'], 'gz']),
+                'Summary (evalH)': '.'.join(['summary', 'evalH', item['runid'], 'gz'])
+            }  
+    if item['track'] == 'web':
+        if item['task'] == 'adhoc':
+            summary = '.'.join(['summary', 'adhoc', item['pid'], 'tgz'])
+        if item['task'] == 'diversity':    
+            summary = '.'.join(['summary', 'diversity', item['runid'], 'gz'])
+    if item['track'] == 'million-query':
+        summary = '.'.join(['summary', item['pid'], 'tgz'])
+    if item['track'] == 'blog':
+        if item['task'] == 'topstories':
+            summary = {
+                'Summary (headline)': '.'.join(['summary', 'headline', item['runid'], 'gz']),
+                'Summary (blogpost)': '.'.join(['summary', 'blogpost', item['runid'], 'gz'])
+            }  
+        if item['task'] == 'feed':
+            summary = {
+                'Summary (none)': '.'.join(['summary', 'none', item['runid'], 'gz']),
+                'Summary (first)': '.'.join(['summary', 'first', item['runid'], 'gz']),
+                'Summary (second)': '.'.join(['summary', 'second', item['runid'], 'gz'])
+            }  
+    if item['track'] == 'entity':
+        summary = '.'.join(['summary', 'eval', item['runid'], 'gz'])
+    return summary
 
-    # TREC-17 summary
-    if item['trec'] == 'trec17':
-        if item['track'] == 'blog':
-            if item['task'] in ['baseline', 'opinion']:
-                summary = {
-                    'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz']),
-                    'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz'])
-                }  
-            if item['task'] == 'polarity':
-                summary = {
-                    'Summary (negative)': '.'.join(['summary', 'negative', item['runid'], 'gz']),
-                    'Summary (positive)': '.'.join(['summary', 'positive', item['runid'], 'gz'])
-                }  
-        if item['track'] == 'feed':
-            summary = '.'.join(['summary', 'feed', item['runid'], 'gz'])
-        if item['track'] == 'million-query':
+
+# TREC-17 summary
+def summary_trec17(item, summary):
+    if item['track'] == 'blog':
+        if item['task'] in ['baseline', 'opinion']:
             summary = {
-                'Summary (mtc)': '.'.join(['summary', 'mtc', item['runid'], 'gz']),
-                'Summary (statAP)': '.'.join(['summary', 'statAP', item['runid'], 'gz'])
+                'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz']),
+                'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz'])
             }  
-        if item['track'] == 'enterprise':
-            if item['task'] == 'document':
-                summary = '.'.join(['summary', 'document', item['runid'], 'gz'])
-            if item['task'] == 'expert':
-                summary = '.'.join(['summary', 'expert', item['runid'], 'gz'])
-        if item['track'] == 'legal':
-            if item['task'] == 'adhoc':
-                summary = {
-                    'Summary (adhoc)': '.'.join(['summary', 'adhoc', item['runid'], 'gz']),
-                    'Summary (adhocH)': '.'.join(['summary', 'adhocH', item['runid'], 'gz'])
-                } 
-            if item['task'] == 'feedback':
-                summary = {
-                    'Summary (resid)': '.'.join(['summary', 'resid', item['runid'], 'gz']),
-                    'Summary (residH)': '.'.join(['summary', 'residH', item['runid'], 'gz'])
-                } 
-        if item['track'] == 'relfdbk':
+        if item['task'] == 'polarity':
             summary = {
-                'Summary (mtc)': '.'.join(['summary', 'mtc', item['runid'], 'gz']),
-                'Summary (statAP)': '.'.join(['summary', 'statAP', item['runid'], 'gz']),
-                'Summary (top10)': '.'.join(['summary', 'top10', item['runid'], 'gz'])
+                'Summary (negative)': '.'.join(['summary', 'negative', item['runid'], 'gz']),
+                'Summary (positive)': '.'.join(['summary', 'positive', item['runid'], 'gz'])
             }  
+    if item['track'] == 'feed':
+        summary = '.'.join(['summary', 'feed', item['runid'], 'gz'])
+    if item['track'] == 'million-query':
+        summary = {
+            'Summary (mtc)': '.'.join(['summary', 'mtc', item['runid'], 'gz']),
+            'Summary (statAP)': '.'.join(['summary', 'statAP', item['runid'], 'gz'])
+        }  
+    if item['track'] == 'enterprise':
+        if item['task'] == 'document':
+            summary = '.'.join(['summary', 'document', item['runid'], 'gz'])
+        if item['task'] == 'expert':
+            summary = '.'.join(['summary', 'expert', item['runid'], 'gz'])
+    if item['track'] == 'legal':
+        if item['task'] == 'adhoc':
+            summary = {
+                'Summary (adhoc)': '.'.join(['summary', 'adhoc', item['runid'], 'gz']),
+                'Summary (adhocH)': '.'.join(['summary', 'adhocH', item['runid'], 'gz'])
+            } 
+        if item['task'] == 'feedback':
+            summary = {
+                'Summary (resid)': '.'.join(['summary', 'resid', item['runid'], 'gz']),
+                'Summary (residH)': '.'.join(['summary', 'residH', item['runid'], 'gz'])
+            } 
+    if item['track'] == 'relfdbk':
+        summary = {
+            'Summary (mtc)': '.'.join(['summary', 'mtc', item['runid'], 'gz']),
+            'Summary (statAP)': '.'.join(['summary', 'statAP', item['runid'], 'gz']),
+            'Summary (top10)': '.'.join(['summary', 'top10', item['runid'], 'gz'])
+        }  
+    return summary
 
-    # TREC-16 summary
-    if item['trec'] == 'trec16':
-        if item['track'] == 'blog':
-            if item['task'] in ['opinion', 'baseline']:
-                summary = {
-                    'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz']),
-                    'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz'])
-                } 
-            if item['task'] == 'feed':
-                summary = '.'.join(['summary', 'feed', item['runid'], 'gz'])
-            if item['task'] == 'polarity':
-                summary = '.'.join(['summary', 'polarity', item['runid'], 'gz'])
-        if item['track'] == 'enterprise':
-            if item['task'] == 'document':
-                summary = {
-                    'Summary (document)': '.'.join(['summary', 'document', item['runid'], 'gz']),
-                    'Summary (doc-promotion)': '.'.join(['summary', 'doc-promotion', item['runid'], 'gz']),
-                    'Summary (doc-residual)': '.'.join(['summary', 'doc-residual', item['runid'], 'gz'])
-                } 
-            if item['task'] == 'expert':
-                summary = '.'.join(['summary', 'experts', item['runid'], 'gz'])
-        if item['track'] == 'qa':
-            if item['task'] in ['main', 'ciqa_baseline', 'ciqa_final']:
-                summary = '.'.join(['summary', item['runid'], 'tar', 'gz'])
-        if item['track'] == 'spam':
-            summary = '.'.join([item['pid'], 'tgz'])
-        if item['track'] in ['genomics', 'legal']:
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'million-query':
+
+# TREC-16 summary
+def summary_trec16(item, summary):
+    if item['track'] == 'blog':
+        if item['task'] in ['opinion', 'baseline']:
+            summary = {
+                'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz']),
+                'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz'])
+            } 
+        if item['task'] == 'feed':
+            summary = '.'.join(['summary', 'feed', item['runid'], 'gz'])
+        if item['task'] == 'polarity':
+            summary = '.'.join(['summary', 'polarity', item['runid'], 'gz'])
+    if item['track'] == 'enterprise':
+        if item['task'] == 'document':
             summary = {
-                'Summary (tb-topics)': '.'.join(['summary', 'tb-topics', item['runid'], 'gz']),
-                'Summary (statMAP)': '.'.join(['summary', 'statMAP', item['runid'], 'gz'])
+                'Summary (document)': '.'.join(['summary', 'document', item['runid'], 'gz']),
+                'Summary (doc-promotion)': '.'.join(['summary', 'doc-promotion', item['runid'], 'gz']),
+                'Summary (doc-residual)': '.'.join(['summary', 'doc-residual', item['runid'], 'gz'])
             } 
+        if item['task'] == 'expert':
+            summary = '.'.join(['summary', 'experts', item['runid'], 'gz'])
+    if item['track'] == 'qa':
+        if item['task'] in ['main', 'ciqa_baseline', 'ciqa_final']:
+            summary = '.'.join(['summary', item['runid'], 'tar', 'gz'])
+    if item['track'] == 'spam':
+        summary = '.'.join([item['pid'], 'tgz'])
+    if item['track'] in ['genomics', 'legal']:
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'million-query':
+        summary = {
+            'Summary (tb-topics)': '.'.join(['summary', 'tb-topics', item['runid'], 'gz']),
+            'Summary (statMAP)': '.'.join(['summary', 'statMAP', item['runid'], 'gz'])
+        } 
+    return summary
 
-    # TREC-15 summary
-    if item['trec'] == 'trec15':
-        if item['track'] == 'terabyte':
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'spam':
-            summary = '.'.join([item['pid'], 'tgz'])
-        if item['track'] == 'enterprise':
-            if item['task'] == 'discussion':
-                summary = {
-                    'Summary (rel_nonrel)': '.'.join(['summary', 'rel_nonrel', item['runid']]),
-                    'Summary (rel_procon)': '.'.join(['summary', 'rel_procon', item['runid']])
-                } 
-            if item['task'] == 'expert':
-                summary = {
-                    'Summary (experts)': '.'.join(['summary', 'experts', item['runid']]),
-                    'Summary (supported)': '.'.join(['summary', 'supported', item['runid']])
-                } 
-        if item['track'] == 'blog':
-            if item['task'] == 'opinion':
-                summary = {
-                    'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz']),
-                    'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz'])
-                } 
-        if item['track'] == 'qa':
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'legal':
+
+# TREC-15 summary
+def summary_trec15(item, summary):
+    if item['track'] == 'terabyte':
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'spam':
+        summary = '.'.join([item['pid'], 'tgz'])
+    if item['track'] == 'enterprise':
+        if item['task'] == 'discussion':
+            summary = {
+                'Summary (rel_nonrel)': '.'.join(['summary', 'rel_nonrel', item['runid']]),
+                'Summary (rel_procon)': '.'.join(['summary', 'rel_procon', item['runid']])
+            } 
+        if item['task'] == 'expert':
             summary = {
-                'Summary (trec-eval)': '.'.join(['summary', 'trec-eval', item['runid']]),
-                'Summary (prec-at-B)': '.'.join(['summary', 'prec-at-B', item['runid']])
+                'Summary (experts)': '.'.join(['summary', 'experts', item['runid']]),
+                'Summary (supported)': '.'.join(['summary', 'supported', item['runid']])
             } 
+    if item['track'] == 'blog':
+        if item['task'] == 'opinion':
+            summary = {
+                'Summary (topicrel)': '.'.join(['summary', 'topicrel', item['runid'], 'gz']),
+                'Summary (opinion)': '.'.join(['summary', 'opinion', item['runid'], 'gz'])
+            } 
+    if item['track'] == 'qa':
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'legal':
+        summary = {
+            'Summary (trec-eval)': '.'.join(['summary', 'trec-eval', item['runid']]),
+            'Summary (prec-at-B)': '.'.join(['summary', 'prec-at-B', item['runid']])
+        } 
+    return summary
 
-    # TREC-14 summary
-    if item['trec'] == 'trec14':
-        if item['track'] in ['enterprise', 'genomics', 'HARD', 'terabyte']:
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-            if item['task'] == 'clarification':
-                summary = '.'.join([item['runid'], 'responses', 'tgz'])
-        if item['track'] == 'qa':
-            if item['task'] == 'main':
-                summary = '.'.join(['docrank', 'summary', item['runid'], 'gz'])
-            if item['task'] == 'relationship':
-                summary = '.'.join(['rel', 'summary', item['runid'], 'gz'])
-        if item['track'] == 'robust':
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'spam':
-            if item['pid'] == 'ibm.segal':
-                summary = 'summary.621SPAM.tgz'
-            if item['pid'] == 'cas-ict.wang':
-                summary = 'summary.ICTSPAM.tgz'
-            if item['pid'] == 'uparis-sud.aze':
-                summary = 'summary.azeSPAM.tgz'
-            if item['pid'] == 'merl.yerazunis':
-                summary = 'summary.crmSPAM.tgz'
-            if item['pid'] == 'dalhousieu.keselj':
-                summary = 'summary.dalSPAM.tgz'
-            if item['pid'] == 'jozef-stefan-inst.bratko':
-                summary = 'summary.ijsSPAM.tgz'
-            if item['pid'] == 'indianau.yang':
-                summary = 'summary.indSPAM.tgz'
-            if item['pid'] == 'beijingu.guo':
-                summary = 'summary.kidSPAM.tgz'
-            if item['pid'] == 'breyer.laird':
-                summary = 'summary.lbSPAM.tgz'
-            if item['pid'] == 'puc-rs.terra':
-                summary = 'summary.pucSPAM.tgz'
-            if item['pid'] == 'masseyu.meyer':
-                summary = 'summary.tamSPAM.tgz'
-            if item['pid'] == 'yorku.huang':
-                summary = 'summary.yorSPAM.tgz'
-
-    # TREC-13 summary
-    if item['trec'] == 'trec13':
-        if item['track'] in ['genomics', 'novelty', 'terabyte', 'qa', 'robust', 'web']:
-            summary = '.'.join(['summary', item['runid'], 'gz'])
 
-    # TREC-12 summary        
-    if item['trec'] == 'trec12':
-        if item['track'] in ['genomics', 'HARD', 'hard', 'novelty', 'qa', 'robust', 'web']:                       
-            summary = '.'.join(['summary', item['runid']])
-            summary = '/'.join(['summaries', summary])
+# TREC-14 summary
+def summary_trec14(item, summary):
+    if item['track'] in ['enterprise', 'genomics', 'HARD', 'terabyte']:
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+        if item['task'] == 'clarification':
+            summary = '.'.join([item['runid'], 'responses', 'tgz'])
+    if item['track'] == 'qa':
+        if item['task'] == 'main':
+            summary = '.'.join(['docrank', 'summary', item['runid'], 'gz'])
+        if item['task'] == 'relationship':
+            summary = '.'.join(['rel', 'summary', item['runid'], 'gz'])
+    if item['track'] == 'robust':
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'spam':
+        if item['pid'] == 'ibm.segal':
+            summary = 'summary.621SPAM.tgz'
+        if item['pid'] == 'cas-ict.wang':
+            summary = 'summary.ICTSPAM.tgz'
+        if item['pid'] == 'uparis-sud.aze':
+            summary = 'summary.azeSPAM.tgz'
+        if item['pid'] == 'merl.yerazunis':
+            summary = 'summary.crmSPAM.tgz'
+        if item['pid'] == 'dalhousieu.keselj':
+            summary = 'summary.dalSPAM.tgz'
+        if item['pid'] == 'jozef-stefan-inst.bratko':
+            summary = 'summary.ijsSPAM.tgz'
+        if item['pid'] == 'indianau.yang':
+            summary = 'summary.indSPAM.tgz'
+        if item['pid'] == 'beijingu.guo':
+            summary = 'summary.kidSPAM.tgz'
+        if item['pid'] == 'breyer.laird':
+            summary = 'summary.lbSPAM.tgz'
+        if item['pid'] == 'puc-rs.terra':
+            summary = 'summary.pucSPAM.tgz'
+        if item['pid'] == 'masseyu.meyer':
+            summary = 'summary.tamSPAM.tgz'
+        if item['pid'] == 'yorku.huang':
+            summary = 'summary.yorSPAM.tgz'
+    return summary
 
-    # TREC-11 summary
-    if item['trec'] == 'trec11':
-        if item['track'] in ['web', 'qa', 'novelty']:                       
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-            summary = '/'.join(['summaries', summary])
 
-    # TREC-10 summary
-    if item['trec'] == 'trec10':
-        if item['track'] in ['qa', 'xlingual', 'web']:
-            summary = '.'.join(['summary', item['runid'], 'gz'])
+# TREC-13 summary
+def summary_trec13(item, summary):
+    if item['track'] in ['genomics', 'novelty', 'terabyte', 'qa', 'robust', 'web']:
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    return summary
 
-    # TREC-9 summary
-    if item['trec'] == 'trec9':
-        if item['track'] in ['qa', 'xlingual', 'web', 'sdr']:
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-    
+
+# TREC-12 summary        
+def summary_trec12(item, summary):
+    if item['track'] in ['genomics', 'HARD', 'hard', 'novelty', 'qa', 'robust', 'web']:                       
+        summary = '.'.join(['summary', item['runid']])
+        summary = '/'.join(['summaries', summary])
     return summary
 
 
-def make_summary_url(item, summary):
-    # common summary_url 
-    if type(summary) == dict:
-        for k, v in summary.items():
-            summary[k] = '/'.join([results_url, item['trec'], item['track'], v])
-        summary_url = json.dumps(summary)
-    elif summary:
-        summary_url = '/'.join([results_url, item['trec'], item['track'], summary])
+# TREC-11 summary
+def summary_trec11(item, summary):
+    if item['track'] in ['web', 'qa', 'novelty']:                       
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+        summary = '/'.join(['summaries', summary])
+    return summary
 
-    # TREC-28 summary_url
-    if (item['trec'], item['track']) == ('trec28', 'decisions'):
-        summary = {
-            'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
-            'Summary (extended)': '.'.join(['summary', 'extended', item['runid']])
-        }
-        for summ_key, summ in summary.items():
-            summary[summ_key] = '/'.join([results_url, item['trec'], 'decision', summ])
-        summary_url = json.dumps(summary)
 
-    # TREC-20 summary_url
-    if (item['trec'], item['track'], item['task']) == ('trec20', 'entity', 'reflod'):
+# TREC-10 summary
+def summary_trec10(item, summary):
+    if item['track'] in ['qa', 'xlingual', 'web']:
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    return summary
+
+
+# TREC-9 summary
+def summary_trec9(item, summary):
+    if item['track'] in ['qa', 'xlingual', 'web', 'sdr']:
+        summary = '.'.join(['summary', item['runid'], 'gz'])
+    return summary
+
+
+# fix-ups of the summary file name(s) of a run, with the (trec, track) pairs they apply to
+summary_rules = [
+    (summary_trec32, lambda trec, track: trec == 'trec32' and track in ['atomic', 'deep', 'ikat', 'neuclir', 'product', 'tot', 'trials']),
+    (summary_trec31, lambda trec, track: trec == 'trec31' and track in ['deep', 'neuclir', 'cast', 'fair', 'crisis']),
+    (summary_trec30, lambda trec, track: trec == 'trec30' and track in ['incident', 'deep', 'podcast']),
+    (summary_trec29, lambda trec, track: trec == 'trec29' and track in ['deep', 'misinfo', 'cast', 'pm', 'podcast']),
+    (summary_trec28, lambda trec, track: trec == 'trec28' and track in ['deep', 'pm', 'cast', 'converse', 'fair', 'incident']),
+    (summary_trec27, lambda trec, track: trec == 'trec27' and track in ['pm', 'core', 'car']),
+    (summary_trec26, lambda trec, track: trec == 'trec26' and track in ['core', 'pm', 'rts', 'task']),
+    (summary_trec25, lambda trec, track: trec == 'trec25' and track in ['clinical', 'context', 'rts', 'realtime', 'task']),
+    (summary_trec24, lambda trec, track: trec == 'trec24' and track in ['clinical', 'context', 'microblog', 'tempsumm', 'task', 'domain']),
+    (summary_trec23, lambda trec, track: trec == 'trec23' and track in ['clinical', 'microblog', 'web', 'tempsumm', 'session']),
+    (summary_trec22, lambda trec, track: trec == 'trec22' and track in ['web', 'federated', 'session']),
+    (summary_trec21, lambda trec, track: trec == 'trec21' and track in ['microblog', 'web', 'medical', 'session']),
+    (summary_trec20, lambda trec, track: trec == 'trec20' and track in ['microblog', 'web', 'medical', 'session']),
+    (summary_trec19, lambda trec, track: trec == 'trec19' and track in ['blog', 'web', 'session', 'entity']),
+    (summary_trec18, lambda trec, track: trec == 'trec18' and track in ['relfdbk', 'chemical', 'legal', 'web', 'million-query', 'blog', 'entity']),
+    (summary_trec17, lambda trec, track: trec == 'trec17' and track in ['blog', 'feed', 'million-query', 'enterprise', 'legal', 'relfdbk']),
+    (summary_trec16, lambda trec, track: trec == 'trec16' and track in ['blog', 'enterprise', 'qa', 'spam', 'genomics', 'legal', 'million-query']),
+    (summary_trec15, lambda trec, track: trec == 'trec15' and track in ['terabyte', 'spam', 'enterprise', 'blog', 'qa', 'legal']),
+    (summary_trec14, lambda trec, track: trec == 'trec14' and track in ['enterprise', 'genomics', 'HARD', 'terabyte', 'qa', 'robust', 'spam']),
+    (summary_trec13, lambda trec, track: trec == 'trec13' and track in ['genomics', 'novelty', 'terabyte', 'qa', 'robust', 'web']),
+    (summary_trec12, lambda trec, track: trec == 'trec12' and track in ['genomics', 'HARD', 'hard', 'novelty', 'qa', 'robust', 'web']),
+    (summary_trec11, lambda trec, track: trec == 'trec11' and track in ['web', 'qa', 'novelty']),
+    (summary_trec10, lambda trec, track: trec == 'trec10' and track in ['qa', 'xlingual', 'web']),
+    (summary_trec9, lambda trec, track: trec == 'trec9' and track in ['qa', 'xlingual', 'web', 'sdr']),
+]
+
+
+
+# TREC-28 summary_url
+def summary_url_trec28_decisions(item, summary, summary_url):
+    summary = {
+        'Summary (trec_eval)': '.'.join(['summary', 'trec_eval', item['runid']]),
+        'Summary (extended)': '.'.join(['summary', 'extended', item['runid']])
+    }
+    for summ_key, summ in summary.items():
+        summary[summ_key] = '/'.join([results_url, item['trec'], 'decision', summ])
+    summary_url = json.dumps(summary)
+    return summary_url
+
+
+# TREC-20 summary_url
+def summary_url_trec20_entity(item, summary, summary_url):
+    if item['task'] == 'reflod':
         summary_url = None 
+    return summary_url
+
+
+# TREC-19 summary_url
+def summary_url_trec19_chemical(item, summary, summary_url):
+    summary_url = None # no public summary files on the website
+    return summary_url
 
-    # TREC-19 summary_url
-    if (item['trec'], item['track']) == ('trec19', 'chemical'):
-        summary_url = None # no public summary files on the website
 
-    # TREC-18 summary_url
-    if (item['trec'], item['track'], item['task']) == ('trec18', 'legal', 'interactive'):
+# TREC-18 summary_url
+def summary_url_trec18_legal(item, summary, summary_url):
+    if item['task'] == 'interactive':
         summary_url = None
-    
-    # TREC-17 summary_url
-    if (item['trec'], item['track'], item['task']) == ('trec17', 'legal', 'interactive'):
+    return summary_url
+
+
+# TREC-17 summary_url
+def summary_url_trec17_legal(item, summary, summary_url):
+    if item['task'] == 'interactive':
         summary_url = None
-    
-    # TREC-15 summary_url
-    if (item['trec'], item['track'], item['task']) == ('trec15', 'blog', 'open_task'):
+    return summary_url
+
+
+# TREC-15 summary_url
+def summary_url_trec15_blog(item, summary, summary_url):
+    if item['task'] == 'open_task':
         summary_url = None
+    return summary_url
 
-    # TREC-11 summary_url
-    if (item['trec'], item['track']) == ('trec11', 'xlingual'):
-        summary_url = None # no public summary files on the website
 
-    # TREC-10 summary_url
-    if (item['trec'], item['track']) == ('trec10', 'xlingual'):
-        summary_url = '/'.join([results_url, item['trec'], 'xling_summaries', summary])
+# TREC-11 summary_url
+def summary_url_trec11_xlingual(item, summary, summary_url):
+    summary_url = None # no public summary files on the website
+    return summary_url
 
-    # TREC-8 summary_url
-    if item['trec'] == 'trec8':
-        summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'adhoc':
-            _p = ''.join([item['trec'], '.results.summary'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] in ['xlingual', 'filtering', 'qa', 'sdr']:
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] == 'web':
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, 'smweb', summary])
-
-    # TREC-7 summary_url
-    if item['trec'] == 'trec7':
-        summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] == 'adhoc':
-            _p = ''.join([item['trec'], '.results.summary'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] in ['query', 'sdr']:
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] == 'hp':
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, 'high_prec', summary])
-        if item['track'] == 'xlingual':
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            task = item['task'].lower()
-            summary_url = '/'.join([results_url, item['trec'], _p, 'xlingual', task, summary])
-        if item['track'] == 'filtering':
-            _results_url = 'https://trec.nist.gov/results/trec7/trec7.results.summary/tracks/filtering/'
-            summary = '.'.join(['summary', item['runid'], 'gz'])
-            if item['runid'] in ['AntRout1', 'AntRout2']:
-                summary = 'summary.AntRout1.AntRout2.gz'
-            if item['runid'] in ['CLARITafF1a', 'CLARITafF1b']:
-                summary = 'summary.CLARITafF1a.CLARITafF1b.gz'
-            if item['runid'] in ['CLARITafF3a', 'CLARITafF3b']:
-                summary = 'summary.CLARITafF3a.CLARITafF3b.gz '
-            if item['runid'] in ['IAHKaf11', 'IAHKaf12']:
-                summary = 'summary.IAHKaf11.IAHKaf12.gz'
-            if item['runid'] in ['IAHKaf31', 'IAHKaf32']:
-                summary = 'summary.IAHKaf31.IAHKaf32.gz'
-            if item['runid'] in ['Mer7AGbF1', 'Mer7ARbF1']:
-                summary = 'summary.Mer7AGbF1.Mer7ARbF1.gz'
-            if item['runid'] in ['Mer7AGbF3', 'Mer7ARbF3']:
-                summary = 'summary.Mer7AGbF3.Mer7ARbF3.gz'
-            if item['runid'] in ['att98fr4', 'att98fr5']:
-                summary = 'summary.att98fr4.att98fr5.gz'
-            if item['runid'] in ['nttd7rt1', 'nttd7rt2']:
-                summary = 'summary.nttd7rt1.nttd7rt2.gz'
-            if item['runid'] in ['ok7ff12', 'ok7ff13']:
-                summary = 'summary.ok7ff12.ok7ff13.gz'
-            if item['runid'] in ['ok7ff32', 'ok7ff33']:
-                summary = 'summary.ok7ff32.ok7ff33.gz'
-            if item['runid'] in ['pirc8R1', 'pirc8R2']:
-                summary = 'summary.pirc8R1.pirc8R2.gz'
-            if item['runid'] == 'MerBF1':
-                summary = 'summary.Mer7BF1.gz'
-            if item['runid'] == 'MerBF3':
-                summary = 'summary.Mer7BF3.gz'
-            if item['runid'] == 'att98ft1':
-                summary = None
-            if item['runid'] == 'MerAGbR':
-                summary = None
-            if item['runid'] == 'INQ512':
-                summary = None
-            if item['runid'] == 'nttd7rk':
-                summary = None
-            if summary:
-                summary_url = ''.join([_results_url, summary])
-            else:
-                summary_url = None
 
-    # TREC-6 summary_url
-    if item['trec'] == 'trec6':
-        summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] in ['adhoc', 'routing']:
-            _p = ''.join([item['trec'], '.results.summary'])
-            category = ''.join(['Category', item['task']])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
-        if item['track'] in ['chinese', 'nlp']:
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] == 'clir':
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            _task = item['task'].split('-')[-1].lower()
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], _task, summary])
-        if item['track'] == 'hp':
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, 'high_prec', summary])
-
-    # TREC-5 summary_url
-    if item['trec'] == 'trec5':
-        summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] in ['adhoc', 'routing']:
-            _p = ''.join([item['trec'], '.results.summary'])
-            category = ''.join(['Category', item['task']])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
-        if item['track'] in ['chinese', 'Chinese', 'spanish', 'Spanish', 'nlp']:
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] == 'vlc':
-            summary = '.'.join(['summary', 'submit', 'Z'])
-            _p = ''.join([item['trec'], '.results.summary/tracks'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
-        if item['track'] == 'dbmerge':
-            summary_url = None # no public summaries on the website
-
-    # TREC-4 summary_url
-    if item['trec'] == 'trec4':
-        summary = '.'.join(['summary', item['runid'], 'Z'])
-        if item['track'] in ['adhoc', 'routing']:
-            _p = ''.join([item['trec'], '.results.summary'])
-            category = ''.join(['Category', item['task']])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
-        if item['track'] in ['confusion', 'dbmerge']:
-            _p = ''.join([item['trec'], '.results.summary'])
-            summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], summary])
-        if item['track'] == 'interactive':
-            summary = '.'.join(['summary', item['runid']])
-            _p = ''.join([item['trec'], '.results.summary'])
-            summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'TASK1', summary])
-        if item['track'] == 'spanish':
-            if item['task'] == 'topics_26_50':
-                _p = ''.join([item['trec'], '.results.summary'])
-                summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'topics_26_50', summary])
-            else:
-                summary_url = None
-    
-    # TREC-3 summary_url
-    # TREC-2 summary_url
-    if item['trec'] in ['trec3', 'trec2']:
+# TREC-10 summary_url
+def summary_url_trec10_xlingual(item, summary, summary_url):
+    summary_url = '/'.join([results_url, item['trec'], 'xling_summaries', summary])
+    return summary_url
+
+
+# TREC-8 summary_url
+def summary_url_trec8(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'adhoc':
+        _p = ''.join([item['trec'], '.results.summary'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] in ['xlingual', 'filtering', 'qa', 'sdr']:
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] == 'web':
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, 'smweb', summary])
+    return summary_url
+
+
+# TREC-7 summary_url
+def summary_url_trec7(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] == 'adhoc':
+        _p = ''.join([item['trec'], '.results.summary'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] in ['query', 'sdr']:
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] == 'hp':
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, 'high_prec', summary])
+    if item['track'] == 'xlingual':
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        task = item['task'].lower()
+        summary_url = '/'.join([results_url, item['trec'], _p, 'xlingual', task, summary])
+    if item['track'] == 'filtering':
+        _results_url = 'https://trec.nist.gov/results/trec7/trec7.results.summary/tracks/filtering/'
         summary = '.'.join(['summary', item['runid'], 'gz'])
-        if item['track'] in ['adhoc', 'routing']:
+        if item['runid'] in ['AntRout1', 'AntRout2']:
+            summary = 'summary.AntRout1.AntRout2.gz'
+        if item['runid'] in ['CLARITafF1a', 'CLARITafF1b']:
+            summary = 'summary.CLARITafF1a.CLARITafF1b.gz'
+        if item['runid'] in ['CLARITafF3a', 'CLARITafF3b']:
+            summary = 'summary.CLARITafF3a.CLARITafF3b.gz '
+        if item['runid'] in ['IAHKaf11', 'IAHKaf12']:
+            summary = 'summary.IAHKaf11.IAHKaf12.gz'
+        if item['runid'] in ['IAHKaf31', 'IAHKaf32']:
+            summary = 'summary.IAHKaf31.IAHKaf32.gz'
+        if item['runid'] in ['Mer7AGbF1', 'Mer7ARbF1']:
+            summary = 'summary.Mer7AGbF1.Mer7ARbF1.gz'
+        if item['runid'] in ['Mer7AGbF3', 'Mer7ARbF3']:
+            summary = 'summary.Mer7AGbF3.Mer7ARbF3.gz'
+        if item['runid'] in ['att98fr4', 'att98fr5']:
+            summary = 'summary.att98fr4.att98fr5.gz'
+        if item['runid'] in ['nttd7rt1', 'nttd7rt2']:
+            summary = 'summary.nttd7rt1.nttd7rt2.gz'
+        if item['runid'] in ['ok7ff12', 'ok7ff13']:
+            summary = 'summary.ok7ff12.ok7ff13.gz'
+        if item['runid'] in ['ok7ff32', 'ok7ff33']:
+            summary = 'summary.ok7ff32.ok7ff33.gz'
+        if item['runid'] in ['pirc8R1', 'pirc8R2']:
+            summary = 'summary.pirc8R1.pirc8R2.gz'
+        if item['runid'] == 'MerBF1':
+            summary = 'summary.Mer7BF1.gz'
+        if item['runid'] == 'MerBF3':
+            summary = 'summary.Mer7BF3.gz'
+        if item['runid'] == 'att98ft1':
+            summary = None
+        if item['runid'] == 'MerAGbR':
+            summary = None
+        if item['runid'] == 'INQ512':
+            summary = None
+        if item['runid'] == 'nttd7rk':
+            summary = None
+        if summary:
+            summary_url = ''.join([_results_url, summary])
+        else:
+            summary_url = None
+    return summary_url
+
+
+# TREC-6 summary_url
+def summary_url_trec6(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.summary'])
+        category = ''.join(['Category', item['task']])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
+    if item['track'] in ['chinese', 'nlp']:
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] == 'clir':
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        _task = item['task'].split('-')[-1].lower()
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], _task, summary])
+    if item['track'] == 'hp':
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, 'high_prec', summary])
+    return summary_url
+
+
+# TREC-5 summary_url
+def summary_url_trec5(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.summary'])
+        category = ''.join(['Category', item['task']])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
+    if item['track'] in ['chinese', 'Chinese', 'spanish', 'Spanish', 'nlp']:
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] == 'vlc':
+        summary = '.'.join(['summary', 'submit', 'Z'])
+        _p = ''.join([item['trec'], '.results.summary/tracks'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+    if item['track'] == 'dbmerge':
+        summary_url = None # no public summaries on the website
+    return summary_url
+
+
+# TREC-4 summary_url
+def summary_url_trec4(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'Z'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.summary'])
+        category = ''.join(['Category', item['task']])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], category, summary])
+    if item['track'] in ['confusion', 'dbmerge']:
+        _p = ''.join([item['trec'], '.results.summary'])
+        summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], summary])
+    if item['track'] == 'interactive':
+        summary = '.'.join(['summary', item['runid']])
+        _p = ''.join([item['trec'], '.results.summary'])
+        summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'TASK1', summary])
+    if item['track'] == 'spanish':
+        if item['task'] == 'topics_26_50':
             _p = ''.join([item['trec'], '.results.summary'])
-            summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
+            summary_url = '/'.join([results_url, item['trec'], _p, 'tracks', item['track'], 'topics_26_50', summary])
+        else:
+            summary_url = None
+    return summary_url
+
 
+# TREC-3 summary_url
+# TREC-2 summary_url
+def summary_url_trec3_trec2(item, summary, summary_url):
+    summary = '.'.join(['summary', item['runid'], 'gz'])
+    if item['track'] in ['adhoc', 'routing']:
+        _p = ''.join([item['trec'], '.results.summary'])
+        summary_url = '/'.join([results_url, item['trec'], _p, item['track'], summary])
     return summary_url
 
 
-def make_appendix(item):
-    # common appendix
-    appendix = '.'.join([item['runid'], 'pdf'])
+# fix-ups of the summary url(s) of a run, with the (trec, track) pairs they apply to
+summary_url_rules = [
+    (summary_url_trec28_decisions, lambda trec, track: (trec, track) == ('trec28', 'decisions')),
+    (summary_url_trec20_entity, lambda trec, track: (trec, track) == ('trec20', 'entity')),
+    (summary_url_trec19_chemical, lambda trec, track: (trec, track) == ('trec19', 'chemical')),
+    (summary_url_trec18_legal, lambda trec, track: (trec, track) == ('trec18', 'legal')),
+    (summary_url_trec17_legal, lambda trec, track: (trec, track) == ('trec17', 'legal')),
+    (summary_url_trec15_blog, lambda trec, track: (trec, track) == ('trec15', 'blog')),
+    (summary_url_trec11_xlingual, lambda trec, track: (trec, track) == ('trec11', 'xlingual')),
+    (summary_url_trec10_xlingual, lambda trec, track: (trec, track) == ('trec10', 'xlingual')),
+    (summary_url_trec8, lambda trec, track: trec == 'trec8'),
+    (summary_url_trec7, lambda trec, track: trec == 'trec7'),
+    (summary_url_trec6, lambda trec, track: trec == 'trec6'),
+    (summary_url_trec5, lambda trec, track: trec == 'trec5'),
+    (summary_url_trec4, lambda trec, track: trec == 'trec4'),
+    (summary_url_trec3_trec2, lambda trec, track: trec in ['trec3', 'trec2']),
+]
 
-    if item['trec'] == 'trec33':
-        appendix = f'{item["track"]}-appendix.html'
-
-    # TREC-30 appendix
-    if item['trec'] == 'trec30':
-        if item['track'] == 'incident':
-            appendix = '.'.join([item['runid'], 'html'])
-
-    # TREC-27 appendix
-    if item['trec'] == 'trec27':
-        if item['track'] == 'incident':
-            appendix = '.'.join([item['pid'], 'pdf'])
-
-    # TREC-26 appendix
-    if item['trec'] == 'trec26':
-        if item['track'] == 'car':
-            appendix = '.'.join(['car', 'pdf'])
-        if item['track'] == 'domain':
-            appendix = '.'.join(['domain', 'pdf'])
-        if item['track'] == 'open':
-            appendix = '.'.join(['trec-os-2017', 'pdf'])
-
-    # TREC-25 appendix
-    if item['trec'] == 'trec25':
-        if item['track'] == 'recall':
-            appendix = '.'.join(['recall', 'pdf'])
-        if item['track'] == 'domain':
-            appendix = '.'.join(['domain', 'pdf'])
-        if item['track'] == 'domain':
-            if item['pid'] == 'THKoeln-GESIS':
-                appendix = '.'.join(['open-ssoar', 'pdf'])
-            if item['pid'] == 'BJUT':
-                appendix = '.'.join(['open-citeseer', 'pdf'])
-
-    # TREC-24 appendix
-    if item['trec'] == 'trec24':
-        if item['track'] == 'recall':
-            appendix = '.'.join(['recall', 'pdf'])
-        if item['track'] == 'tempsumm':
-            appendix = ''.join(['tempsumm-', item['task'], 'pdf'])
-
-    # TREC-23 appendix
-    if item['trec'] == 'trec23':
-        if item['track'] =='session':
-            runid = ''.join(item['runid'].split('.')[:-1])
-            appendix = '.'.join([runid, 'pdf'])
 
-    # TREC-22 appendix
-    if item['trec'] == 'trec22':
-        if item['track'] == 'crowd':
-            appendix = '.'.join([item['runid'], 'result', 'pdf'])
-        if item['track'] == 'tempsumm':
-            appendix = 'TS13-{}-{}.pdf'.format(item['pid'], item['runid'])
-        if item['track'] == 'session':
-            runid = ''.join(item['runid'].split('.')[:-1])
-            appendix = '.'.join([runid, 'pdf'])
 
-    # TREC-21 appendix
-    if item['trec'] == 'trec21':
-        if item['track'] == 'crowd':
-            appendix = '.'.join([item['runid'], 'result', 'pdf'])
-        if item['track'] == 'session':
-            runid = ''.join(item['runid'].split('.')[:-1])
+def appendix_trec33(item, appendix):
+    appendix = f'{item["track"]}-appendix.html'
+    return appendix
+
+
+# TREC-30 appendix
+def appendix_trec30(item, appendix):
+    if item['track'] == 'incident':
+        appendix = '.'.join([item['runid'], 'html'])
+    return appendix
+
+
+# TREC-27 appendix
+def appendix_trec27(item, appendix):
+    if item['track'] == 'incident':
+        appendix = '.'.join([item['pid'], 'pdf'])
+    return appendix
+
+
+# TREC-26 appendix
+def appendix_trec26(item, appendix):
+    if item['track'] == 'car':
+        appendix = '.'.join(['car', 'pdf'])
+    if item['track'] == 'domain':
+        appendix = '.'.join(['domain', 'pdf'])
+    if item['track'] == 'open':
+        appendix = '.'.join(['trec-os-2017', 'pdf'])
+    return appendix
+
+
+# TREC-25 appendix
+def appendix_trec25(item, appendix):
+    if item['track'] == 'recall':
+        appendix = '.'.join(['recall', 'pdf'])
+    if item['track'] == 'domain':
+        appendix = '.'.join(['domain', 'pdf'])
+    if item['track'] == 'domain':
+        if item['pid'] == 'THKoeln-GESIS':
+            appendix = '.'.join(['open-ssoar', 'pdf'])
+        if item['pid'] == 'BJUT':
+            appendix = '.'.join(['open-citeseer', 'pdf'])
+    return appendix
+
+
+# TREC-24 appendix
+def appendix_trec24(item, appendix):
+    if item['track'] == 'recall':
+        appendix = '.'.join(['recall', 'pdf'])
+    if item['track'] == 'tempsumm':
+        appendix = ''.join(['tempsumm-', item['task'], 'pdf'])
+    return appendix
+
+
+# TREC-23 appendix
+def appendix_trec23(item, appendix):
+    if item['track'] =='session':
+        runid = ''.join(item['runid'].split('.')[:-1])
+        appendix = '.'.join([runid, 'pdf'])
+    return appendix
+
+
+# TREC-22 appendix
+def appendix_trec22(item, appendix):
+    if item['track'] == 'crowd':
+        appendix = '.'.join([item['runid'], 'result', 'pdf'])
+    if item['track'] == 'tempsumm':
+        appendix = 'TS13-{}-{}.pdf'.format(item['pid'], item['runid'])
+    if item['track'] == 'session':
+        runid = ''.join(item['runid'].split('.')[:-1])
+        appendix = '.'.join([runid, 'pdf'])
+    return appendix
+
+
+# TREC-21 appendix
+def appendix_trec21(item, appendix):
+    if item['track'] == 'crowd':
+        appendix = '.'.join([item['runid'], 'result', 'pdf'])
+    if item['track'] == 'session':
+        runid = ''.join(item['runid'].split('.')[:-1])
+        appendix = '.'.join([runid, 'pdf'])
+    return appendix
+
+
+# TREC-20 appendix
+def appendix_trec20(item, appendix):
+    if item['track'] == 'medical':
+        if item['type'] == 'automatic':
+            appendix = '.'.join(['aut', item['runid'], 'pdf'])
+        if item['type'] == 'manual':
+            appendix = '.'.join(['man', item['runid'], 'pdf'])
+    if item['track'] == 'session':
+            runid = '.'.join(item['runid'].split('.')[:-1])
             appendix = '.'.join([runid, 'pdf'])
+    if item['track'] == 'crowd':
+        if item['task'] == 'task1':
+            appendix = 'crowd-sourcing.assessment.pdf'
+        if item['task'] == 'task2':
+            appendix = 'crowd-sourcing.consensus.pdf'
+    return appendix
 
-    # TREC-20 appendix
-    if item['trec'] == 'trec20':
-        if item['track'] == 'medical':
-            if item['type'] == 'automatic':
-                appendix = '.'.join(['aut', item['runid'], 'pdf'])
-            if item['type'] == 'manual':
-                appendix = '.'.join(['man', item['runid'], 'pdf'])
-        if item['track'] == 'session':
-                runid = '.'.join(item['runid'].split('.')[:-1])
-                appendix = '.'.join([runid, 'pdf'])
-        if item['track'] == 'crowd':
-            if item['task'] == 'task1':
-                appendix = 'crowd-sourcing.assessment.pdf'
-            if item['task'] == 'task2':
-                appendix = 'crowd-sourcing.consensus.pdf'
-
-    # TREC-18 appendix
-    if item['trec'] == 'trec18':
-        if item['track'] == 'relfdbk':
-            appendix = '.'.join([item['pid'], 'pdf'])
-        if item['track'] == 'million-query':
-            appendix = '.'.join([item['runid'], 'main', 'pdf'])
-        if item['track'] == 'web':
-            if item['task'] == 'diversity':
-                appendix = '.'.join([item['runid'], 'main', 'pdf'])
 
+# TREC-18 appendix
+def appendix_trec18(item, appendix):
+    if item['track'] == 'relfdbk':
+        appendix = '.'.join([item['pid'], 'pdf'])
+    if item['track'] == 'million-query':
+        appendix = '.'.join([item['runid'], 'main', 'pdf'])
+    if item['track'] == 'web':
+        if item['task'] == 'diversity':
+            appendix = '.'.join([item['runid'], 'main', 'pdf'])
     return appendix
 
 
-def make_appendix_url(item, appendix):
-    # common appendix_url
-    appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}'.format(item['trec'], item['track'], appendix)
+# fix-ups of the appendix file name of a run, with the (trec, track) pairs they apply to
+appendix_rules = [
+    (appendix_trec33, lambda trec, track: trec == 'trec33'),
+    (appendix_trec30, lambda trec, track: trec == 'trec30' and track == 'incident'),
+    (appendix_trec27, lambda trec, track: trec == 'trec27' and track == 'incident'),
+    (appendix_trec26, lambda trec, track: trec == 'trec26' and track in ['car', 'domain', 'open']),
+    (appendix_trec25, lambda trec, track: trec == 'trec25' and track in ['recall', 'domain']),
+    (appendix_trec24, lambda trec, track: trec == 'trec24' and track in ['recall', 'tempsumm']),
+    (appendix_trec23, lambda trec, track: trec == 'trec23' and track == 'session'),
+    (appendix_trec22, lambda trec, track: trec == 'trec22' and track in ['crowd', 'tempsumm', 'session']),
+    (appendix_trec21, lambda trec, track: trec == 'trec21' and track in ['crowd', 'session']),
+    (appendix_trec20, lambda trec, track: trec == 'trec20' and track in ['medical', 'session', 'crowd']),
+    (appendix_trec18, lambda trec, track: trec == 'trec18' and track in ['relfdbk', 'million-query', 'web']),
+]
 
-    if item['trec'] == 'trec33':
-        appendix_url = 'https://trec.nist.gov/pubs/trec33/appendices/{0}.html'.format(item['task'])
 
-    # TREC-COVID
-    if item['trec'] == 'trec-covid':
-        appendix_url = 'https://ir.nist.gov/trec-covid/archive/{0}/{1}.pdf'.format(item['track'], item['runid'])
-
-    # TREC-26 appendix_url
-    if item['trec'] == 'trec26':
-        if item['track'] == 'domain':
-            appendix_url = 'https://trec.nist.gov/pubs/trec26/appendices/dynamic-domain-tables.pdf'
-        if item['track'] == 'open':
-            appendix_url = 'https://trec.nist.gov/pubs/trec26/appendices/trec-os-2017.pdf'
-    
-    # TREC-25 appendix_url
-    if item['trec'] == 'trec25':
-        if item['track'] == 'realtime':
-            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/rts/{1}'.format(item['trec'], appendix)
-        if item['track'] == 'open':
-            if item['type'] == 'CiteSeerX':
-                appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/open-citeseer.pdf'
-            if item['type'] == 'SSOAR':
-                appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/open-ssoar.pdf'
-        if item['track'] == 'domain':
-            appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/dd-notebook-appendix.pdf'
-    
-    # TREC-20 appendix_url
-    if item['trec'] == 'trec20':
-        if item['track'] == 'entity':
-            if item['task'] != 'ref':
-                appendix_url = None
-    
-    # TREC-19 appendix_url
-    if item['trec'] == 'trec19':
-        if item['track'] == 'blog':
-            if item['task'] == 'blfeed':
-                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/blfeed-blog.baseline/{0}.{1}.pdf'.format(item['pid'], item['task'])
-            if item['task'] == 'feed':
-                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/feed-blog.faceted/{0}.{1}.pdf'.format(item['pid'], item['task'])
-            else:
-                appendix_url = None 
-        if item['track'] == 'chemical':
-            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/chem/{0}.{1}.pdf'.format(item['pid'], item['task'])
-            if item['task'] == 'techsurv' or item['pid'] == 'IowaS':
-                appendix_url = None
-        if item['track'] == 'legal':
-            if item['task'] == 'learning':
-                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/legal-learning/{}.pdf'.format(item['runid'])
-            else:
-                appendix_url = None
-        if item['track'] == 'web':
-            if item['task'] in ['adhoc', 'diversity']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-adhoc-diversity/{}.adhoc.pdf'.format(item['pid'])
-            if item['task'] == 'spam':
-                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-spam/{}-all.pdf'.format(item['runid'])
-                if item['runid'] in ['1', '2']:
-                    appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-spam/Budapest1-all.pdf'
-    
-    # TREC-18 appendix_url
-    if item['trec'] == 'trec18':
-        if item['track'] == 'chemical':
-            if item['task'] == 'techsurv':
-                appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.tech-survey.pdf'
-            if item['task'] == 'priorart':
-                appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.prior-art.pdf'
-            if item['task'] == 'priorart_sm':
-                appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.prior-art.sm.pdf'
-        if item['track'] == 'entity':
-            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/entity.pdf'
-        if item['track'] == 'legal':
-            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/legal/app09scores.pdf'
-        if item['track'] == 'million-query':
-            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/mq/{1}'.format(item['trec'], appendix)
-        if item['track'] == 'web':
-            if item['task'] == 'diversity':
-                appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/web-diversity/appendix.pdf'
-            if item['task'] == 'adhoc':
-                appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/web-adhoc-{1}/{2}.adhoc.pdf'.format(item['trec'], item['of_1'].lower(), item['runid'])
-        if item['track'] == 'blog':
-            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/blog-{1}/{2}.{3}.pdf'.format(item['trec'], item['task'], item['runid'], item['task'])
-    
-    # TREC-17 appendix_url
-    if item['trec'] == 'trec17':
-        if item['track'] == 'blog':
-            if item['task'] in ['baseline', 'opinion']:
-                appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.{3}.pdf'.format(item['trec'], item['track'], item['runid'], item['task'])
-            if item['task'] == 'polarity':
-                appendix_url = json.dumps({
-                    'Appendix (Negative Polarity)': 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.negative.polarity.pdf'.format(item['trec'], item['track'], item['runid']),
-                    'Appendix (Positive Polarity)': 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.positive.polarity.pdf'.format(item['trec'], item['track'], item['runid'])
-                })
-        if item['track'] == 'million-query':
-            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/million.query/{1}.main.pdf'.format(item['trec'], item['runid'])
-        if item['track'] == 'enterprise':
-            if item['task'] == 'document':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/enterprise.discussion.results.pdf'
-            if item['task'] == 'expert':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/enterprise.expert.results.pdf'
-        if item['track'] == 'enterprise': 
-            if item['task'] == 'adhoc':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08ah3.pdf'
-            if item['task'] == 'feedback':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08rf3.pdf'
-            if item['task'] == 'interactive':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal.interactive.results.pdf'
-        if item['track'] == 'relfdbk': 
-            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/relevance.feedback/{1}.main.pdf'.format(item['trec'], item['pid'])
-        if item['track'] == 'legal':
-            if item['task'] == 'adhoc':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08ah3.pdf'
-            if item['task'] == 'feedback':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08rf3.pdf'
-            if item['task'] == 'interactive':
-                appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal.interactive.results.pdf'
-    
-    # TREC-16 appendix_url
-    if item['trec'] == 'trec16':
-        if item['track'] in ['blog', 'enterprise']:
+
+def appendix_url_trec33(item, appendix, appendix_url):
+    appendix_url = 'https://trec.nist.gov/pubs/trec33/appendices/{0}.html'.format(item['task'])
+    return appendix_url
+
+
+# TREC-COVID
+def appendix_url_trec_covid(item, appendix, appendix_url):
+    appendix_url = 'https://ir.nist.gov/trec-covid/archive/{0}/{1}.pdf'.format(item['track'], item['runid'])
+    return appendix_url
+
+
+# TREC-26 appendix_url
+def appendix_url_trec26(item, appendix, appendix_url):
+    if item['track'] == 'domain':
+        appendix_url = 'https://trec.nist.gov/pubs/trec26/appendices/dynamic-domain-tables.pdf'
+    if item['track'] == 'open':
+        appendix_url = 'https://trec.nist.gov/pubs/trec26/appendices/trec-os-2017.pdf'
+    return appendix_url
+
+
+# TREC-25 appendix_url
+def appendix_url_trec25(item, appendix, appendix_url):
+    if item['track'] == 'realtime':
+        appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/rts/{1}'.format(item['trec'], appendix)
+    if item['track'] == 'open':
+        if item['type'] == 'CiteSeerX':
+            appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/open-citeseer.pdf'
+        if item['type'] == 'SSOAR':
+            appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/open-ssoar.pdf'
+    if item['track'] == 'domain':
+        appendix_url = 'https://trec.nist.gov/pubs/trec25/appendices/dd-notebook-appendix.pdf'
+    return appendix_url
+
+
+# TREC-20 appendix_url
+def appendix_url_trec20(item, appendix, appendix_url):
+    if item['track'] == 'entity':
+        if item['task'] != 'ref':
+            appendix_url = None
+    return appendix_url
+
+
+# TREC-19 appendix_url
+def appendix_url_trec19(item, appendix, appendix_url):
+    if item['track'] == 'blog':
+        if item['task'] == 'blfeed':
+            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/blfeed-blog.baseline/{0}.{1}.pdf'.format(item['pid'], item['task'])
+        if item['task'] == 'feed':
+            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/feed-blog.faceted/{0}.{1}.pdf'.format(item['pid'], item['task'])
+        else:
+            appendix_url = None 
+    if item['track'] == 'chemical':
+        appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/chem/{0}.{1}.pdf'.format(item['pid'], item['task'])
+        if item['task'] == 'techsurv' or item['pid'] == 'IowaS':
+            appendix_url = None
+    if item['track'] == 'legal':
+        if item['task'] == 'learning':
+            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/legal-learning/{}.pdf'.format(item['runid'])
+        else:
+            appendix_url = None
+    if item['track'] == 'web':
+        if item['task'] in ['adhoc', 'diversity']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-adhoc-diversity/{}.adhoc.pdf'.format(item['pid'])
+        if item['task'] == 'spam':
+            appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-spam/{}-all.pdf'.format(item['runid'])
+            if item['runid'] in ['1', '2']:
+                appendix_url = 'https://trec.nist.gov/pubs/trec19/appendices/web-spam/Budapest1-all.pdf'
+    return appendix_url
+
+
+# TREC-18 appendix_url
+def appendix_url_trec18(item, appendix, appendix_url):
+    if item['track'] == 'chemical':
+        if item['task'] == 'techsurv':
+            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.tech-survey.pdf'
+        if item['task'] == 'priorart':
+            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.prior-art.pdf'
+        if item['task'] == 'priorart_sm':
+            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/chem.prior-art.sm.pdf'
+    if item['track'] == 'entity':
+        appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/entity.pdf'
+    if item['track'] == 'legal':
+        appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/legal/app09scores.pdf'
+    if item['track'] == 'million-query':
+        appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/mq/{1}'.format(item['trec'], appendix)
+    if item['track'] == 'web':
+        if item['task'] == 'diversity':
+            appendix_url = 'https://trec.nist.gov/pubs/trec18/appendices/web-diversity/appendix.pdf'
+        if item['task'] == 'adhoc':
+            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/web-adhoc-{1}/{2}.adhoc.pdf'.format(item['trec'], item['of_1'].lower(), item['runid'])
+    if item['track'] == 'blog':
+        appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/blog-{1}/{2}.{3}.pdf'.format(item['trec'], item['task'], item['runid'], item['task'])
+    return appendix_url
+
+
+# TREC-17 appendix_url
+def appendix_url_trec17(item, appendix, appendix_url):
+    if item['track'] == 'blog':
+        if item['task'] in ['baseline', 'opinion']:
+            appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.{3}.pdf'.format(item['trec'], item['track'], item['runid'], item['task'])
+        if item['task'] == 'polarity':
+            appendix_url = json.dumps({
+                'Appendix (Negative Polarity)': 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.negative.polarity.pdf'.format(item['trec'], item['track'], item['runid']),
+                'Appendix (Positive Polarity)': 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}.positive.polarity.pdf'.format(item['trec'], item['track'], item['runid'])
+            })
+    if item['track'] == 'million-query':
+        appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/million.query/{1}.main.pdf'.format(item['trec'], item['runid'])
+    if item['track'] == 'enterprise':
+        if item['task'] == 'document':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/enterprise.discussion.results.pdf'
+        if item['task'] == 'expert':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/enterprise.expert.results.pdf'
+    if item['track'] == 'enterprise': 
+        if item['task'] == 'adhoc':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08ah3.pdf'
+        if item['task'] == 'feedback':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08rf3.pdf'
+        if item['task'] == 'interactive':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal.interactive.results.pdf'
+    if item['track'] == 'relfdbk': 
+        appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/relevance.feedback/{1}.main.pdf'.format(item['trec'], item['pid'])
+    if item['track'] == 'legal':
+        if item['task'] == 'adhoc':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08ah3.pdf'
+        if item['task'] == 'feedback':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal/app08rf3.pdf'
+        if item['task'] == 'interactive':
+            appendix_url = 'https://trec.nist.gov/pubs/trec17/appendices/legal.interactive.results.pdf'
+    return appendix_url
+
+
+# TREC-16 appendix_url
+def appendix_url_trec16(item, appendix, appendix_url):
+    if item['track'] in ['blog', 'enterprise']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
+        if item['task'] in ['feed', 'polarity']: # tasks of 'blog'
+            appendix_url = None
+    else:
+        appendix_url = None
+    if item['track'] == 'legal':
+        if item['task'] in ['main', 'routing']:
             appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-            if item['task'] in ['feed', 'polarity']: # tasks of 'blog'
-                appendix_url = None
+        if item['task'] == 'interactive':
+            appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/legal/interactive.pdf'
+    if item['track'] in ['genomics']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.main.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'million-query':
+        if item['task'] == 'official':
+                appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/million.query/{}.official.pdf'.format(item['runid'])
         else:
             appendix_url = None
-        if item['track'] == 'legal':
-            if item['task'] in ['main', 'routing']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-            if item['task'] == 'interactive':
-                appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/legal/interactive.pdf'
-        if item['track'] in ['genomics']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.main.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'million-query':
-            if item['task'] == 'official':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/million.query/{}.official.pdf'.format(item['runid'])
-            else:
-                appendix_url = None
-        if item['track'] == 'qa':
-            appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'spam':
-            appendices = {
-                'x3d': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}x3d.pdf',
-                'x3f': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}x3f.pdf',
-                'pd': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pd.pdf',
-                'pf': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pf.pdf',
-                'pp': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pp.pdf',
-                'p1000': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}p1000.pdf'
-            }
-            appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/spam.results.html'
-            abbrv = None
-            if item['pid'] == 'beijingu-posts-tele.weiran':
-                abbrv = 'kid'
-                kinds = ['x3d', 'x3f']
-            if item['pid'] == 'mitsubhishi.yerazunis':
-                abbrv = 'crm'
-                kinds = ['x3d', 'x3f', 'pd', 'pf', 'pp']
-            if item['pid'] == 'fudanu.niu':
-                abbrv = 'fdw'
-                kinds = appendices.keys()
-            if item['pid'] == 'heilongjiang-it.qi':
-                abbrv = 'hit'
-                kinds = ['pd', 'pf', 'pp', 'p1000']
-            if item['pid'] == 'indianau.yang':
-                abbrv = 'iub'
-                kinds = ['x3f', 'pd', 'pf', 'pp', 'p1000']
-            if item['pid'] == 'iiit-hyderbad':
-                abbrv = 'III'
-                kinds = ['x3d', 'x3f', 'pf']
-            if item['pid'] == 'jozef-stefan-inst.bratko':
-                abbrv = 'ijs'
-                kinds = appendices.keys()
-            if item['pid'] == 'nationalu-defense-tech.liu':
-                abbrv = 'ndt'
-                kinds = appendices.keys()
-            if item['pid'] == 'sjtu-cs-spam':
-                abbrv = 'sjt'
-                kinds = appendices.keys()
-            if item['pid'] == 'schina.utech.weidong':
-                abbrv = 'scu'
-                kinds = ['x3f', 'pd', 'pf', 'pp', 'p1000']
-            if item['pid'] == 'tufts.sculley':
-                abbrv = 'tft'
-                kinds = appendices.keys()
-            if item['pid'] == 'uwaterloo.clarke':
-                abbrv = 'wat'
-                kinds = appendices.keys()
-            if abbrv:
-                out = {}
-                for k in kinds:
-                    out['Appendix ({})'.format(k)] = appendices[k].format(abbrv)
-                appendix_url = json.dumps(out)
-    
-    # TREC-15 appendix_url
-    if item['trec'] == 'trec15':
-        if item['track'] == 'blog':
-            if item['task'] == 'opinion':
-                appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-        if item['track'] in ['enterprise',  'terabyte']:
+    if item['track'] == 'qa':
+        appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'spam':
+        appendices = {
+            'x3d': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}x3d.pdf',
+            'x3f': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}x3f.pdf',
+            'pd': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pd.pdf',
+            'pf': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pf.pdf',
+            'pp': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}pp.pdf',
+            'p1000': 'https://trec.nist.gov/pubs/trec16/appendices/spam/{}p1000.pdf'
+        }
+        appendix_url = 'https://trec.nist.gov/pubs/trec16/appendices/spam.results.html'
+        abbrv = None
+        if item['pid'] == 'beijingu-posts-tele.weiran':
+            abbrv = 'kid'
+            kinds = ['x3d', 'x3f']
+        if item['pid'] == 'mitsubhishi.yerazunis':
+            abbrv = 'crm'
+            kinds = ['x3d', 'x3f', 'pd', 'pf', 'pp']
+        if item['pid'] == 'fudanu.niu':
+            abbrv = 'fdw'
+            kinds = appendices.keys()
+        if item['pid'] == 'heilongjiang-it.qi':
+            abbrv = 'hit'
+            kinds = ['pd', 'pf', 'pp', 'p1000']
+        if item['pid'] == 'indianau.yang':
+            abbrv = 'iub'
+            kinds = ['x3f', 'pd', 'pf', 'pp', 'p1000']
+        if item['pid'] == 'iiit-hyderbad':
+            abbrv = 'III'
+            kinds = ['x3d', 'x3f', 'pf']
+        if item['pid'] == 'jozef-stefan-inst.bratko':
+            abbrv = 'ijs'
+            kinds = appendices.keys()
+        if item['pid'] == 'nationalu-defense-tech.liu':
+            abbrv = 'ndt'
+            kinds = appendices.keys()
+        if item['pid'] == 'sjtu-cs-spam':
+            abbrv = 'sjt'
+            kinds = appendices.keys()
+        if item['pid'] == 'schina.utech.weidong':
+            abbrv = 'scu'
+            kinds = ['x3f', 'pd', 'pf', 'pp', 'p1000']
+        if item['pid'] == 'tufts.sculley':
+            abbrv = 'tft'
+            kinds = appendices.keys()
+        if item['pid'] == 'uwaterloo.clarke':
+            abbrv = 'wat'
+            kinds = appendices.keys()
+        if abbrv:
+            out = {}
+            for k in kinds:
+                out['Appendix ({})'.format(k)] = appendices[k].format(abbrv)
+            appendix_url = json.dumps(out)
+    return appendix_url
+
+
+# TREC-15 appendix_url
+def appendix_url_trec15(item, appendix, appendix_url):
+    if item['track'] == 'blog':
+        if item['task'] == 'opinion':
             appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-        if item['track'] in ['genomics', 'legal']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.main.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'qa':
-            appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'spam':
-            appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/spam.results.html'
-    
-    # TREC-14 appendix_url
-    if item['trec'] == 'trec14':
-        if item['track'] in ['enterprise',  'terabyte']:
+    if item['track'] in ['enterprise',  'terabyte']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
+    if item['track'] in ['genomics', 'legal']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.main.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'qa':
+        appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'spam':
+        appendix_url = 'https://trec.nist.gov/pubs/trec15/appendices/spam.results.html'
+    return appendix_url
+
+
+# TREC-14 appendix_url
+def appendix_url_trec14(item, appendix, appendix_url):
+    if item['track'] in ['enterprise',  'terabyte']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
+    if item['track'] == 'genomics':
+        if item['task'] == 'adhoc':
             appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-        if item['track'] == 'genomics':
-            if item['task'] == 'adhoc':
-                appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-            if item['task'] == 'categorization':
-                appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['pid'], item['task'])
-        if item['track'] in ['HARD', 'qa', 'robust']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.table.pdf'.format(item['track'].lower(), item['runid'])
-        if item['track'] == 'spam':
-            appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/spam.results.html'
-            abbrv = None
-            if item['pid'] == 'beijingu.guo':
-                abbrv = 'kid'
-            if item['pid'] == 'breyer.laird':
-                abbrv = 'lb'
-            if item['pid'] == 'cas-ict.wang':
-                abbrv = 'ICT'
-            if item['pid'] == 'dalhousieu.keselj':
-                abbrv = 'dal'
-            if item['pid'] == 'ibm.segal':
-                abbrv = '621'
-            if item['pid'] == 'indianau.yang':
-                abbrv = 'ind'
-            if item['pid'] == 'jozef-stefan-inst.bratko':
-                abbrv = 'ijs'
-            if item['pid'] == 'masseyu.meyer':
-                abbrv = 'tam'
-            if item['pid'] == 'merl.yerazunis':
-                abbrv = 'crm'
-            if item['pid'] == 'puc-rs.terra':
-                abbrv = 'puc'
-            if item['pid'] == 'uparis-sud.aze':
-                abbrv = 'aze'         
-            if item['pid'] == 'yorku.huang':
-                abbrv = 'yor'  
-            if abbrv:   
-                appendix_url = json.dumps({
-                    'Appendix (aggregate results)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}agg.pdf'.format(abbrv),
-                    'Appendix (public corpus [full])': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}full.pdf'.format(abbrv),
-                    'Appendix (Mr. X Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}mrx.pdf'.format(abbrv),
-                    'Appendix (S.B. Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}sb.pdf'.format(abbrv),
-                    'Appendix (T.M. Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}tm.pdf'.format(abbrv),
-                    'Appendix (public corpus [five subsets])': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}.pdf'.format(abbrv)
-                })
-    
-    # TREC-13 appendix_url
-    if item['trec'] == 'trec13':
-        if item['track'] in ['novelty', 'qa', 'robust', 'hard', 'HARD']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'genomics':
-            if item['task'] == 'adhoc':
-                appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
-            else:
-                appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.{2}.table.pdf'.format(item['track'], item['pid'], item['task'])
-        if item['track'] == 'terabyte':
-            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.tb.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'web':
-            if item['task'] == 'mixed':
-                appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.mixed.pdf'.format(item['track'], item['pid'])
-            else:
-                appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/web/classification.pdf'
-    
-    # TREC-12 appendix_url
-    if item['trec'] == 'trec12':
-        if item['track'] == 'genomics':
-            if item['task'] == 'primary':
-                appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/genome/{}.table.pdf'.format(item['runid'])
-            if item['task'] == 'secondary':
-                appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/genome/{}.table2.pdf'.format(item['runid'])
-        if item['track'] in ['hard', 'novelty', 'robust', 'web']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
-        if item['track'] == 'qa':
-            appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
-    
-    # TREC-11 appendix_url
-    if item['trec'] == 'trec11':
-        if item['track'] == 'xlingual':
-            appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/cross.language/{}.table.pdf'.format(item['runid'])
-        if item['track'] == 'filtering':
-            appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/filtering/{0}.{1}.pdf'.format(item['pid'], item['task'])
-        if item['track'] in ['novelty', 'qa', 'web']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid']) 
-        if item['track'] == 'video':
-            appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/video.sb.html'
-    
-    # TREC-10 appendix_url
-    if item['trec'] == 'trec10':
-        if item['track'] in ['xlingual', 'filtering', 'qa', 'web']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec10/appendices/{0}/{1}.pdf'.format(item['track'], item['runid'])       
-        if item['track'] == 'video':
+        if item['task'] == 'categorization':
+            appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['pid'], item['task'])
+    if item['track'] in ['HARD', 'qa', 'robust']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/{0}/{1}.table.pdf'.format(item['track'].lower(), item['runid'])
+    if item['track'] == 'spam':
+        appendix_url = 'https://trec.nist.gov/pubs/trec14/appendices/spam.results.html'
+        abbrv = None
+        if item['pid'] == 'beijingu.guo':
+            abbrv = 'kid'
+        if item['pid'] == 'breyer.laird':
+            abbrv = 'lb'
+        if item['pid'] == 'cas-ict.wang':
+            abbrv = 'ICT'
+        if item['pid'] == 'dalhousieu.keselj':
+            abbrv = 'dal'
+        if item['pid'] == 'ibm.segal':
+            abbrv = '621'
+        if item['pid'] == 'indianau.yang':
+            abbrv = 'ind'
+        if item['pid'] == 'jozef-stefan-inst.bratko':
+            abbrv = 'ijs'
+        if item['pid'] == 'masseyu.meyer':
+            abbrv = 'tam'
+        if item['pid'] == 'merl.yerazunis':
+            abbrv = 'crm'
+        if item['pid'] == 'puc-rs.terra':
+            abbrv = 'puc'
+        if item['pid'] == 'uparis-sud.aze':
+            abbrv = 'aze'         
+        if item['pid'] == 'yorku.huang':
+            abbrv = 'yor'  
+        if abbrv:   
             appendix_url = json.dumps({
-                    'nb.backintro1': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.backintro1.pdf',
-                    'nb.backintro2': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.backintro2.pdf',
-                    'nb.gs.precision': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.gs.precision.pdf', 
-                    'nb.ki.precision': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.ki.precision.pdf',
-                    'nb.ki.recall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.ki.recall.pdf',
-                    'nb.sb.cutsgrad.insertcount': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.cutsgrad.insertcount.pdf',
-                    'nb.sb.cuts.precisionrecall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.cuts.precisionrecall.pdf',
-                    'nb.sb.grad.precisionrecall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.grad.precisionrecall.pdf',
-                    'nb.topics': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.topics.pdf'
-                })   
-    
-    # TREC-9 appendix_url
-    if item['trec'] == 'trec9':
-        if item['track'] == 'xlingual':
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/xlingual/{}.pdf'.format(item['runid'])
-        if item['track'] == 'filtering':
-            if item['task'] == 'adaptive':
-                appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.adapt.pdf'.format(item['pid'])
-            if item['task'] in ['batch', 'batch-adaptive']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.batch.pdf'.format(item['pid'])
-            if item['task'] == 'routing':
-                appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.rout.pdf'.format(item['pid'])
-        if item['track'] == 'interactive':
-            pid = item['pid']
-            if pid == 'OHSU':
-                pid = pid.lower()
-            if pid == 'RMIT':
-                pid = 'csiro.rmit'
-            if pid == 'rutgers-belkin':
-                pid = 'rutgers'
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/interactive/{}.results.pdf'.format(pid)
-        if item['track'] == 'qa':
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/qa/{}.pdf'.format(item['runid'])
-        if item['track'] == 'sdr':
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/sdr/{}.pdf'.format(item['runid'])
-        if item['track'] == 'web':
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/web/{}.pdf'.format(item['runid'])
-        if item['track'] == 'query':
-            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/query/pretty_print.pdf'  
-    
-    # TREC-8 appendix_url
-    if item['trec'] == 'trec8':
-        if item['track'] == 'adhoc':
-            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/adhoc_results/{}.table.pdf'.format(item['runid'])
-        if item['track'] == 'girt':
+                'Appendix (aggregate results)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}agg.pdf'.format(abbrv),
+                'Appendix (public corpus [full])': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}full.pdf'.format(abbrv),
+                'Appendix (Mr. X Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}mrx.pdf'.format(abbrv),
+                'Appendix (S.B. Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}sb.pdf'.format(abbrv),
+                'Appendix (T.M. Private corpus)': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}tm.pdf'.format(abbrv),
+                'Appendix (public corpus [five subsets])': 'https://trec.nist.gov/pubs/trec14/appendices/spam/{}.pdf'.format(abbrv)
+            })
+    return appendix_url
+
+
+# TREC-13 appendix_url
+def appendix_url_trec13(item, appendix, appendix_url):
+    if item['track'] in ['novelty', 'qa', 'robust', 'hard', 'HARD']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'genomics':
+        if item['task'] == 'adhoc':
+            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
+        else:
+            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.{2}.table.pdf'.format(item['track'], item['pid'], item['task'])
+    if item['track'] == 'terabyte':
+        appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.tb.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'web':
+        if item['task'] == 'mixed':
+            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/{0}/{1}.mixed.pdf'.format(item['track'], item['pid'])
+        else:
+            appendix_url = 'https://trec.nist.gov/pubs/trec13/appendices/web/classification.pdf'
+    return appendix_url
+
+
+# TREC-12 appendix_url
+def appendix_url_trec12(item, appendix, appendix_url):
+    if item['track'] == 'genomics':
+        if item['task'] == 'primary':
+            appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/genome/{}.table.pdf'.format(item['runid'])
+        if item['task'] == 'secondary':
+            appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/genome/{}.table2.pdf'.format(item['runid'])
+    if item['track'] in ['hard', 'novelty', 'robust', 'web']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid'])
+    if item['track'] == 'qa':
+        appendix_url = 'https://trec.nist.gov/pubs/trec12/appendices/{0}/{1}.{2}.pdf'.format(item['track'], item['runid'], item['task'])
+    return appendix_url
+
+
+# TREC-11 appendix_url
+def appendix_url_trec11(item, appendix, appendix_url):
+    if item['track'] == 'xlingual':
+        appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/cross.language/{}.table.pdf'.format(item['runid'])
+    if item['track'] == 'filtering':
+        appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/filtering/{0}.{1}.pdf'.format(item['pid'], item['task'])
+    if item['track'] in ['novelty', 'qa', 'web']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/{0}/{1}.table.pdf'.format(item['track'], item['runid']) 
+    if item['track'] == 'video':
+        appendix_url = 'https://trec.nist.gov/pubs/trec11/appendices/video.sb.html'
+    return appendix_url
+
+
+# TREC-10 appendix_url
+def appendix_url_trec10(item, appendix, appendix_url):
+    if item['track'] in ['xlingual', 'filtering', 'qa', 'web']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec10/appendices/{0}/{1}.pdf'.format(item['track'], item['runid'])       
+    if item['track'] == 'video':
+        appendix_url = json.dumps({
+                'nb.backintro1': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.backintro1.pdf',
+                'nb.backintro2': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.backintro2.pdf',
+                'nb.gs.precision': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.gs.precision.pdf', 
+                'nb.ki.precision': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.ki.precision.pdf',
+                'nb.ki.recall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.ki.recall.pdf',
+                'nb.sb.cutsgrad.insertcount': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.cutsgrad.insertcount.pdf',
+                'nb.sb.cuts.precisionrecall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.cuts.precisionrecall.pdf',
+                'nb.sb.grad.precisionrecall': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.sb.grad.precisionrecall.pdf',
+                'nb.topics': 'https://trec.nist.gov/pubs/trec10/appendices/video/nb.topics.pdf'
+            })   
+    return appendix_url
+
+
+# TREC-9 appendix_url
+def appendix_url_trec9(item, appendix, appendix_url):
+    if item['track'] == 'xlingual':
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/xlingual/{}.pdf'.format(item['runid'])
+    if item['track'] == 'filtering':
+        if item['task'] == 'adaptive':
+            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.adapt.pdf'.format(item['pid'])
+        if item['task'] in ['batch', 'batch-adaptive']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.batch.pdf'.format(item['pid'])
+        if item['task'] == 'routing':
+            appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/filtering/{}.rout.pdf'.format(item['pid'])
+    if item['track'] == 'interactive':
+        pid = item['pid']
+        if pid == 'OHSU':
+            pid = pid.lower()
+        if pid == 'RMIT':
+            pid = 'csiro.rmit'
+        if pid == 'rutgers-belkin':
+            pid = 'rutgers'
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/interactive/{}.results.pdf'.format(pid)
+    if item['track'] == 'qa':
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/qa/{}.pdf'.format(item['runid'])
+    if item['track'] == 'sdr':
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/sdr/{}.pdf'.format(item['runid'])
+    if item['track'] == 'web':
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/web/{}.pdf'.format(item['runid'])
+    if item['track'] == 'query':
+        appendix_url = 'https://trec.nist.gov/pubs/trec9/appendices/A/query/pretty_print.pdf'  
+    return appendix_url
+
+
+# TREC-8 appendix_url
+def appendix_url_trec8(item, appendix, appendix_url):
+    if item['track'] == 'adhoc':
+        appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/adhoc_results/{}.table.pdf'.format(item['runid'])
+    if item['track'] == 'girt':
+        appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_girt_results/{}.table.pdf'.format(item['runid'])
+    if item['track'] == 'xlingual':
+        if item['task'] == 'german':
             appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_girt_results/{}.table.pdf'.format(item['runid'])
-        if item['track'] == 'xlingual':
-            if item['task'] == 'german':
-                appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_girt_results/{}.table.pdf'.format(item['runid'])
-            if item['runid'] in xligualalt_special_url:
-                appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_alt_results/{}.table.pdf'.format(item['runid'])                   
-            else:
-                appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_results/{}.table.pdf'.format(item['runid'])
-        if item['track'] == 'filtering':
-            if item['task'] == 'batch':
-                appendix_url = json.dumps({
-                    'Appendix (LF1 Measure)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/batch.LF1.pdf',
-                    'Appendix (LF2 Measure)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/batch.LF2.pdf'
-                })
-            if item['task'] == 'adaptive':
-                appendix_url = json.dumps({
-                    'Appendix (LF1 Measure, Year 92-94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.92-94.pdf',
-                    'Appendix (LF1 Measure, Year 92)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.92.pdf',
-                    'Appendix (LF1 Measure, Year 93)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.93.pdf',
-                    'Appendix (LF1 Measure, Year 94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.94.pdf',
-                    'Appendix (LF2 Measure, Year 92-94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.92-94.pdf',
-                    'Appendix (LF2 Measure, Year 92)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.92.pdf',
-                    'Appendix (LF2 Measure, Year 93)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.93.pdf',
-                    'Appendix (LF2 Measure, Year 94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.94.pdf'
-                })
-            if item['task'] == 'routing':
-                appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/rout.pdf' 
-        if item['track'] == 'interactive':
+        if item['runid'] in xligualalt_special_url:
+            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_alt_results/{}.table.pdf'.format(item['runid'])                   
+        else:
+            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/xlingual_results/{}.table.pdf'.format(item['runid'])
+    if item['track'] == 'filtering':
+        if item['task'] == 'batch':
             appendix_url = json.dumps({
-                    'Measures': 'https://trec.nist.gov/pubs/trec8/appendices/A/interactive_results/measures.pdf',
-                    'Topic Instances': 'https://trec.nist.gov/pubs/trec8/appendices/A/interactive_results/topic-instances.pdf'
-                }) 
-        if item['track'] == 'qa':
-            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/qa_results/{}.pdf'.format(item['runid'])
-        if item['track'] == 'sdr':
-            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/sdr_results/{}.table.pdf'.format(item['runid'])
-        if item['track'] == 'web':
-            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/small_web_results/{}.table.pdf'.format(item['runid'])
-    
-    # TREC-7 appendix_url
-    if item['trec'] == 'trec7':
-        if item['track'] == 'adhoc':
-            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/adhoc_results/{}.table.pdf.gz'.format(item['runid'])
-        if item['track'] == 'xlingual':
-            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/xlingual_results/{}.table.pdf.gz'.format(item['runid'])
-        if item['track'] == 'hp':
-            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/hp_results/{}.table.pdf.gz'.format(item['runid'])
-        if item['track'] == 'query':
-            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/query_results/query.pdf.gz'
-        if item['track'] == 'sdr':
-            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/sdr_results/{}.table.pdf.gz'.format(item['runid'])
-        if item['track'] == 'filtering':
-            if item['runid'] in ['CLARITafF1a', 'CLARITafF1b', 'IAHKaf11', 'IAHKaf12', 'INQ510', 'Mer7AGbF1', 'Mer7ARbF1', 'ok7ff12', 'ok7ff13', 'pirc8FA1', 'sigmaTrec7F1', 'TNOAF102']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/adapt.F1.pdf.gz'
-            if item['runid'] in ['CLARITafF3a',  'CLARITafF3b',  'IAHKaf31',  'IAHKaf32',  'INQ511',  'Mer7AGbF3',  'Mer7ARbF3',  'ok7ff32',  'ok7ff33',  'pirc8FA3',  'sigmaTrec7F3',  'TNOAF103']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/adapt.F3.pdf.gz'
-            if item['runid'] in ['att98fb5', 'CLARITbfF1', 'IAHKbf11', 'MerBF1', 'nttd7bf1', 'pirc8FB1']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/batch.F1.pdf.gz'
-            if item['runid'] in ['att98fb6', 'CLARITbfF3', 'IAHKbf32', 'MerBF3', 'nttd7bf3', 'pirc8FB3']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/batch.F3.pdf.gz'
-            if item['runid'] in ['AntRout1', 'AntRout2', 'arc98cs', 'att98fr4', 'att98fr5', 'MerRou', 'nttd7rt1', 'nttd7rt2', 'pirc8R1', 'pirc8R2']:
-                appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/rout.pdf.gz'
-    
-    # TREC-6 appendix_url
-    if item['trec'] == 'trec6':
-        if item['track'] == 'adhoc':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/adhoc.runs.pdf.gz'
-        if item['track'] == 'routing':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/routing.runs.ps.gz'
-        if item['track'] == 'chinese':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/chinese.runs.ps.gz'
-        if item['track'] == 'clir':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/xlingual.runs.ps.gz'
-        if item['track'] == 'filtering':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/papers/filter.track.figs.ps.gz'
-        if item['track'] == 'hp':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/high-prec.runs.ps.gz'
-        if item['track'] == 'interactive':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/t6iresults.ps.gz'
-        if item['track'] == 'nlp':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/nlp.runs.ps.gz'
-        if item['track'] == 'sdr':
-            appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/sdr.runs.ps.gz'
-    
-    # TREC-5 appendix_url
-    if item['trec'] == 'trec5':
-        if item['track'] in ['adhoc', 'routing', 'Chinese', 'Spanish', 'dbmerge', 'nlp']:
-            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/{}.graphs.ps.gz'.format(item['track'].lower())
-        if item['track'] == 'filtering':
-            if item['pid'] == 'City':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/city96f.table.ps.gz'
-            if item['pid'] == 'UMass':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INR3.table.ps.gz'
-            if item['pid'] == 'Intext':
-                if item['type'] == 'automatic':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INTXA.table.ps.gz'
-                if item['type'] == 'manual':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INTXM.table.ps.gz'
-            if item['pid'] == 'UIUC':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ispF.table.ps.gz'
-            if item['pid'] == 'ITI-SG':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/iti96f.table.ps.gz'
-            if item['pid'] == 'CUNY':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/pircs96f.table.ps.gz'
-            if item['pid'] == 'Xerox':
-                if item['runid'][7] == '1':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f1.table.ps.gz'
-                if item['runid'][7] == '2':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f2.table.ps.gz'
-                if item['runid'][7] == '3':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f3.table.ps.gz'
-        if item['track'] == 'interactive':
-            if item['pid'] == 'City':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/notebook.page.city.ps.gz'
-            if item['pid'] == 'RutgersB':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/notebook.page.rutgers.ps.gz'
-        if item['track'] == 'confusion':
-            if item['pid'] == 'ANU':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/anu5con.table.ps.gz'
-            if item['pid'] == 'GMU':
-                if item['runid'][-2] == '2':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/gmu962.table.ps.gz'
-                else: 
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/gmu961.table.ps.gz'
-            if item['pid'] == 'CLARITECH':
-                if item['runid'][-1] == 'F':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/CLCONF.table.ps.gz'
-                else: 
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/CLCON.table.ps.gz'
-            if item['pid'] == 'RutgersK':
-                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/rutcf.table.ps.gz'
-            if item['pid'] == 'ETH':
-                if item['runid'][-1] == 'P':
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ETHFR94P.table.ps.gz'
-                else:
-                    appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ETHFR94N.table.ps.gz'
-    
-    # TREC-4 appendix_url
-    if item['trec'] == 'trec4':
-        if item['track'] == 'adhoc':
-            appendix_url = 'https://trec.nist.gov/pubs/trec4/appendices/A/trec4.{}.list.graphs.ps.gz'.format(item['track'])
-        if item['track'] == 'interactive':
-            appendix_url = None
-    
-    # TREC-3 appendix_url
-    if item['trec'] == 'trec3': 
-        appendix_url = 'https://trec.nist.gov/pubs/trec3/appendices/A/{}.list.graphs.ps.gz'.format(item['track'])
-    
-    # TREC-2 appendix_url
-    if item['trec'] == 'trec2': 
-        appendix_url = 'https://trec.nist.gov/pubs/trec2/appendices/A.txt'
-    
+                'Appendix (LF1 Measure)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/batch.LF1.pdf',
+                'Appendix (LF2 Measure)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/batch.LF2.pdf'
+            })
+        if item['task'] == 'adaptive':
+            appendix_url = json.dumps({
+                'Appendix (LF1 Measure, Year 92-94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.92-94.pdf',
+                'Appendix (LF1 Measure, Year 92)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.92.pdf',
+                'Appendix (LF1 Measure, Year 93)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.93.pdf',
+                'Appendix (LF1 Measure, Year 94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF1.94.pdf',
+                'Appendix (LF2 Measure, Year 92-94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.92-94.pdf',
+                'Appendix (LF2 Measure, Year 92)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.92.pdf',
+                'Appendix (LF2 Measure, Year 93)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.93.pdf',
+                'Appendix (LF2 Measure, Year 94)': 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/adapt.LF2.94.pdf'
+            })
+        if item['task'] == 'routing':
+            appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/filtering_results/rout.pdf' 
+    if item['track'] == 'interactive':
+        appendix_url = json.dumps({
+                'Measures': 'https://trec.nist.gov/pubs/trec8/appendices/A/interactive_results/measures.pdf',
+                'Topic Instances': 'https://trec.nist.gov/pubs/trec8/appendices/A/interactive_results/topic-instances.pdf'
+            }) 
+    if item['track'] == 'qa':
+        appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/qa_results/{}.pdf'.format(item['runid'])
+    if item['track'] == 'sdr':
+        appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/sdr_results/{}.table.pdf'.format(item['runid'])
+    if item['track'] == 'web':
+        appendix_url = 'https://trec.nist.gov/pubs/trec8/appendices/A/small_web_results/{}.table.pdf'.format(item['runid'])
+    return appendix_url
+
+
+# TREC-7 appendix_url
+def appendix_url_trec7(item, appendix, appendix_url):
+    if item['track'] == 'adhoc':
+        appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/adhoc_results/{}.table.pdf.gz'.format(item['runid'])
+    if item['track'] == 'xlingual':
+        appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/xlingual_results/{}.table.pdf.gz'.format(item['runid'])
+    if item['track'] == 'hp':
+        appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/hp_results/{}.table.pdf.gz'.format(item['runid'])
+    if item['track'] == 'query':
+        appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/query_results/query.pdf.gz'
+    if item['track'] == 'sdr':
+        appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/sdr_results/{}.table.pdf.gz'.format(item['runid'])
+    if item['track'] == 'filtering':
+        if item['runid'] in ['CLARITafF1a', 'CLARITafF1b', 'IAHKaf11', 'IAHKaf12', 'INQ510', 'Mer7AGbF1', 'Mer7ARbF1', 'ok7ff12', 'ok7ff13', 'pirc8FA1', 'sigmaTrec7F1', 'TNOAF102']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/adapt.F1.pdf.gz'
+        if item['runid'] in ['CLARITafF3a',  'CLARITafF3b',  'IAHKaf31',  'IAHKaf32',  'INQ511',  'Mer7AGbF3',  'Mer7ARbF3',  'ok7ff32',  'ok7ff33',  'pirc8FA3',  'sigmaTrec7F3',  'TNOAF103']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/adapt.F3.pdf.gz'
+        if item['runid'] in ['att98fb5', 'CLARITbfF1', 'IAHKbf11', 'MerBF1', 'nttd7bf1', 'pirc8FB1']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/batch.F1.pdf.gz'
+        if item['runid'] in ['att98fb6', 'CLARITbfF3', 'IAHKbf32', 'MerBF3', 'nttd7bf3', 'pirc8FB3']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/batch.F3.pdf.gz'
+        if item['runid'] in ['AntRout1', 'AntRout2', 'arc98cs', 'att98fr4', 'att98fr5', 'MerRou', 'nttd7rt1', 'nttd7rt2', 'pirc8R1', 'pirc8R2']:
+            appendix_url = 'https://trec.nist.gov/pubs/trec7/appendices/A/filtering_results/rout.pdf.gz'
+    return appendix_url
+
+
+# TREC-6 appendix_url
+def appendix_url_trec6(item, appendix, appendix_url):
+    if item['track'] == 'adhoc':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/adhoc.runs.pdf.gz'
+    if item['track'] == 'routing':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/routing.runs.ps.gz'
+    if item['track'] == 'chinese':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/chinese.runs.ps.gz'
+    if item['track'] == 'clir':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/xlingual.runs.ps.gz'
+    if item['track'] == 'filtering':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/papers/filter.track.figs.ps.gz'
+    if item['track'] == 'hp':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/high-prec.runs.ps.gz'
+    if item['track'] == 'interactive':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/t6iresults.ps.gz'
+    if item['track'] == 'nlp':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/nlp.runs.ps.gz'
+    if item['track'] == 'sdr':
+        appendix_url = 'https://trec.nist.gov/pubs/trec6/appendices/A/sdr.runs.ps.gz'
+    return appendix_url
+
+
+# TREC-5 appendix_url
+def appendix_url_trec5(item, appendix, appendix_url):
+    if item['track'] in ['adhoc', 'routing', 'Chinese', 'Spanish', 'dbmerge', 'nlp']:
+        appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/{}.graphs.ps.gz'.format(item['track'].lower())
+    if item['track'] == 'filtering':
+        if item['pid'] == 'City':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/city96f.table.ps.gz'
+        if item['pid'] == 'UMass':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INR3.table.ps.gz'
+        if item['pid'] == 'Intext':
+            if item['type'] == 'automatic':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INTXA.table.ps.gz'
+            if item['type'] == 'manual':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/INTXM.table.ps.gz'
+        if item['pid'] == 'UIUC':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ispF.table.ps.gz'
+        if item['pid'] == 'ITI-SG':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/iti96f.table.ps.gz'
+        if item['pid'] == 'CUNY':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/pircs96f.table.ps.gz'
+        if item['pid'] == 'Xerox':
+            if item['runid'][7] == '1':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f1.table.ps.gz'
+            if item['runid'][7] == '2':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f2.table.ps.gz'
+            if item['runid'][7] == '3':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/xerox.f3.table.ps.gz'
+    if item['track'] == 'interactive':
+        if item['pid'] == 'City':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/notebook.page.city.ps.gz'
+        if item['pid'] == 'RutgersB':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/notebook.page.rutgers.ps.gz'
+    if item['track'] == 'confusion':
+        if item['pid'] == 'ANU':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/anu5con.table.ps.gz'
+        if item['pid'] == 'GMU':
+            if item['runid'][-2] == '2':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/gmu962.table.ps.gz'
+            else: 
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/gmu961.table.ps.gz'
+        if item['pid'] == 'CLARITECH':
+            if item['runid'][-1] == 'F':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/CLCONF.table.ps.gz'
+            else: 
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/CLCON.table.ps.gz'
+        if item['pid'] == 'RutgersK':
+            appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/rutcf.table.ps.gz'
+        if item['pid'] == 'ETH':
+            if item['runid'][-1] == 'P':
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ETHFR94P.table.ps.gz'
+            else:
+                appendix_url = 'https://trec.nist.gov/pubs/trec5/appendices/A/ETHFR94N.table.ps.gz'
+    return appendix_url
+
+
+# TREC-4 appendix_url
+def appendix_url_trec4(item, appendix, appendix_url):
+    if item['track'] == 'adhoc':
+        appendix_url = 'https://trec.nist.gov/pubs/trec4/appendices/A/trec4.{}.list.graphs.ps.gz'.format(item['track'])
+    if item['track'] == 'interactive':
+        appendix_url = None
     return appendix_url
 
 
-def add_input_url(item):
-    if (item['trec'], item['track']) in no_input:
-        input_url = None
-    else:
-        input = make_input(item) 
-        input_url = make_input_url(item, input)
+# TREC-3 appendix_url
+def appendix_url_trec3(item, appendix, appendix_url):
+    appendix_url = 'https://trec.nist.gov/pubs/trec3/appendices/A/{}.list.graphs.ps.gz'.format(item['track'])
+    return appendix_url
+
+
+# TREC-2 appendix_url
+def appendix_url_trec2(item, appendix, appendix_url):
+    appendix_url = 'https://trec.nist.gov/pubs/trec2/appendices/A.txt'
+    return appendix_url
+
+
+# fix-ups of the appendix url of a run, with the (trec, track) pairs they apply to
+appendix_url_rules = [
+    (appendix_url_trec33, lambda trec, track: trec == 'trec33'),
+    (appendix_url_trec_covid, lambda trec, track: trec == 'trec-covid'),
+    (appendix_url_trec26, lambda trec, track: trec == 'trec26' and track in ['domain', 'open']),
+    (appendix_url_trec25, lambda trec, track: trec == 'trec25' and track in ['realtime', 'open', 'domain']),
+    (appendix_url_trec20, lambda trec, track: trec == 'trec20' and track == 'entity'),
+    (appendix_url_trec19, lambda trec, track: trec == 'trec19' and track in ['blog', 'chemical', 'legal', 'web']),
+    (appendix_url_trec18, lambda trec, track: trec == 'trec18' and track in ['chemical', 'entity', 'legal', 'million-query', 'web', 'blog']),
+    (appendix_url_trec17, lambda trec, track: trec == 'trec17' and track in ['blog', 'million-query', 'enterprise', 'relfdbk', 'legal']),
+    (appendix_url_trec16, lambda trec, track: trec == 'trec16'),
+    (appendix_url_trec15, lambda trec, track: trec == 'trec15' and track in ['blog', 'enterprise', 'terabyte', 'genomics', 'legal', 'qa', 'spam']),
+    (appendix_url_trec14, lambda trec, track: trec == 'trec14' and track in ['enterprise', 'terabyte', 'genomics', 'HARD', 'qa', 'robust', 'spam']),
+    (appendix_url_trec13, lambda trec, track: trec == 'trec13' and track in ['novelty', 'qa', 'robust', 'hard', 'HARD', 'genomics', 'terabyte', 'web']),
+    (appendix_url_trec12, lambda trec, track: trec == 'trec12' and track in ['genomics', 'hard', 'novelty', 'robust', 'web', 'qa']),
+    (appendix_url_trec11, lambda trec, track: trec == 'trec11' and track in ['xlingual', 'filtering', 'novelty', 'qa', 'web', 'video']),
+    (appendix_url_trec10, lambda trec, track: trec == 'trec10' and track in ['xlingual', 'filtering', 'qa', 'web', 'video']),
+    (appendix_url_trec9, lambda trec, track: trec == 'trec9' and track in ['xlingual', 'filtering', 'interactive', 'qa', 'sdr', 'web', 'query']),
+    (appendix_url_trec8, lambda trec, track: trec == 'trec8' and track in ['adhoc', 'girt', 'xlingual', 'filtering', 'interactive', 'qa', 'sdr', 'web']),
+    (appendix_url_trec7, lambda trec, track: trec == 'trec7' and track in ['adhoc', 'xlingual', 'hp', 'query', 'sdr', 'filtering']),
+    (appendix_url_trec6, lambda trec, track: trec == 'trec6' and track in ['adhoc', 'routing', 'chinese', 'clir', 'filtering', 'hp', 'interactive', 'nlp', 'sdr']),
+    (appendix_url_trec5, lambda trec, track: trec == 'trec5' and track in ['adhoc', 'routing', 'Chinese', 'Spanish', 'dbmerge', 'nlp', 'filtering', 'interactive', 'confusion']),
+    (appendix_url_trec4, lambda trec, track: trec == 'trec4' and track in ['adhoc', 'interactive']),
+    (appendix_url_trec3, lambda trec, track: trec == 'trec3'),
+    (appendix_url_trec2, lambda trec, track: trec == 'trec2'),
+]
+
+
+
+def add_input_url(item, input_rules, input_url_rules):
+    # common input
+    input = '.'.join(['input', item['runid'], 'gz'])
+    for rule in input_rules:
+        input = rule(item, input)
+    # common input_url
+    input_url = '/'.join([results_url, item['trec'], item['track'], input])
+    for rule in input_url_rules:
+        input_url = rule(item, input, input_url)
     item['input_url'] = input_url
     return item
 
 
-def add_summary_url(item):
-    if (item['trec'], item['track']) in no_summary:
-        summary_url = None
-    else:
-        summary = make_summary(item)
-        summary_url = make_summary_url(item, summary)
+def add_summary_url(item, summary_rules, summary_url_rules):
+    # common summary
+    summary = '.'.join(['summary', item['runid']])
+    for rule in summary_rules:
+        summary = rule(item, summary)
+    # common summary_url
+    if type(summary) == dict:
+        for k, v in summary.items():
+            summary[k] = '/'.join([results_url, item['trec'], item['track'], v])
+        summary_url = json.dumps(summary)
+    elif summary:
+        summary_url = '/'.join([results_url, item['trec'], item['track'], summary])
+    for rule in summary_url_rules:
+        summary_url = rule(item, summary, summary_url)
     item['summary_url'] = summary_url
     return item
 
 
-def add_appendix_url(item):
-    if (item['trec'], item['track']) in no_appendix:
-        appendix_url = None
-    else:
-        appendix = make_appendix(item) 
-        appendix_url = make_appendix_url(item, appendix) 
+def add_appendix_url(item, appendix_rules, appendix_url_rules):
+    # common appendix
+    appendix = '.'.join([item['runid'], 'pdf'])
+    for rule in appendix_rules:
+        appendix = rule(item, appendix)
+    # common appendix_url
+    appendix_url = 'https://trec.nist.gov/pubs/{0}/appendices/{1}/{2}'.format(item['trec'], item['track'], appendix)
+    for rule in appendix_url_rules:
+        appendix_url = rule(item, appendix, appendix_url)
     item['appendix_url'] = appendix_url
     return item
 
 
+def remove_input_url(item):
+    item['input_url'] = None
+    return item
+
+
+def remove_summary_url(item):
+    item['summary_url'] = None
+    return item
+
+
+def remove_appendix_url(item):
+    item['appendix_url'] = None
+    return item
+
+
 def remove_task(item):
     if item['task'].strip() in no_tasks:
         item['task'] = None
@@ -2399,505 +2861,578 @@ def adjust_email_field(item):
 def adjust_fields(item):
     if item['track'] == 'misinfo' and item['trec'] in ['trec31', 'trec30', 'trec29']:
         item['fields'] = item['of_2']
-    if item['track'] == 'car':
-        item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec27', 'core'):
-        item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec26', 'core'):
-        item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec25', 'recall'):
-        item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec23', 'web'):
-        item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec21', 'microblog'):
-        item['fields'] = None        
-    if (item['trec'], item['track']) == ('trec20', 'crowd'):
-        item['fields'] = None
-    if (item['trec'], item['track']) == ('trec9', 'filtering'):
+    if item['track'] == 'car' or (item['trec'], item['track']) in no_fields:
         item['fields'] = None 
-    if (item['trec'], item['track']) == ('trec5', 'confusion'):
-        item['fields'] = None
     return item 
 
 
-def add_other(item):
-    if (item['trec'], item['track']) == ('trec32', 'atomic'):
-        item['other'] = {
-            'index_cost': item['of_2'],
-            'training_cost': item['of_3'], 
-            'query_cost': item['of_4']
-        }
+def other_trec32_atomic(item):
+    item['other'] = {
+        'index_cost': item['of_2'],
+        'training_cost': item['of_3'], 
+        'query_cost': item['of_4']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec32', 'ikat'):
-        item['other'] = {
-            'training_data': item['merge'],
-            'meta_1': item['of_1'],
-            'meta_2': item['of_2'],
-            'meta_3': item['of_3'],
-            'meta_4': item['of_4'],
-            'meta_5': item['of_5']
-        }
 
-    if (item['trec'], item['track']) == ('trec32', 'tot'):
-        item['other'] = {
-            'external_resources': urllib.parse.unquote(item['of_1'])
-        }
+def other_trec32_ikat(item):
+    item['other'] = {
+        'training_data': item['merge'],
+        'meta_1': item['of_1'],
+        'meta_2': item['of_2'],
+        'meta_3': item['of_3'],
+        'meta_4': item['of_4'],
+        'meta_5': item['of_5']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec32', 'crisis'):
-        item['other'] = {
-            'importance_score': urllib.parse.unquote(item['of_2']),
-            'extractive_abstractive': urllib.parse.unquote(item['of_4']),
-        }
 
-    if (item['trec'], item['track']) == ('trec32', 'neuclir') or \
-        (item['trec'], item['track']) == ('trec31', 'neuclir'):
-        if len(item['of_3'].split('-')) > 1:
-            baseline= item['of_3'].split('-')[1]
-        else:
-            baseline = 'no'      
-        item['other'] = {
-            'baseline': baseline,
-            'rerank': item['of_3'].split('-')[0], 
-            'query_form': item['of_2'],
-            'doc_form': item['of_1']
-        }
-        if item['trec'] == 'trec32':
-            item['other']['time'] = item['merge']
+def other_trec32_tot(item):
+    item['other'] = {
+        'external_resources': urllib.parse.unquote(item['of_1'])
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec32', 'trials') or \
-        (item['trec'], item['track']) == ('trec31', 'trials') or \
-            (item['trec'], item['track']) == ('trec30', 'trials'):
-        item['other'] = {
-            'external_resources': urllib.parse.unquote(item['of_3'])
-        }
 
-    if (item['trec'], item['track']) == ('trec32', 'deep') or \
-        (item['trec'], item['track']) == ('trec31', 'deep'):
-        item['other'] = {
-            'subtask': item['of_1'].split('-')[0],
-            'single_stage': item['of_1'].split('-')[1],
-            'dense_retrieval': item['of_1'].split('-')[2],
-            'baseline': item['of_4'].split('-')[2] ,
-            'dnn_type': item['of_4'].split('-')[1],
-            'training_type': item['merge'],
-            'training_cost': urllib.parse.unquote(item['of_3']),
-            'indexing_cost': urllib.parse.unquote(item['of_2']),
-            'query_processing_cost': urllib.parse.unquote(item['of_5'])
-        }
+def other_trec32_crisis(item):
+    item['other'] = {
+        'importance_score': urllib.parse.unquote(item['of_2']),
+        'extractive_abstractive': urllib.parse.unquote(item['of_4']),
+    }
+    return item
 
 
-    if (item['trec'], item['track']) == ('trec31', 'crisis'):
-        item['other'] = {
-            'trec_is_labels': item['of_1'],
-            'method_info': urllib.parse.unquote(item['of_2']),
-            'streams': item['of_3'],
-            'extractive_abstractive': item['of_4']
-        }
+def other_trec32_trec31_neuclir(item):
+    if len(item['of_3'].split('-')) > 1:
+        baseline= item['of_3'].split('-')[1]
+    else:
+        baseline = 'no'      
+    item['other'] = {
+        'baseline': baseline,
+        'rerank': item['of_3'].split('-')[0], 
+        'query_form': item['of_2'],
+        'doc_form': item['of_1']
+    }
+    if item['trec'] == 'trec32':
+        item['other']['time'] = item['merge']
+    return item
 
-    if (item['trec'], item['track']) == ('trec31', 'cast'):
-        if item['task'] == 'primary':
-            item['other'] = {
-                'query_understanding_method': item['of_1'],
-                'query_understanding_data': item['of_2'],
-                'ranking_method': item['of_3'],
-                'ranking_data': item['of_4'],
-                'response_generation': item['of_5'].split('-')[1],
-                'initiative': item['of_5'].split('-')[0],
-                'external_resources': urllib.parse.unquote(item['merge'])
-            }
-        if item['task'] == 'mixed':
-            item['other'] = {
-                'selective_interaction_method': item['of_1'],
-                'question_selection_method': item['of_2'],
-                'question_selection_context': item['of_3'],
-                'question_ranking_method': item['of_4'],
-                'cast_mixed_data': item['of_5'],
-                'external_resources': urllib.parse.unquote(item['merge'])
-            }
 
-    if (item['trec'], item['track']) == ('trec31', 'fair'):
-        item['other'] = {
-            'method_info': urllib.parse.unquote(item['of_2'])
-        }
+def other_trec32_trec31_trec30_trials(item):
+    item['other'] = {
+        'external_resources': urllib.parse.unquote(item['of_3'])
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec30', 'deep'):
-        item['other'] = {
-            'subtask': item['of_1'].split('-')[0],
-            'single_stage': item['of_1'].split('-')[1],
-            'dense_retrieval': item['of_1'].split('-')[2],
-            'dnn_type': item['of_4'].split('-')[1],
-            'training_type': item['merge'],
-            'training_cost': urllib.parse.unquote(item['of_3']),
-            'indexing_cost': urllib.parse.unquote(item['of_2']),
-            'query_processing_cost': urllib.parse.unquote(item['of_5'])
-        }
 
-    if (item['trec'], item['track']) == ('trec29', 'deep'):
-        item['other'] = {
-            'subtask': item['of_1'].split('-')[0],
-            'dnn_type': item['of_2'],
-            'training_type': item['of_3'],
-            'training_cost': urllib.parse.unquote(item['merge']),
-            'orcas': item['of_5']
-        }
+def other_trec32_trec31_deep(item):
+    item['other'] = {
+        'subtask': item['of_1'].split('-')[0],
+        'single_stage': item['of_1'].split('-')[1],
+        'dense_retrieval': item['of_1'].split('-')[2],
+        'baseline': item['of_4'].split('-')[2] ,
+        'dnn_type': item['of_4'].split('-')[1],
+        'training_type': item['merge'],
+        'training_cost': urllib.parse.unquote(item['of_3']),
+        'indexing_cost': urllib.parse.unquote(item['of_2']),
+        'query_processing_cost': urllib.parse.unquote(item['of_5'])
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec28', 'deep'):
-        item['other'] = {
-            'subtask': item['of_1'].split('-')[0],
-            'dnn_type': item['of_2'],
-            'training_type': item['of_3'],
-        }
 
-    if (item['trec'], item['track']) == ('trec30', 'incident'):
-            item['other'] = {
-                'meta_1': item['of_2'],
-                'meta_2': item['of_3'],
-                'meta_3': item['of_4']
-            }
+def other_trec31_crisis(item):
+    item['other'] = {
+        'trec_is_labels': item['of_1'],
+        'method_info': urllib.parse.unquote(item['of_2']),
+        'streams': item['of_3'],
+        'extractive_abstractive': item['of_4']
+    }
+    return item
+
 
-    if (item['trec'], item['track']) == ('trec30', 'cast') or \
-        (item['trec'], item['track']) == ('trec29', 'cast'):
+def other_trec31_cast(item):
+    if item['task'] == 'primary':
         item['other'] = {
             'query_understanding_method': item['of_1'],
             'query_understanding_data': item['of_2'],
-            'query_understanding_data_info': urllib.parse.unquote(item['merge']),
             'ranking_method': item['of_3'],
             'ranking_data': item['of_4'],
-            'question_selection_context': item['of_5']  
+            'response_generation': item['of_5'].split('-')[1],
+            'initiative': item['of_5'].split('-')[0],
+            'external_resources': urllib.parse.unquote(item['merge'])
         }
+    if item['task'] == 'mixed':
+        item['other'] = {
+            'selective_interaction_method': item['of_1'],
+            'question_selection_method': item['of_2'],
+            'question_selection_context': item['of_3'],
+            'question_ranking_method': item['of_4'],
+            'cast_mixed_data': item['of_5'],
+            'external_resources': urllib.parse.unquote(item['merge'])
+        }
+    return item
 
-    if (item['trec'], item['track']) == ('trec30', 'podcast') or \
-        (item['trec'], item['track']) == ('trec29', 'podcast') :
-        if item['task'] == 'retrieval': 
-            item['other'] = {
-                'training_data': item['of_1'],
-                'ranking_method': item['of_2'],
-                'method_info': item['of_5']
-            }
-        if item['task'] == 'summarization': 
-            item['other'] = {
-                'training_data': item['of_1'],
-                'summarization_method': item['of_3'],
-                'summarization_model': item['of_4'],
-                'method_info': item['of_5']
-            }
 
-    if (item['trec'], item['track']) == ('trec29', 'incident'):
-        if item['type'] == 'auto':
-            item['other'] = {
-                'meta_1': item['of_2'],
-                'meta_2': item['of_3']
-            }
+def other_trec31_fair(item):
+    item['other'] = {
+        'method_info': urllib.parse.unquote(item['of_2'])
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec29', 'pm') or \
-        (item['trec'], item['track']) == ('trec28', 'pm'):
-            item['other'] = {
-                'external_resources': urllib.parse.unquote(item['of_3'])
-            }
 
-    if (item['trec'], item['track']) == ('trec28', 'cast'):
-        item['other'] = {
-            'query_understanding_method': item['of_1'],
-            'ranking_method': item['of_2'], 
-            'question_selection_context':  item['of_3'],
-            'external_resources': urllib.parse.unquote(item['of_4'])
-        }
+def other_trec30_deep(item):
+    item['other'] = {
+        'subtask': item['of_1'].split('-')[0],
+        'single_stage': item['of_1'].split('-')[1],
+        'dense_retrieval': item['of_1'].split('-')[2],
+        'dnn_type': item['of_4'].split('-')[1],
+        'training_type': item['merge'],
+        'training_cost': urllib.parse.unquote(item['of_3']),
+        'indexing_cost': urllib.parse.unquote(item['of_2']),
+        'query_processing_cost': urllib.parse.unquote(item['of_5'])
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec28', 'fair'):
-        item['other'] = {
-            'external_resources': urllib.parse.unquote(item['of_2'])
-        }
 
-    if (item['trec'], item['track']) == ('trec28', 'incident') or \
-        (item['trec'], item['track']) == ('trec27', 'incident'):
-            item['other'] = {
-                'meta_1': item['of_2'],
-                'meta_2': item['of_3']
-            }
+def other_trec29_deep(item):
+    item['other'] = {
+        'subtask': item['of_1'].split('-')[0],
+        'dnn_type': item['of_2'],
+        'training_type': item['of_3'],
+        'training_cost': urllib.parse.unquote(item['merge']),
+        'orcas': item['of_5']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec27', 'core'):
-        item['other'] = {
-            'judged': item['fields']
-        }
 
-    if (item['trec'], item['track']) == ('trec26', 'core'):
-        item['other'] = {
-            'judged': item['fields'],
-            'round': item['of_2'],
-            'existing_judgments': item['of_4']
-        }
+def other_trec28_deep(item):
+    item['other'] = {
+        'subtask': item['of_1'].split('-')[0],
+        'dnn_type': item['of_2'],
+        'training_type': item['of_3'],
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec25', 'recall'):
-            item['other'] = {
-                'call_your_shot': urllib.parse.unquote(item['fields'])
-            }
 
-    if (item['trec'], item['track']) == ('trec25', 'context') or \
-        (item['trec'], item['track']) == ('trec24', 'context') :
-            item['other'] = {
-                'external_resources': item['of_2']
-            }
+def other_trec30_incident(item):
+    item['other'] = {
+        'meta_1': item['of_2'],
+        'meta_2': item['of_3'],
+        'meta_3': item['of_4']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec23', 'context') or \
-        (item['trec'], item['track']) == ('trec22', 'context') :
-            item['other'] = {
-                'main_data_source': item['type'],
-                'secondary_data_source': item['of_1']
-            }
 
-    if (item['trec'], item['track']) == ('trec23', 'tempsumm') or \
-        (item['trec'], item['track']) == ('trec22', 'tempsumm'):
-        item['other'] = {
-            'meta_1': item['of_1']
-        }
+def other_trec30_trec29_cast(item):
+    item['other'] = {
+        'query_understanding_method': item['of_1'],
+        'query_understanding_data': item['of_2'],
+        'query_understanding_data_info': urllib.parse.unquote(item['merge']),
+        'ranking_method': item['of_3'],
+        'ranking_data': item['of_4'],
+        'question_selection_context': item['of_5']  
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec21', 'context'):
-        item['other'] = {
-            'evaluation_focus': item['type']
-        }
 
-    if (item['trec'], item['track']) == ('trec20', 'entity'):
+def other_trec30_trec29_podcast(item):
+    if item['task'] == 'retrieval': 
         item['other'] = {
-            'wiki_special_use': item['of_1'],
-            'resources': item['of_2'],
-            'used_other_resources': item['of_3'],
-            'target_entity_field': item['of_4']
+            'training_data': item['of_1'],
+            'ranking_method': item['of_2'],
+            'method_info': item['of_5']
         }
-
-    if (item['trec'], item['track']) == ('trec20', 'crowd'):
+    if item['task'] == 'summarization': 
         item['other'] = {
-            'resources': item['fields']
+            'training_data': item['of_1'],
+            'summarization_method': item['of_3'],
+            'summarization_model': item['of_4'],
+            'method_info': item['of_5']
         }
+    return item
 
-    if (item['trec'], item['track']) == ('trec19', 'entity'):
-        item['other'] = {
-            'wiki_special_use': item['of_1'],
-            'resources': item['of_2'],
-            'used_other_resources': item['of_3']
-        }
 
-    if (item['trec'], item['track']) == ('trec18', 'entity'):
+def other_trec29_incident(item):
+    if item['type'] == 'auto':
         item['other'] = {
-            'wiki_special_use': item['of_1'],
-            'resources': urllib.parse.unquote(item['of_2']),
-            'used_other_resources': item['of_3']
+            'meta_1': item['of_2'],
+            'meta_2': item['of_3']
         }
+    return item
 
-    if (item['trec'], item['track']) == ('trec18', 'million-query'):
-        item['other'] = {
-            'doc_fields': item['of_1'],
-            'external_resources': item['of_2']
-        }
 
-    if (item['trec'], item['track']) == ('trec17', 'million-query'):
-        item['other'] = {
-            'doc_fields': item['of_1'],
-            'external_resources': item['of_2']
-        }
+def other_trec29_trec28_pm(item):
+    item['other'] = {
+        'external_resources': urllib.parse.unquote(item['of_3'])
+    }
+    return item
+
+
+def other_trec28_cast(item):
+    item['other'] = {
+        'query_understanding_method': item['of_1'],
+        'ranking_method': item['of_2'], 
+        'question_selection_context':  item['of_3'],
+        'external_resources': urllib.parse.unquote(item['of_4'])
+    }
+    return item
+
+
+def other_trec28_fair(item):
+    item['other'] = {
+        'external_resources': urllib.parse.unquote(item['of_2'])
+    }
+    return item
+
+
+def other_trec28_trec27_incident(item):
+    item['other'] = {
+        'meta_1': item['of_2'],
+        'meta_2': item['of_3']
+    }
+    return item
+
+
+def other_trec27_core(item):
+    item['other'] = {
+        'judged': item['fields']
+    }
+    return item
+
+
+def other_trec26_core(item):
+    item['other'] = {
+        'judged': item['fields'],
+        'round': item['of_2'],
+        'existing_judgments': item['of_4']
+    }
+    return item
+
+
+def other_trec25_recall(item):
+    item['other'] = {
+        'call_your_shot': urllib.parse.unquote(item['fields'])
+    }
+    return item
+
+
+def other_trec25_trec24_context(item):
+    item['other'] = {
+        'external_resources': item['of_2']
+    }
+    return item
+
+
+def other_trec23_trec22_context(item):
+    item['other'] = {
+        'main_data_source': item['type'],
+        'secondary_data_source': item['of_1']
+    }
+    return item
+
+
+def other_trec23_trec22_tempsumm(item):
+    item['other'] = {
+        'meta_1': item['of_1']
+    }
+    return item
+
+
+def other_trec21_context(item):
+    item['other'] = {
+        'evaluation_focus': item['type']
+    }
+    return item
+
+
+def other_trec20_entity(item):
+    item['other'] = {
+        'wiki_special_use': item['of_1'],
+        'resources': item['of_2'],
+        'used_other_resources': item['of_3'],
+        'target_entity_field': item['of_4']
+    }
+    return item
+
+
+def other_trec20_crowd(item):
+    item['other'] = {
+        'resources': item['fields']
+    }
+    return item
+
+
+def other_trec19_entity(item):
+    item['other'] = {
+        'wiki_special_use': item['of_1'],
+        'resources': item['of_2'],
+        'used_other_resources': item['of_3']
+    }
+    return item
+
+
+def other_trec18_entity(item):
+    item['other'] = {
+        'wiki_special_use': item['of_1'],
+        'resources': urllib.parse.unquote(item['of_2']),
+        'used_other_resources': item['of_3']
+    }
+    return item
+
+
+def other_trec18_million_query(item):
+    item['other'] = {
+        'doc_fields': item['of_1'],
+        'external_resources': item['of_2']
+    }
+    return item
+
+
+def other_trec17_million_query(item):
+    item['other'] = {
+        'doc_fields': item['of_1'],
+        'external_resources': item['of_2']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec17', 'relfdbk'):
-        item['other'] = {
-            'feedback_set': item['task']
-        }
 
-    if (item['trec'], item['track']) == ('trec17', 'enterprise'):
+def other_trec17_relfdbk(item):
+    item['other'] = {
+        'feedback_set': item['task']
+    }
+    return item
+
+
+def other_trec17_enterprise(item):
+    item['other'] = {
+        'external_resources': item['of_1']
+    }
+    return item
+
+
+def other_trec16_million_query(item):
+    item['other'] = {
+        'doc_fields': item['of_1'],
+        'external_resources': item['of_2']
+    }
+    return item
+
+
+def other_trec16_qa(item):
+    if item['task'] == 'ciqa_final':
         item['other'] = {
-            'external_resources': item['of_1']
+            'baseline': item['of_2'],
+            'interaction_form': item['of_3']
         }
-
-    if (item['trec'], item['track']) == ('trec16', 'million-query'):
+    if item['task'] == 'ciqa_urlfile':
         item['other'] = {
-            'doc_fields': item['of_1'],
-            'external_resources': item['of_2']
+            'external_resources': item['of_5']
         }
+    return item
 
-    if (item['trec'], item['track']) == ('trec16', 'qa'):
-        if item['task'] == 'ciqa_final':
-            item['other'] = {
-                'baseline': item['of_2'],
-                'interaction_form': item['of_3']
-            }
-        if item['task'] == 'ciqa_urlfile':
-            item['other'] = {
-                'external_resources': item['of_5']
-            }
-
-    if (item['trec'], item['track']) == ('trec16', 'spam') or \
-        (item['trec'], item['track']) == ('trec15', 'spam'):
-            if item['task'] != 'run':
-                item['other'] = {
-                    'os': item['of_1'],
-                    'system_requirements': item['of_2']
-                }
 
-    if (item['trec'], item['track']) == ('trec16', 'enterprise') or \
-        (item['trec'], item['track']) == ('trec15', 'enterprise'):
+def other_trec16_trec15_spam(item):
+    if item['task'] != 'run':
         item['other'] = {
-            'external_resources': item['of_1']
+            'os': item['of_1'],
+            'system_requirements': item['of_2']
         }
+    return item
 
-    if (item['trec'], item['track']) == ('trec15', 'terabyte'):
-        try:
-            item['other'] = {
-                'links_anchor_struct': item['of_4'],
-                'time_index': item['of_2'].split('-')[0],
-                'time_top20': item['of_2'].split('-')[1],
-                'time_total': item['of_2'].split('-')[2],
-                'time_total_cpu': item['of_2'].split('-')[3],
-                'size': item['of_2'].split('-')[4],
-                'num_cpu': item['of_1'].split('-')[1],
-                'ram': item['of_1'].split('-')[2],
-                'system_cost': item['of_1'].split('-')[4],
-                'system_purchase': item['of_1'].split('-')[3],
-                'os': item['of_1'].split('-')[5],
-                'collection_percent': item['of_1'].split('-')[0]
-            }  
-        except:
-            pass
 
-    if (item['trec'], item['track']) == ('trec14', 'terabyte'):
+def other_trec16_trec15_enterprise(item):
+    item['other'] = {
+        'external_resources': item['of_1']
+    }
+    return item
+
+
+def other_trec15_terabyte(item):
+    try:
         item['other'] = {
             'links_anchor_struct': item['of_4'],
             'time_index': item['of_2'].split('-')[0],
             'time_top20': item['of_2'].split('-')[1],
             'time_total': item['of_2'].split('-')[2],
-            'size': item['of_5'],
-            'num_cpu': item['of_3'].split('-')[0],
-            'ram': item['of_3'].split('-')[1],
-            'system_cost': item['description'].split('-')[1],
-            'system_purchase': item['description'].split('-')[0],
-            'collection_percent': item['of_1']
-        }        
-
-    if (item['trec'], item['track']) == ('trec14', 'spam'):
-        if item['task'] != 'run':
-            item['other'] = {
-                'configuration_command': item['of_1'],
-                'system_requirements': item['of_2']
-            }
+            'time_total_cpu': item['of_2'].split('-')[3],
+            'size': item['of_2'].split('-')[4],
+            'num_cpu': item['of_1'].split('-')[1],
+            'ram': item['of_1'].split('-')[2],
+            'system_cost': item['of_1'].split('-')[4],
+            'system_purchase': item['of_1'].split('-')[3],
+            'os': item['of_1'].split('-')[5],
+            'collection_percent': item['of_1'].split('-')[0]
+        }  
+    except:
+        pass
+    return item
+
+
+def other_trec14_terabyte(item):
+    item['other'] = {
+        'links_anchor_struct': item['of_4'],
+        'time_index': item['of_2'].split('-')[0],
+        'time_top20': item['of_2'].split('-')[1],
+        'time_total': item['of_2'].split('-')[2],
+        'size': item['of_5'],
+        'num_cpu': item['of_3'].split('-')[0],
+        'ram': item['of_3'].split('-')[1],
+        'system_cost': item['description'].split('-')[1],
+        'system_purchase': item['description'].split('-')[0],
+        'collection_percent': item['of_1']
+    }        
+    return item
+
 
-    if (item['trec'], item['track']) == ('trec13', 'terabyte'):
+def other_trec14_spam(item):
+    if item['task'] != 'run':
         item['other'] = {
-            'links_anchor_struct': item['task'],
-            'time_index': item['of_2'].split('-')[0],
-            'time_top20': item['of_2'].split('-')[1],
-            'ram': item['of_4'],
-            'size': item['of_5'],
-            'system_cost': item['description']
-        }   
+            'configuration_command': item['of_1'],
+            'system_requirements': item['of_2']
+        }
+    return item
+
+
+def other_trec13_terabyte(item):
+    item['other'] = {
+        'links_anchor_struct': item['task'],
+        'time_index': item['of_2'].split('-')[0],
+        'time_top20': item['of_2'].split('-')[1],
+        'ram': item['of_4'],
+        'size': item['of_5'],
+        'system_cost': item['description']
+    }   
+    return item
+
+
+def other_trec13_robust(item):
+    item['other'] = {
+        'optimized': item['of_1'],
+        'optimized_measures': item['of_2'],
+    }   
+    return item
+
+
+def other_trec13_novelty(item):
+    item['other'] = {
+        'external_resources': item['of_1'],
+        'term_expansion': item['of_2'].split('-')[0],
+        'adaptive_threshold': item['of_2'].split('-')[1],
+        'adaptive_term_model': item['of_2'].split('-')[2],
+        'modeled_sentence_as': item['of_4'],
+        'model_features': item['of_5']
+    }
+    return item
+
+
+def other_trec12_robust(item):
+    item['other'] = {
+        'optimized': item['of_1']
+    }
+    return item
+
+
+def other_trec12_novelty(item):
+    item['other'] = {
+        'external_resources': item['of_1']
+    }
+    return item
+
+
+def other_trec11_xlingual(item):
+    item['other'] = {
+        'stemming_resources': item['of_1'],
+        'translation_resources': item['of_2'],
+        'dictionary_resources': item['of_3'],
+        'parallel_corpus_resources': item['of_4'],
+    }
+    return item
+
+
+def other_trec11_novelty(item):
+    item['other'] = {
+        'external_resources': item['of_3'],
+        'external_resources_description': item['of_4']
+    }
+    return item
+
+
+def other_trec9_sdr(item):
+    item['other'] = {
+        'language_model': item['of_1'],
+        'boundaries': item['of_2'],
+        'non_lexical_other_info_used': item['of_3']
+    }
+    return item
+
+
+def other_trec9_xlingual(item):
+    item['other'] = {
+        'monolingual': item['of_5']
+    }
+    return item
+
 
-    if (item['trec'], item['track']) == ('trec13', 'robust'):
-        item['other'] = {
-            'optimized': item['of_1'],
-            'optimized_measures': item['of_2'],
-        }   
+def other_trec9_trec8_qa(item):
+    item['other'] = {
+        'maximum_answer_length': item['task']
+    }
+    return item
 
-    if item['trec'] == 'trec13' and item['track'] == 'novelty':
-        item['other'] = {
-            'external_resources': item['of_1'],
-            'term_expansion': item['of_2'].split('-')[0],
-            'adaptive_threshold': item['of_2'].split('-')[1],
-            'adaptive_term_model': item['of_2'].split('-')[2],
-            'modeled_sentence_as': item['of_4'],
-            'model_features': item['of_5']
-        }
 
-    if (item['trec'], item['track']) == ('trec12', 'robust'):
-        item['other'] = {
-            'optimized': item['of_1']
-        }
+def other_trec8_web(item):
+    item['other'] = {
+        'information_used': item['task']
+    }
+    return item
 
-    if item['trec'] == 'trec12' and item['track'] == 'novelty':
-        item['other'] = {
-            'external_resources': item['of_1']
-        }
 
-    if (item['trec'], item['track']) == ('trec11', 'xlingual'):
-        item['other'] = {
-            'stemming_resources': item['of_1'],
-            'translation_resources': item['of_2'],
-            'dictionary_resources': item['of_3'],
-            'parallel_corpus_resources': item['of_4'],
-        }
+def other_trec8_sdr(item):
+    item['other'] = {
+        'language_model': item['task']
+    }
+    return item
 
-    if item['trec'] == 'trec11' and item['track'] == 'novelty':
-        item['other'] = {
-            'external_resources': item['of_3'],
-            'external_resources_description': item['of_4']
-        }
 
-    if (item['trec'], item['track']) == ('trec9', 'sdr'):
-        item['other'] = {
-            'language_model': item['of_1'],
-            'boundaries': item['of_2'],
-            'non_lexical_other_info_used': item['of_3']
-        }
+def other_trec8_girt_xlingual(item):
+    item['other'] = {
+        'topic_language': item['task']
+    }
+    return item
 
-    if (item['trec'], item['track']) == ('trec9', 'xlingual'):
-        item['other'] = {
-            'monolingual': item['of_5']
-        }
-           
-    if (item['trec'], item['track']) == ('trec9', 'qa') or \
-        (item['trec'], item['track']) == ('trec8', 'qa'):
-        item['other'] = {
-            'maximum_answer_length': item['task']
-        }
 
-    if (item['trec'], item['track']) == ('trec8', 'web'):
-        item['other'] = {
-            'information_used': item['task']
-        }
+def other_rts_realtime(item):
+    if item['trec'] in ['trec27', 'trec26', 'trec25']:
+        if item['task'] == 'b':
+            item['other'] = {
+                'external_resources': item['of_2'],
+                'linked_documents': item['of_3']
+            }
+    return item
 
-    if (item['trec'], item['track']) == ('trec8', 'sdr'):
-        item['other'] = {
-            'language_model': item['task']
-        }
-        
-    if (item['trec'], item['track']) == ('trec8', 'girt') or \
-        (item['trec'], item['track']) == ('trec8', 'xlingual') :
+
+def other_legal(item):
+    if item['trec'] == 'trec20':
         item['other'] = {
-            'topic_language': item['task']
+            'external_resources' : item['fields'],
+            'hours_configuring': item['of_1'].split('-')[0],
+            'hours_searching': item['of_1'].split('-')[1],
+            'hours_reviewing': item['of_1'].split('-')[2],
+            'hours_analyzing': item['of_1'].split('-')[3],
+            'other_resources' : item['of_3'],
+            'ranking_method': item['of_4'],
+            'probabilty': item['of_5'],
         }
-
-    if item['track'] in ['rts', 'realtime']:
-        if item['trec'] in ['trec27', 'trec26', 'trec25']:
-            if item['task'] == 'b':
-                item['other'] = {
-                    'external_resources': item['of_2'],
-                    'linked_documents': item['of_3']
-                }
-
-    if item['track'] == 'legal':
-        if item['trec'] == 'trec20':
+    if item['trec'] == 'trec19':
+        if item['task'] == 'learning':
             item['other'] = {
                 'external_resources' : item['fields'],
-                'hours_configuring': item['of_1'].split('-')[0],
-                'hours_searching': item['of_1'].split('-')[1],
-                'hours_reviewing': item['of_1'].split('-')[2],
-                'hours_analyzing': item['of_1'].split('-')[3],
                 'other_resources' : item['of_3'],
                 'ranking_method': item['of_4'],
                 'probabilty': item['of_5'],
             }
-        if item['trec'] == 'trec19':
-            if item['task'] == 'learning':
-                item['other'] = {
-                    'external_resources' : item['fields'],
-                    'other_resources' : item['of_3'],
-                    'ranking_method': item['of_4'],
-                    'probabilty': item['of_5'],
-                }
-        if item['trec'] == 'trec18':
-            if item['task'] == 'batch':
-                item['other'] = {
-                    'doc_fields' : item['of_1'],
-                    'used_boolean_ref_run' : item['of_2'],
-                    'baseline': item['of_3'],
-                    'doc_review': item['of_4'],
-                    'baseline_name': item['of_5']
-                }
-        if item['trec'] == 'trec17':
+    if item['trec'] == 'trec18':
+        if item['task'] == 'batch':
             item['other'] = {
                 'doc_fields' : item['of_1'],
                 'used_boolean_ref_run' : item['of_2'],
@@ -2905,178 +3440,335 @@ def add_other(item):
                 'doc_review': item['of_4'],
                 'baseline_name': item['of_5']
             }
-        if item['trec'] == 'trec16':
-            item['other'] = {
-                'doc_fields': item['of_1'],
-                'reference_run': item['of_2']
-            }
-            if item['task'] == 'routing':
-                item['other']['qrels_2006'] = item['of_3']
-        if item['trec'] == 'trec15':
-            item['other'] = {
-                'doc_fields': item['of_1']
-            }
-
-    if item['track'] == 'decisions':
+    if item['trec'] == 'trec17':
+        item['other'] = {
+            'doc_fields' : item['of_1'],
+            'used_boolean_ref_run' : item['of_2'],
+            'baseline': item['of_3'],
+            'doc_review': item['of_4'],
+            'baseline_name': item['of_5']
+        }
+    if item['trec'] == 'trec16':
+        item['other'] = {
+            'doc_fields': item['of_1'],
+            'reference_run': item['of_2']
+        }
+        if item['task'] == 'routing':
+            item['other']['qrels_2006'] = item['of_3']
+    if item['trec'] == 'trec15':
         item['other'] = {
-            'meta_1': item['of_2']
+            'doc_fields': item['of_1']
         }
+    return item
 
-    if item['track'] == 'web':
-        if item['trec'] in ['trec23', 'trec22', 'trec21', 'trec20', 'trec19', 'trec18']:
-            item['other'] = {
-                'external_resources': item['of_2'],
-                'collection_category': item['of_1']
-            }
-        if item['trec'] in ['trec23', 'trec22']:
-            item['other']['optimized_metric'] = item['of_3']
 
-        if item['trec'] in ['trec13']:
-            item['other'] = {
-                'doc_struct': item['of_2'],
-                'anchor_text': item['of_1'].split('-')[0],
-                'link_struct':  item['of_1'].split('-')[1],
-                'url_length': item['of_3'].split('-')[0],
-                'url_features': item['of_3'].split('-')[1],
-                'query_processing': item['of_4']
-            }
+def other_decisions(item):
+    item['other'] = {
+        'meta_1': item['of_2']
+    }
+    return item
 
-        if item['trec'] in ['trec12', 'trec11', 'trec10']:
-            item['other'] = {
-                'doc_struct': item['of_1'],
-                'anchor_text': item['of_2'],
-                'link_struct': item['of_3']
-            }
 
-    if item['track'] == 'federated':
+def other_web(item):
+    if item['trec'] in ['trec23', 'trec22', 'trec21', 'trec20', 'trec19', 'trec18']:
         item['other'] = {
             'external_resources': item['of_2'],
-            'used_resources': item['of_1']
+            'collection_category': item['of_1']
         }
+    if item['trec'] in ['trec23', 'trec22']:
+        item['other']['optimized_metric'] = item['of_3']
 
-    if item['track'] == 'kba':
-        item['other'] = {
-            'kba_corpus': item['of_1']
-        }
-        if item['trec'] == 'trec23':
-            item['other']['method_info'] = urllib.parse.unquote(item['of_5'])
-        
-    if item['track'] == 'task':
+    if item['trec'] in ['trec13']:
         item['other'] = {
-            'external_resources': item['type'],
-            'collection_category': item['of_2']
+            'doc_struct': item['of_2'],
+            'anchor_text': item['of_1'].split('-')[0],
+            'link_struct':  item['of_1'].split('-')[1],
+            'url_length': item['of_3'].split('-')[0],
+            'url_features': item['of_3'].split('-')[1],
+            'query_processing': item['of_4']
         }
 
-    if item['track'] == 'microblog':
+    if item['trec'] in ['trec12', 'trec11', 'trec10']:
         item['other'] = {
-            'external_resources': item['of_2'],
-            'linked_documents': item['of_3']    
+            'doc_struct': item['of_1'],
+            'anchor_text': item['of_2'],
+            'link_struct': item['of_3']
         }
-        if item['trec'] in ['trec21', 'trec20']:
-            item['other']['crawl_indexed'] = item['of_1']
-            item['other']['realtime_constraints'] = item['of_2']
-        if item['trec'] in ['trec21']:
-            item['other']['crawl_date'] = item['fields']
-            item['other']['num_200_301_tweets'] = item['of_5']
+    return item
 
-    if item['track'] == 'filtering':
-        if item['trec'] in ['trec11', 'trec10', 'trec9']:
-            item['other'] = {
-                'trec_data': item['of_1'],
-                'reuters_data': item['of_2'],
-                'other_data': item['of_3']
-            }
-            if item['task'] == 'batch' or item['trec'] in ['trec11', 'trec10', 'trec9']:
-                item['other']['optimized_for'] = item['of_5']
-            if item['trec'] == 'trec9':
-                item['other']['topic_set'] = item['fields']
 
-    if item['track'] == 'session':
-        item['other'] = {
-            'collection_category': item['of_1'] 
-        }
+def other_federated(item):
+    item['other'] = {
+        'external_resources': item['of_2'],
+        'used_resources': item['of_1']
+    }
+    return item
 
-    if item['track'] == 'blog':
+
+def other_kba(item):
+    item['other'] = {
+        'kba_corpus': item['of_1']
+    }
+    if item['trec'] == 'trec23':
+        item['other']['method_info'] = urllib.parse.unquote(item['of_5'])
+    return item
+
+
+def other_task(item):
+    item['other'] = {
+        'external_resources': item['type'],
+        'collection_category': item['of_2']
+    }
+    return item
+
+
+def other_microblog(item):
+    item['other'] = {
+        'external_resources': item['of_2'],
+        'linked_documents': item['of_3']    
+    }
+    if item['trec'] in ['trec21', 'trec20']:
+        item['other']['crawl_indexed'] = item['of_1']
+        item['other']['realtime_constraints'] = item['of_2']
+    if item['trec'] in ['trec21']:
+        item['other']['crawl_date'] = item['fields']
+        item['other']['num_200_301_tweets'] = item['of_5']
+    return item
+
+
+def other_filtering(item):
+    if item['trec'] in ['trec11', 'trec10', 'trec9']:
         item['other'] = {
-            'doc_fields': item['of_1']
+            'trec_data': item['of_1'],
+            'reuters_data': item['of_2'],
+            'other_data': item['of_3']
         }
-        if item['trec'] == 'trec19':
-            item['other']['baseline'] = item['of_3']
-        if item['trec'] == 'trec17':
-            if item['task'] != 'baseline':
-                item['other']['baseline'] = item['of_2']
-        if item['trec'] == 'trec16':
-            item['other']['external_resources'] = item['of_2']
-
-    if item['track'] in ['hard', 'HARD']:
-        if item['trec'] == 'trec14':
-            item['other'] = {
-                'training_trec_judge': item['of_1']
-            }
-        if item['trec'] in ['trec13', 'trec12']:
-            item['other'] = {
-                'baseline': item['of_1'],
-                'metadata': item['of_2']
-            }
-        if item['trec'] == 'trec13':
-            item['other']['cf'] = item['of_4']
+        if item['task'] == 'batch' or item['trec'] in ['trec11', 'trec10', 'trec9']:
+            item['other']['optimized_for'] = item['of_5']
+        if item['trec'] == 'trec9':
+            item['other']['topic_set'] = item['fields']
+    return item
+
+
+def other_session(item):
+    item['other'] = {
+        'collection_category': item['of_1'] 
+    }
+    return item
+
+
+def other_blog(item):
+    item['other'] = {
+        'doc_fields': item['of_1']
+    }
+    if item['trec'] == 'trec19':
+        item['other']['baseline'] = item['of_3']
+    if item['trec'] == 'trec17':
+        if item['task'] != 'baseline':
+            item['other']['baseline'] = item['of_2']
+    if item['trec'] == 'trec16':
+        item['other']['external_resources'] = item['of_2']
+    return item
+
 
-    if item['track'] == 'news':
+def other_hard(item):
+    if item['trec'] == 'trec14':
         item['other'] = {
-            'external_resources': item['of_2'],
-            'wikipedia': item['of_3']
+            'training_trec_judge': item['of_1']
         }
-
-    if item['track'] == 'car':
+    if item['trec'] in ['trec13', 'trec12']:
         item['other'] = {
-            'external_resources': item['of_2'],
-            'ranking_method': item['of_3'],
-            'run_features': item['fields']
+            'baseline': item['of_1'],
+            'metadata': item['of_2']
         }
+    if item['trec'] == 'trec13':
+        item['other']['cf'] = item['of_4']
+    return item
+
+
+def other_news(item):
+    item['other'] = {
+        'external_resources': item['of_2'],
+        'wikipedia': item['of_3']
+    }
+    return item
+
+
+def other_car(item):
+    item['other'] = {
+        'external_resources': item['of_2'],
+        'ranking_method': item['of_3'],
+        'run_features': item['fields']
+    }
+    return item
+
+
+def other_repository(item):
+    repository = urllib.parse.unquote(item['of_1'])
+    if 'http' in repository:
+        if item.get('other'):
+            item['other']['repository'] = repository
+        else:
+            item['other'] = {'repository': repository}
+    return item
+
+
+# fields of the 'other' column of a run, with the (trec, track) pairs they apply to
+other_rules = [
+    (other_trec32_atomic, lambda trec, track: (trec, track) == ('trec32', 'atomic')),
+    (other_trec32_ikat, lambda trec, track: (trec, track) == ('trec32', 'ikat')),
+    (other_trec32_tot, lambda trec, track: (trec, track) == ('trec32', 'tot')),
+    (other_trec32_crisis, lambda trec, track: (trec, track) == ('trec32', 'crisis')),
+    (other_trec32_trec31_neuclir, lambda trec, track: (trec, track) == ('trec32', 'neuclir') or (trec, track) == ('trec31', 'neuclir')),
+    (other_trec32_trec31_trec30_trials, lambda trec, track: (trec, track) == ('trec32', 'trials') or (trec, track) == ('trec31', 'trials') or (trec, track) == ('trec30', 'trials')),
+    (other_trec32_trec31_deep, lambda trec, track: (trec, track) == ('trec32', 'deep') or (trec, track) == ('trec31', 'deep')),
+    (other_trec31_crisis, lambda trec, track: (trec, track) == ('trec31', 'crisis')),
+    (other_trec31_cast, lambda trec, track: (trec, track) == ('trec31', 'cast')),
+    (other_trec31_fair, lambda trec, track: (trec, track) == ('trec31', 'fair')),
+    (other_trec30_deep, lambda trec, track: (trec, track) == ('trec30', 'deep')),
+    (other_trec29_deep, lambda trec, track: (trec, track) == ('trec29', 'deep')),
+    (other_trec28_deep, lambda trec, track: (trec, track) == ('trec28', 'deep')),
+    (other_trec30_incident, lambda trec, track: (trec, track) == ('trec30', 'incident')),
+    (other_trec30_trec29_cast, lambda trec, track: (trec, track) == ('trec30', 'cast') or (trec, track) == ('trec29', 'cast')),
+    (other_trec30_trec29_podcast, lambda trec, track: (trec, track) == ('trec30', 'podcast') or (trec, track) == ('trec29', 'podcast')),
+    (other_trec29_incident, lambda trec, track: (trec, track) == ('trec29', 'incident')),
+    (other_trec29_trec28_pm, lambda trec, track: (trec, track) == ('trec29', 'pm') or (trec, track) == ('trec28', 'pm')),
+    (other_trec28_cast, lambda trec, track: (trec, track) == ('trec28', 'cast')),
+    (other_trec28_fair, lambda trec, track: (trec, track) == ('trec28', 'fair')),
+    (other_trec28_trec27_incident, lambda trec, track: (trec, track) == ('trec28', 'incident') or (trec, track) == ('trec27', 'incident')),
+    (other_trec27_core, lambda trec, track: (trec, track) == ('trec27', 'core')),
+    (other_trec26_core, lambda trec, track: (trec, track) == ('trec26', 'core')),
+    (other_trec25_recall, lambda trec, track: (trec, track) == ('trec25', 'recall')),
+    (other_trec25_trec24_context, lambda trec, track: (trec, track) == ('trec25', 'context') or (trec, track) == ('trec24', 'context')),
+    (other_trec23_trec22_context, lambda trec, track: (trec, track) == ('trec23', 'context') or (trec, track) == ('trec22', 'context')),
+    (other_trec23_trec22_tempsumm, lambda trec, track: (trec, track) == ('trec23', 'tempsumm') or (trec, track) == ('trec22', 'tempsumm')),
+    (other_trec21_context, lambda trec, track: (trec, track) == ('trec21', 'context')),
+    (other_trec20_entity, lambda trec, track: (trec, track) == ('trec20', 'entity')),
+    (other_trec20_crowd, lambda trec, track: (trec, track) == ('trec20', 'crowd')),
+    (other_trec19_entity, lambda trec, track: (trec, track) == ('trec19', 'entity')),
+    (other_trec18_entity, lambda trec, track: (trec, track) == ('trec18', 'entity')),
+    (other_trec18_million_query, lambda trec, track: (trec, track) == ('trec18', 'million-query')),
+    (other_trec17_million_query, lambda trec, track: (trec, track) == ('trec17', 'million-query')),
+    (other_trec17_relfdbk, lambda trec, track: (trec, track) == ('trec17', 'relfdbk')),
+    (other_trec17_enterprise, lambda trec, track: (trec, track) == ('trec17', 'enterprise')),
+    (other_trec16_million_query, lambda trec, track: (trec, track) == ('trec16', 'million-query')),
+    (other_trec16_qa, lambda trec, track: (trec, track) == ('trec16', 'qa')),
+    (other_trec16_trec15_spam, lambda trec, track: (trec, track) == ('trec16', 'spam') or (trec, track) == ('trec15', 'spam')),
+    (other_trec16_trec15_enterprise, lambda trec, track: (trec, track) == ('trec16', 'enterprise') or (trec, track) == ('trec15', 'enterprise')),
+    (other_trec15_terabyte, lambda trec, track: (trec, track) == ('trec15', 'terabyte')),
+    (other_trec14_terabyte, lambda trec, track: (trec, track) == ('trec14', 'terabyte')),
+    (other_trec14_spam, lambda trec, track: (trec, track) == ('trec14', 'spam')),
+    (other_trec13_terabyte, lambda trec, track: (trec, track) == ('trec13', 'terabyte')),
+    (other_trec13_robust, lambda trec, track: (trec, track) == ('trec13', 'robust')),
+    (other_trec13_novelty, lambda trec, track: trec == 'trec13' and track == 'novelty'),
+    (other_trec12_robust, lambda trec, track: (trec, track) == ('trec12', 'robust')),
+    (other_trec12_novelty, lambda trec, track: trec == 'trec12' and track == 'novelty'),
+    (other_trec11_xlingual, lambda trec, track: (trec, track) == ('trec11', 'xlingual')),
+    (other_trec11_novelty, lambda trec, track: trec == 'trec11' and track == 'novelty'),
+    (other_trec9_sdr, lambda trec, track: (trec, track) == ('trec9', 'sdr')),
+    (other_trec9_xlingual, lambda trec, track: (trec, track) == ('trec9', 'xlingual')),
+    (other_trec9_trec8_qa, lambda trec, track: (trec, track) == ('trec9', 'qa') or (trec, track) == ('trec8', 'qa')),
+    (other_trec8_web, lambda trec, track: (trec, track) == ('trec8', 'web')),
+    (other_trec8_sdr, lambda trec, track: (trec, track) == ('trec8', 'sdr')),
+    (other_trec8_girt_xlingual, lambda trec, track: (trec, track) == ('trec8', 'girt') or (trec, track) == ('trec8', 'xlingual')),
+    (other_rts_realtime, lambda trec, track: track in ['rts', 'realtime'] and trec in ['trec27', 'trec26', 'trec25']),
+    (other_legal, lambda trec, track: track == 'legal' and trec in ['trec20', 'trec19', 'trec18', 'trec17', 'trec16', 'trec15']),
+    (other_decisions, lambda trec, track: track == 'decisions'),
+    (other_web, lambda trec, track: track == 'web' and trec in ['trec23', 'trec22', 'trec21', 'trec20', 'trec19', 'trec18', 'trec13', 'trec12', 'trec11', 'trec10']),
+    (other_federated, lambda trec, track: track == 'federated'),
+    (other_kba, lambda trec, track: track == 'kba'),
+    (other_task, lambda trec, track: track == 'task'),
+    (other_microblog, lambda trec, track: track == 'microblog'),
+    (other_filtering, lambda trec, track: track == 'filtering' and trec in ['trec11', 'trec10', 'trec9']),
+    (other_session, lambda trec, track: track == 'session'),
+    (other_blog, lambda trec, track: track == 'blog'),
+    (other_hard, lambda trec, track: track in ['hard', 'HARD'] and trec in ['trec14', 'trec13', 'trec12']),
+    (other_news, lambda trec, track: track == 'news'),
+    (other_car, lambda trec, track: track == 'car'),
+    (other_repository, lambda trec, track: trec in ['trec24', 'trec25', 'trec26']),
+]
 
-    if item['trec'] in ['trec24', 'trec25', 'trec26']:
-        repository = urllib.parse.unquote(item['of_1'])
-        if 'http' in repository:
-            if item.get('other'):
-                item['other']['repository'] = repository
-            else:
-                item['other'] = {'repository': repository}
 
+def dump_other(item):
     if item.get('other'):
         item['other'] = json.dumps(item['other'])
-    return item 
+    return item
 
 
 def remove_description(item):
-    if item['trec'] == 'trec14' and item['track'] == 'terabyte':
+    if (item['trec'], item['track']) in no_description:
         item['description'] = None
     return item 
 
 
+# fix-ups of a runs table row in the order they are applied, with the (trec, track) pairs they apply to (None for all)
+runs_rules = [
+    (adjust_task_field, lambda trec, track: (trec, track) in task_field_fixes),
+    *description_rules,
+    (parse_description, None),
+    (check_md5, None),
+    (add_input_url, lambda trec, track: (trec, track) not in no_input),
+    (remove_input_url, lambda trec, track: (trec, track) in no_input),
+    (add_summary_url, lambda trec, track: (trec, track) not in no_summary),
+    (remove_summary_url, lambda trec, track: (trec, track) in no_summary),
+    (add_appendix_url, lambda trec, track: (trec, track) not in no_appendix),
+    (remove_appendix_url, lambda trec, track: (trec, track) in no_appendix),
+    *other_rules,
+    (dump_other, None),
+    (adjust_fields, lambda trec, track: track in ['car', 'misinfo'] or (trec, track) in no_fields),
+    (remove_description, lambda trec, track: (trec, track) in no_description),
+    (remove_task, None),
+    (remove_type, None),
+]
+
+# fix-ups of a TREC-COVID runs table row, the rounds have no summaries or other fields
+covid_runs_rules = [
+    *description_rules,
+    (parse_description, None),
+    (check_md5, None),
+    (add_input_url, lambda trec, track: (trec, track) not in no_input),
+    (remove_input_url, lambda trec, track: (trec, track) in no_input),
+    (add_appendix_url, lambda trec, track: (trec, track) not in no_appendix),
+    (remove_appendix_url, lambda trec, track: (trec, track) in no_appendix),
+]
+
+# file name and url rules of the url fix-ups, bound to them for each (trec, track) partition
+url_rules = {
+    add_input_url: {'input_rules': input_rules, 'input_url_rules': input_url_rules},
+    add_summary_url: {'summary_rules': summary_rules, 'summary_url_rules': summary_url_rules},
+    add_appendix_url: {'appendix_rules': appendix_rules, 'appendix_url_rules': appendix_url_rules},
+}
+
+
+def partition_rules(rules, trec, track):
+    # the rules that apply to a (trec, track) partition
+    return tuple(rule for rule, applies in rules if applies is None or applies(trec, track))
+
+
+@lru_cache(maxsize=None)
+def compile_runs_rules(trec, track):
+    # the fix-ups that apply to the rows of a (trec, track) partition, with the partition's file name and url rules
+    compiled = []
+    for rule in partition_rules(covid_runs_rules if trec == 'trec-covid' else runs_rules, trec, track):
+        if rule in url_rules:
+            rule = partial(rule, **{name: partition_rules(rules, trec, track) for name, rules in url_rules[rule].items()})
+        compiled.append(rule)
+    return tuple(compiled)
+
+
 def read_tables(_type='runs'):
-    tables = []
+    # yields the fixed-up rows of the tables one at a time, so that they can be turned into columns in batches
     for i in range(2, 34):
         trec = ''.join(['trec', str(i)])
         table_file = 'runs_table' if _type == 'runs' else 'participants_table'
         table_path = os.path.join('./trec', trec, 'reports', table_file)
-        items = table_list(table_path, _type)
-        for item in items:
+        for item in iter_table(table_path, _type):
             item['trec'] = trec
             item['year'] = trec_year(trec)
             if _type == 'runs':
                 item = rename_track_identifier(item)
-                item = adjust_task_field(item)
-                item = parse_description(item)
-                item = check_md5(item)
-                item = add_input_url(item)
-                item = add_summary_url(item)
-                item = add_appendix_url(item)
-                item = add_other(item)
-
-                item = adjust_fields(item)
-                item = remove_description(item)
-                item = remove_task(item)
-                item = remove_type(item)
+                for rule in compile_runs_rules(trec, item['track']):
+                    item = rule(item)
                 pop_fields(item, _type)
                 # TREC-32 (temporary solution until resources are online)
                 #if trec == 'trec32':
@@ -3086,81 +3778,135 @@ def read_tables(_type='runs'):
             if _type == 'participants':   
                 item = adjust_email_field(item)
                 pop_fields(item, _type)
-        tables += items
+            yield item
     # TREC-COVID
     _type = '-'.join(['covid', _type]) 
     for i in range(1,6):
         trec =  'trec-covid'
         table_path = './trec/trec-covid/round{}/reports/runs_table'.format(str(i))
-        items = table_list(table_path, _type)
-        for item in items:
+        for item in iter_table(table_path, _type):
             item['trec'] = 'trec-covid'
             item['year'] = trec_year(trec)
             if _type == 'covid-runs':
                 item['track'] = 'round{}'.format(str(i))
                 item['summary_url'] = None
-                item = parse_description(item)
-                item = check_md5(item)
-                item = add_input_url(item) 
-                item = add_appendix_url(item)
+                for rule in compile_runs_rules(trec, item['track']):
+                    item = rule(item)
                 pop_fields(item, _type)
             if _type == 'covid-participants':
                 item['organization'] = None
                 item['name'] = None
                 pop_fields(item, _type)
-        tables += items
-    return tables  
-
-
-def write_publications_json():
-    library = bibtexparser.parse_file('bibtex/trec.bib')
-    lib_dict = {entry.key: entry for entry in library.entries}
+            yield item
+
+
+@lru_cache(maxsize=None)
+def latex_to_text(latex):
+    return latex_converter().latex_to_text(latex)
+
+
+@lru_cache(maxsize=1)
+def latex_converter():
+    return LatexNodes2Text()
+
+
+def convert_entry(entry):
+    # the publication fields derived from a single bibtex entry
+    fields = {}
+    if 'url' in entry.fields_dict:
+        fields['url'] = latex_to_text(entry['url'])
+        if 'biburl' in entry.fields_dict:
+            fields['biburl'] = entry['biburl']
+    title = latex_to_text(entry['title'])
+    title = title.replace(18*' ', ' ')
+    title = title.replace('\n', ' ')
+    fields['title'] = title
+    author = entry['author']
+    author = author.replace('\n','')
+    author = author.replace(18*' ',' ')
+    author = latex_to_text(author)
+    author = author.replace(' and ', ', ')
+    fields['author'] = author
+    bibtex = bibtexparser.write_string(bibtexparser.Library([entry]))
+    bibtex = bibtex.replace('\n' + 18*' ', ' ')
+    fields['bibtex'] = bibtex
+    if 'doi' in entry.fields_dict:
+        fields['doi'] = entry['doi']
+    return fields
+
+
+def bibtex_shard_list():
+    # conferences with a bibtex shard, e.g. bibtex/single/trec12.bib, in numerical order
+    shards = {}
+    for file in os.listdir(bibtex_shards):
+        match = re.fullmatch(r'(trec(\d+))\.bib', file)
+        if match:
+            shards[match.group(1)] = (int(match.group(2)), os.path.join(bibtex_shards, file))
+    return [(trec, path) for trec, (_, path) in sorted(shards.items(), key=lambda shard: shard[1][0])]
+
+
+def convert_shard(trec, path):
+    # converted entries of a single shard, reparsed only if the shard has changed
+    with open(path, 'rb') as f_in:
+        shard_hash = hashlib.sha256(f_in.read()).hexdigest()
+    cache_path = os.path.join(bibtex_cache, trec + '.json')
+    try:
+        with open(cache_path) as f_in:
+            cached = json.load(f_in)
+        if cached['hash'] == shard_hash:
+            return cached['entries']
+    except (OSError, ValueError, KeyError):
+        pass
+    library = bibtexparser.parse_file(path)
+    entries = {entry.key: convert_entry(entry) for entry in library.entries}
+    os.makedirs(bibtex_cache, exist_ok=True)
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w') as f_out:
+        json.dump({'hash': shard_hash, 'entries': entries}, f_out)
+    os.replace(tmp_path, cache_path)
+    return entries
+
+
+def convert_shards(shards, workers=None):
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(convert_shard, *zip(*shards)))
+    return [convert_shard(trec, path) for trec, path in shards]
+
+
+def write_publications_json(workers=None):
+    shards = bibtex_shard_list()
+    # papers can cite entries from another conference's shard
+    converted = {}
+    for entries in convert_shards(shards, workers):
+        converted.update(entries)
     with open('./json/abstracts.json') as f_in:
         publications = json.loads(f_in.read())
     with open('./json/publications.json', 'w') as f_out:
-        for i in range(2, 34):
-            trec = ''.join(['trec', str(i)])
-            trec_pubs = publications.get(trec)
+        for trec, _ in shards:
+            trec_pubs = publications.get(trec, {})
             for track, pubs in trec_pubs.items():
                 for key, metadata in pubs.items():
-                    try:
-                        url = lib_dict[key]['url']
-                        metadata['url'] = LatexNodes2Text().latex_to_text(url)
-                        metadata['biburl'] = lib_dict[key]['biburl']
-                    except KeyError:
-                        pass
+                    fields = converted[key]
+                    for field in ('url', 'biburl'):
+                        if field in fields:
+                            metadata[field] = fields[field]
                     metadata['key'] = key
                     if metadata['pid'] == 'coordinators':
                         metadata['pid'] = 'overview'
-                    title = lib_dict[key]['title']
-                    title = LatexNodes2Text().latex_to_text(title)
-                    title = title.replace(18*' ', ' ')
-                    title = title.replace('\n', ' ')
-                    metadata['title'] = title
-                    author = lib_dict[key]['author']
-                    author = author.replace('\n','')
-                    author = author.replace(18*' ',' ')
-                    author = LatexNodes2Text().latex_to_text(author)
-                    author = author.replace(' and ', ', ')
-                    metadata['author'] = author
-                    bibtex = lib_dict[key]
-                    bibtex = bibtexparser.Library(bibtex)
-                    bibtex = bibtexparser.write_string(bibtex)
-                    bibtex = bibtex.replace('\n' + 18*' ', ' ')
-                    metadata['bibtex'] = bibtex
-                    if 'doi' in lib_dict[key].fields_dict:
-                        metadata['doi'] = lib_dict[key]['doi']
+                    for field in ('title', 'author', 'bibtex', 'doi'):
+                        if field in fields:
+                            metadata[field] = fields[field]
         f_out.write(json.dumps(publications, indent=4))
 
 
 def runs_df():
-    tables = read_tables()
-    return pd.DataFrame(tables)
+    return frame_from_records(read_tables())
 
 
 def participants_df():
-    tables = read_tables(_type='participants')
-    return pd.DataFrame(tables).drop_duplicates()
+    return frame_from_records(read_tables(_type='participants')).drop_duplicates()
 
 
 def publications_df():
@@ -3218,220 +3964,10 @@ def datasets_df():
 
 
 def eval_type(file, trec, track):
-    eval = 'trec_eval' 
-
-    if (trec, track) == ('trec31', 'cast'):
-        if 'lenient' in file: 
-            eval = 'lenient' 
-        if 'strict' in file:
-            eval = 'strict' 
-
-    if (trec, track) == ('trec31', 'deep'):
-        if 'ndcg' in file:
-            eval = 'ndcg' 
-
-    if (trec, track) == ('trec30', 'podcast'):
-        if '.QD.' in file:
-            eval = 'QD'
-        if '.QE.' in file:
-            eval = 'QE'
-        if '.QR.' in file:
-            eval = 'QR'
-        if '.QS.' in file:
-            eval = 'QS'
-
-    if (trec, track) == ('trec30', 'deep'):
-        if 'passages-eval' in file:
-            eval = 'passages-eval' 
-
-    if (trec, track) == ('trec29', 'deep'):
-        if 'passages-eval' in file:
-            eval = 'passages-eval' 
-
-    if (trec, track) == ('trec28', 'deep'):
-        if 'passages-eval' in file:
-            eval = 'passages-eval' 
-
-    if (trec, track) == ('trec23', 'web'):
-        if 'risk-rm-a0-gd' in file: 
-            eval = 'risk-rm-a0-gd'
-        if 'risk-rm-a0-nd' in file: 
-            eval = 'risk-rm-a0-nd'
-        if 'risk-rm-a5-gd' in file: 
-            eval = 'risk-rm-a5-gd'
-        if 'risk-rm-a5-nd' in file: 
-            eval = 'risk-rm-a5-nd'
-        if 'risk-terrier-a0-gd' in file: 
-            eval = 'risk-terrier-a0-gd'
-        if 'risk-terrier-a0-nd' in file: 
-            eval = 'risk-terrier-a0-nd'
-        if 'risk-terrier-a5-gd' in file: 
-            eval = 'risk-terrier-a5-gd'
-        if 'risk-terrier-a5-nd' in file: 
-            eval = 'risk-terrier-a5-nd'
-        if 'std-gd' in file: 
-            eval = 'std-gd'
-        if 'std-nd' in file: 
-            eval = 'std-nd'
-
-    if (trec, track) == ('trec23', 'microblog'):
-        if 'adhoc' in file: 
-            eval = 'adhoc' 
-        if 'ttg' in file:
-            eval = 'ttg' 
-
-    if (trec, track) == ('trec22', 'web'):
-        if 'risk-a0-gd' in file: 
-            eval = 'risk-a0-gd' 
-        if 'risk-a0-nd' in file: 
-            eval = 'risk-a0-nd' 
-        if 'risk-a1-gd' in file: 
-            eval = 'risk-a1-gd'
-        if 'risk-a1-nd' in file: 
-            eval = 'risk-a1-nd' 
-        if 'risk-a5-gd' in file: 
-            eval = 'risk-a5-gd' 
-        if 'risk-a5-nd' in file: 
-            eval = 'risk-a5-nd' 
-        if 'risk-a10-gd' in file: 
-            eval = 'risk-a10-gd' 
-        if 'risk-a10-nd' in file: 
-            eval = 'risk-a10-nd'
-        if 'std-nd' in file: 
-            eval = 'std-nd'
-        if 'std-gd' in file: 
-            eval = 'std-gd'
-
-    if (trec, track) == ('trec20', 'session'):
-        if 'allsubtopics' in file: 
-            eval = 'allsubtopics' 
-        if 'lastquerysubtopics' in file:
-            eval = 'lastquerysubtopics' 
-
-    if (trec, track) == ('trec20', 'microblog'):
-        if 'allrel' in file: 
-            eval = 'allrel' 
-        if 'highrel' in file:
-            eval = 'highrel' 
-
-    if (trec, track) == ('trec19', 'blog'):
-        if 'baseline' in file: 
-            eval = 'baseline' 
-        if 'first' in file:
-            eval = 'first' 
-        if 'second' in file:
-            eval = 'second'   
-
-    if (trec, track) == ('trec19', 'chemical'):
-        if 'full' in file: 
-            eval = 'full' 
-        if 'small' in file:
-            eval = 'small' 
-
-    if (trec, track) == ('trec18', 'blog'):
-        if 'headline' in file: 
-            eval = 'headline' 
-        if 'first' in file:
-            eval = 'first' 
-        if 'second' in file:
-            eval = 'second'         
-        if 'none' in file:
-            eval = 'none' 
-
-    if (trec, track) == ('trec18', 'legal'):
-        if 'eval' in file: 
-            eval = 'eval' 
-        if 'evalH' in file:
-            eval = 'evalH' 
-
-    if (trec, track) == ('trec18', 'chemical'):
-        if 'full' in file: 
-            eval = 'full' 
-        if 'small' in file:
-            eval = 'small' 
-        if 'eval' in file:
-            eval = 'eval' 
-
-    if (trec, track) == ('trec17', 'enterprise'):
-        if 'document' in file: 
-            eval = 'document' 
-        if 'expert' in file:
-            eval = 'expert' 
-
-    if (trec, track) == ('trec17', 'blog'):
-        if 'feed' in file: 
-            eval = 'feed' 
-        if 'opinion' in file:
-            eval = 'opinion' 
-        if 'positive' in file:
-            eval = 'positive'    
-        if 'negative' in file:
-            eval = 'negative'         
-        if 'topicrel' in file:
-            eval = 'topicrel' 
-
-    if (trec, track) == ('trec17', 'legal'):
-        if 'adhoc' in file: 
-            eval = 'adhoc' 
-        if 'adhocH' in file:
-            eval = 'adhocH' 
-        if 'resid' in file:
-            eval = 'resid'    
-        if 'residH' in file:
-            eval = 'residH'   
-
-    if (trec, track) == ('trec16', 'blog'):
-        if 'feed' in file: 
-            eval = 'feed' 
-        if 'opinion' in file:
-            eval = 'opinion' 
-        if 'polarity' in file:
-            eval = 'polarity'         
-        if 'topicrel' in file:
-            eval = 'topicrel' 
-
-    if (trec, track) == ('trec16', 'enterprise'):
-        if 'doc-promotion' in file:
-            eval = 'doc-promotion'
-        if 'doc-residual' in file:
-            eval = 'doc-residual'
-        if 'document' in file:
-            eval = 'document'
-        if 'experts' in file:
-            eval = 'experts'
-    
-    if (trec, track) == ('trec15', 'blog'):
-        if 'opinion' in file:
-            eval = 'opinion'        
-        if 'topicrel' in file:
-            eval = 'topicrel' 
-
-    if (trec, track) in [
-        ('trec29', 'pm'),
-        ('trec28', 'pm'),
-        ('trec27', 'pm'),
-        ('trec26', 'pm'),
-        ('trec25', 'clinical'),
-        ('trec24', 'clinical'),
-        ('trec23', 'clinical'),
-        ('trec21', 'medical'),
-    ]:
-        if 'sample-eval' in file: 
-            eval = 'sample-eval' 
-        if 'evidence' in file: 
-            eval = 'evidence-eval' 
-
-    if (trec, track) in [
-        ('trec21', 'web'),
-        ('trec20', 'web'),
-        ('trec19', 'web'),
-    ]:
-        if 'gdeval' in file: 
-            eval = 'gdeval' 
-        if 'ndeval' in file:
-            eval = 'ndeval' 
-
-    return eval
+    for keyword, eval in reversed(eval_types.get((trec, track), ())):
+        if keyword in file:
+            return eval
+    return 'trec_eval'
 
 
 def track_measures(eval):
@@ -3442,15 +3978,28 @@ def track_measures(eval):
 
 def strip_file_name(runid):
     runid = runid.split('/')[-1]
-    affixes = summary_prefixes + summary_suffixes
-    for affix in affixes:
+    prefix = summary_prefix_pattern.match(runid).group()
+    stripped = runid[len(prefix):]
+    suffix = ''
+    if stripped.endswith(summary_suffix_list):
+        suffix = next(suffix for suffix in summary_suffix_list if stripped.endswith(suffix))
+        stripped = stripped[:-len(suffix)]
+    if summary_affix_search.search(stripped) is None and \
+        not (prefix and stripped.startswith(summary_affix_overlaps[prefix])) and \
+            not (suffix and stripped.endswith(summary_affix_overlaps[suffix])):
+        return stripped
+    # affixes inside the runid are removed one after the other
+    for affix in summary_affixes:
         runid = runid.replace(affix, '')
     return runid
 
 
+def parse_file_name(file, trec, track):
+    return strip_file_name(file), eval_type(file, trec, track)
+
+
 def parse_summary_misinfo(data_df, file, lines, trec, track):
-    eval = eval_type(file, trec, track)
-    runid = strip_file_name(file)
+    runid, eval = parse_file_name(file, trec, track)
     summary = ''
     for line in lines:
         s = line.strip('\n').split('\t')
@@ -3602,286 +4151,404 @@ def parse_summary_session(data_df, file, lines, trec, track):
         return data_df
 
 
-def get_evaluation_measures(trec, track, lines, file, file_path, measures, eval):
+# summary parsers keyed by (trec, track, eval), an eval of None matches any eval type of the track
+summary_parsers = {}
+
+# trec_eval measures that are renamed, and the number of tabs that align them in the summary
+measure_aliases = {
+    'P10': 'P_10',
+    'P100': 'P_100',
+    'P1000': 'P_1000',
+}
+
+measure_tabs = {
+    'map': 4,
+    'recip_rank': 2,
+    'ndcg_cut_10': 2,
+    'recall_10': 2,
+    'recall_100': 2,
+    'recall_1000': 2,
+    'ndcg_cut_100': 1,
+    'ndcg_cut_1000': 1,
+}
+
+
+def summary_parser(*keys):
+    def register(parser):
+        for key in keys:
+            summary_parsers[key] = parser
+        return parser
+    return register
+
+
+@lru_cache(maxsize=None)
+def trec_eval_pattern(measures, sample_eval, topics):
+    # matches the lines of the given measures in a single pass over the file's bytes
+    names = set(measures) | {alias for alias, measure in measure_aliases.items() if measure in measures}
+    names = b'|'.join(re.escape(name.encode()) for name in sorted(names, key=len, reverse=True))
+    topic = rb'[^\s]+' if topics else rb'all'
+    if sample_eval:
+        # whitespace separated fields
+        return re.compile(rb'^[ \t\x0b\x0c]*(' + names + rb')[ \t\x0b\x0c]+(' + topic + rb')[ \t\x0b\x0c]+([^\s]+)', re.M)
+    topic = rb'[^\t\n]*' if topics else rb'all'
+    return re.compile(rb'^[ \x0b\x0c]*(' + names + rb')[ \x0b\x0c]*\t(' + topic + rb')\t([^\t\n]*)', re.M)
+
+
+def tokenize_trec_eval(file_path, measures, eval, topics=False):
+    # (measure, topic, score) of the given measures, either over all topics or per topic
+    pattern = trec_eval_pattern(frozenset(measures), eval == 'sample-eval', topics)
+    with open(file_path, 'rb') as f_in:
+        if os.fstat(f_in.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if buffer.find(b'\r') != -1:
+                # translate the line endings as reading in text mode would
+                with open(file_path) as f_text:
+                    buffer = f_text.read().encode()
+            for match in pattern.finditer(buffer):
+                measure = match.group(1).decode()
+                yield measure_aliases.get(measure, measure), match.group(2).decode(), match.group(3).decode()
+
+
+def read_summary_lines(file_path):
+    with open(file_path) as f_in:
+        return f_in.readlines()
+
+
+def parse_trec_eval(lines, file_path, measures, eval):
+    # measure \t topic \t score, only the scores over all topics are kept
+    split = str.split if eval == 'sample-eval' else None
+    measures = set(measures)
+    _evaluation_measures = []
+    for line in lines:
+        s = split(line) if split else line.strip('\n').split('\t')
+        if len(s) > 1:
+            score = s[2]
+            if s[1] == 'all':
+                measure = s[0].strip()
+                measure = measure_aliases.get(measure, measure)
+                if measure in measures:
+                    _evaluation_measures.append((measure, measure_tabs.get(measure, 3), score))
+    return _evaluation_measures
 
-    if (trec, track) in old_summary or \
-        track == 'web' and trec in ['trec10', 'trec11', 'trec12'] and len(lines) > 308:
-        results_all_topics = []
-        cnt = 0
-        for line in lines:
-            if 'Queryid (Num):       all' in line or \
-                'Queryid (Num):       39topics' in line or \
-                    'Queryid (Num):       43topics' in line or \
-                        'Queryid (Num):       45topics' in line or \
-                            'Queryid (Num):       50topics' in line:
-                cnt = 31
-            if cnt: 
-                results_all_topics.append(line)
-                cnt -= 1
-        P_10 = results_all_topics[22].split(':')[1].strip()
-        P_100 = results_all_topics[25].split(':')[1].strip()
-        P_1000 = results_all_topics[28].split(':')[1].strip()
-        Rprec = results_all_topics[30].split(':')[1].strip()
-        map = results_all_topics[18].strip()
-        return [
-            ('P_10', 2, P_10),
-            ('P_100', 2, P_100),
-            ('P_1000', 2, P_1000),
-            ('Rprec', 2, Rprec),
-            ('map', 3, map)
+
+@summary_parser(*[(trec, track, None) for trec, track in old_summary])
+def parse_old_summary(lines, file_path, measures, eval):
+    results_all_topics = []
+    cnt = 0
+    for line in lines:
+        if 'Queryid (Num):       all' in line or \
+            'Queryid (Num):       39topics' in line or \
+                'Queryid (Num):       43topics' in line or \
+                    'Queryid (Num):       45topics' in line or \
+                        'Queryid (Num):       50topics' in line:
+            cnt = 31
+        if cnt: 
+            results_all_topics.append(line)
+            cnt -= 1
+    P_10 = results_all_topics[22].split(':')[1].strip()
+    P_100 = results_all_topics[25].split(':')[1].strip()
+    P_1000 = results_all_topics[28].split(':')[1].strip()
+    Rprec = results_all_topics[30].split(':')[1].strip()
+    map = results_all_topics[18].strip()
+    return [
+        ('P_10', 2, P_10),
+        ('P_100', 2, P_100),
+        ('P_1000', 2, P_1000),
+        ('Rprec', 2, Rprec),
+        ('map', 3, map)
+    ]
+
+
+@summary_parser(('trec10', 'web', None), ('trec11', 'web', None), ('trec12', 'web', None))
+def parse_web_mrr(lines, file_path, measures, eval):
+    if len(lines) > 308:
+        return parse_old_summary(lines, file_path, measures, eval)
+    for line in lines:
+            if 'reciprocal rank' in line:
+                mrr = line.split(':')[-1].strip()
+    return [('mrr', 3, mrr)]
+
+
+@summary_parser(
+    ('trec19', 'web', 'gdeval'),
+    ('trec20', 'web', 'gdeval'),
+    ('trec21', 'web', 'gdeval'),
+    ('trec22', 'web', 'risk-a0-gd'),
+    ('trec22', 'web', 'risk-a1-gd'),
+    ('trec22', 'web', 'risk-a5-gd'),
+    ('trec22', 'web', 'risk-a10-gd'),
+    ('trec22', 'web', 'std-gd'),
+    ('trec23', 'web', 'risk-rm-a0-gd'),
+    ('trec23', 'web', 'risk-terrier-a0-gd'),
+    ('trec23', 'web', 'risk-rm-a5-gd'),
+    ('trec23', 'web', 'risk-terrier-a5-gd'),
+    ('trec23', 'web', 'std-gd'),
+)
+def parse_gdeval(lines, file_path, measures, eval):
+    df = pd.read_csv(file_path)
+    ndcg = df[df.topic == 'amean']['ndcg@20'].iloc[0]
+    err = df[df.topic == 'amean']['err@20'].iloc[0]
+    return [
+        ('err', 3, str(err)), 
+        ('ndcg', 2, str(ndcg))
         ]
-    
-    if track == 'web':
-        if trec in ['trec10', 'trec11', 'trec12']:
-            for line in lines:
-                    if 'reciprocal rank' in line:
-                        mrr = line.split(':')[-1].strip()
-            return [('mrr', 3, mrr)]
-        
-        if trec != 'trec13' and eval != 'trec_eval': 
-            if eval in [
-                'gdeval', 
-                'risk-a0-gd',
-                'risk-a1-gd', 
-                'risk-a5-gd', 
-                'risk-a10-gd', 
-                'risk-rm-a0-gd',
-                'risk-terrier-a0-gd',
-                'risk-rm-a5-gd',
-                'risk-terrier-a5-gd',
-                'std-gd',
-                ]:
-                df = pd.read_csv(file_path)
-                ndcg = df[df.topic == 'amean']['ndcg@20'].iloc[0]
-                err = df[df.topic == 'amean']['err@20'].iloc[0]
-                return [
-                    ('err', 3, str(err)), 
-                    ('ndcg', 2, str(ndcg))
-                    ]
-            
-            if eval in [
-                'ndeval', 
-                'risk-a0-nd', 
-                'risk-a1-nd', 
-                'risk-a5-nd', 
-                'risk-a10-nd', 
-                'risk-rm-a0-nd',
-                'risk-terrier-a0-nd',
-                'risk-rm-a5-nd',
-                'risk-terrier-a5-nd',
-                'std-nd', 
-                ]:
-                df = pd.read_csv(file_path)
-                err_ia = df[df.topic == 'amean']['ERR-IA@10'].iloc[0]
-                alpha_ndcg = df[df.topic == 'amean']['alpha-nDCG@10'].iloc[0]
-                p_ia = df[df.topic == 'amean']['P-IA@10'].iloc[0]
-                map_ia = df[df.topic == 'amean']['MAP-IA'].iloc[0]
-                return [
-                    ('ERR-IA@10', 2, str(err_ia)), 
-                    ('alpha-nDCG@10', 1, str(alpha_ndcg)), 
-                    ('P-IA@10', 3, str(p_ia)), 
-                    ('MAP-IA', 3, str(map_ia))
-                    ]
-        
-    if track == 'novelty' and trec in ['trec11', 'trec12', 'trec13']:
-        if trec == 'trec11':
-            precision_relevant = lines[56].strip().split(':')[1].strip()
-            recall_relevant = lines[57].strip().split(':')[1].strip()
-            f_score_relevant = lines[58].strip().split(':')[1].strip()
-
-            precision_new = lines[170].strip().split(':')[1].strip()
-            recall_new = lines[171].strip().split(':')[1].strip()
-            f_score_new = lines[172].strip().split(':')[1].strip()
 
-            return [
-                ('Precision (relevant sentences)', 2, precision_relevant),
-                ('Recall (relevant sentences)', 3, recall_relevant),
-                ('F-score (relevant sentences)', 2, f_score_relevant),
-                ('Precision (new sentences)', 3, precision_new),
-                ('Recall (new sentences)', 4, recall_new),
-                ('F-score (new sentences)', 4, f_score_new)
-            ]
 
-        if trec in ['trec12', 'trec13']:
-            if len(lines) > 64:
-                precision_relevant = lines[57].strip().split(':')[1].strip()
-                recall_relevant = lines[58].strip().split(':')[1].strip()
-                f_score_relevant = lines[59].strip().split(':')[1].strip()
+@summary_parser(
+    ('trec19', 'web', 'ndeval'),
+    ('trec20', 'web', 'ndeval'),
+    ('trec21', 'web', 'ndeval'),
+    ('trec22', 'web', 'risk-a0-nd'),
+    ('trec22', 'web', 'risk-a1-nd'),
+    ('trec22', 'web', 'risk-a5-nd'),
+    ('trec22', 'web', 'risk-a10-nd'),
+    ('trec22', 'web', 'std-nd'),
+    ('trec23', 'web', 'risk-rm-a0-nd'),
+    ('trec23', 'web', 'risk-terrier-a0-nd'),
+    ('trec23', 'web', 'risk-rm-a5-nd'),
+    ('trec23', 'web', 'risk-terrier-a5-nd'),
+    ('trec23', 'web', 'std-nd'),
+)
+def parse_ndeval(lines, file_path, measures, eval):
+    df = pd.read_csv(file_path)
+    err_ia = df[df.topic == 'amean']['ERR-IA@10'].iloc[0]
+    alpha_ndcg = df[df.topic == 'amean']['alpha-nDCG@10'].iloc[0]
+    p_ia = df[df.topic == 'amean']['P-IA@10'].iloc[0]
+    map_ia = df[df.topic == 'amean']['MAP-IA'].iloc[0]
+    return [
+        ('ERR-IA@10', 2, str(err_ia)), 
+        ('alpha-nDCG@10', 1, str(alpha_ndcg)), 
+        ('P-IA@10', 3, str(p_ia)), 
+        ('MAP-IA', 3, str(map_ia))
+        ]
 
-                precision_new = lines[119].strip().split(':')[1].strip()
-                recall_new = lines[120].strip().split(':')[1].strip()
-                f_score_new = lines[121].strip().split(':')[1].strip()
 
-                return [
-                    ('Precision (relevant sentences)', 2, precision_relevant),
-                    ('Recall (relevant sentences)', 3, recall_relevant),
-                    ('F-score (relevant sentences)', 2, f_score_relevant),
-                    ('Precision (new sentences)', 3, precision_new),
-                    ('Recall (new sentences)', 4, recall_new),
-                    ('F-score (new sentences)', 4, f_score_new)
-                ]
-            else:
-                precision_new = lines[57].strip().split(':')[1].strip()
-                recall_new = lines[58].strip().split(':')[1].strip()
-                f_score_new = lines[59].strip().split(':')[1].strip()
+@summary_parser(('trec11', 'novelty', None))
+def parse_novelty_trec11(lines, file_path, measures, eval):
+    precision_relevant = lines[56].strip().split(':')[1].strip()
+    recall_relevant = lines[57].strip().split(':')[1].strip()
+    f_score_relevant = lines[58].strip().split(':')[1].strip()
 
-                return [
-                    ('Precision (new sentences)', 3, precision_new),
-                    ('Recall (new sentences)', 4, recall_new),
-                    ('F-score (new sentences)', 4, f_score_new)
-                ]
+    precision_new = lines[170].strip().split(':')[1].strip()
+    recall_new = lines[171].strip().split(':')[1].strip()
+    f_score_new = lines[172].strip().split(':')[1].strip()
 
-    if track == 'enterprise' and trec == 'trec17':
-        if eval != 'expert':
-            for line in lines:
-                s = line.split()
-                if len(s) > 2:
-                    if s[0] == 'infNDCG' and s[1] == 'all':
-                        infNDCG =  s[2]
-                    if s[0] == 'infAP' and s[1] == 'all':
-                        infAP =  s[2]
-            return [
-                ('infNDCG', 2, infNDCG),
-                ('infAP', 2, infAP)
-            ]
+    return [
+        ('Precision (relevant sentences)', 2, precision_relevant),
+        ('Recall (relevant sentences)', 3, recall_relevant),
+        ('F-score (relevant sentences)', 2, f_score_relevant),
+        ('Precision (new sentences)', 3, precision_new),
+        ('Recall (new sentences)', 4, recall_new),
+        ('F-score (new sentences)', 4, f_score_new)
+    ]
+
+
+@summary_parser(('trec12', 'novelty', None), ('trec13', 'novelty', None))
+def parse_novelty(lines, file_path, measures, eval):
+    if len(lines) > 64:
+        precision_relevant = lines[57].strip().split(':')[1].strip()
+        recall_relevant = lines[58].strip().split(':')[1].strip()
+        f_score_relevant = lines[59].strip().split(':')[1].strip()
+
+        precision_new = lines[119].strip().split(':')[1].strip()
+        recall_new = lines[120].strip().split(':')[1].strip()
+        f_score_new = lines[121].strip().split(':')[1].strip()
+
+        return [
+            ('Precision (relevant sentences)', 2, precision_relevant),
+            ('Recall (relevant sentences)', 3, recall_relevant),
+            ('F-score (relevant sentences)', 2, f_score_relevant),
+            ('Precision (new sentences)', 3, precision_new),
+            ('Recall (new sentences)', 4, recall_new),
+            ('F-score (new sentences)', 4, f_score_new)
+        ]
+    else:
+        precision_new = lines[57].strip().split(':')[1].strip()
+        recall_new = lines[58].strip().split(':')[1].strip()
+        f_score_new = lines[59].strip().split(':')[1].strip()
 
-    if track == 'task' and trec in ['trec25', 'trec26']:
-        if trec == 'trec26':
-            df = pd.read_csv(file_path)
-            err_10 = str(df[df['topic'] == 'amean'].iloc[0]['ERR-IA@10'])
-            ndcg_10 = str(df[df['topic'] == 'amean'].iloc[0]['alpha-nDCG@10'])
-        if trec == 'trec25':
-            for line in lines:
-                s = line.split()
-                if s[0].strip('\t') == 'ERR-IA@10' and s[1] == 'all':
-                    err_10 = s[2]
-                if s[0].strip('\t') == 'alpha-nDCG@10' and s[1] == 'all':
-                    ndcg_10 = s[2]
         return [
-            ('ERR-IA@10', 2, err_10),
-            ('alpha-nDCG@10', 1, ndcg_10)
+            ('Precision (new sentences)', 3, precision_new),
+            ('Recall (new sentences)', 4, recall_new),
+            ('F-score (new sentences)', 4, f_score_new)
         ]
 
-    if track == 'microblog' and trec in ['trec23', 'trec24']:
-        if eval != 'adhoc':
-            if trec == 'trec23':
-                for line in lines:
-                    s = line.split()
-                    if s[1] == 'all':
-                        unweighted_recall = s[2]
-                        weighted_recall = s[3]
-                        precision = s[4]
 
+@summary_parser(('trec17', 'enterprise', None))
+def parse_enterprise(lines, file_path, measures, eval):
+    for line in lines:
+        s = line.split()
+        if len(s) > 2:
+            if s[0] == 'infNDCG' and s[1] == 'all':
+                infNDCG =  s[2]
+            if s[0] == 'infAP' and s[1] == 'all':
+                infAP =  s[2]
+    return [
+        ('infNDCG', 2, infNDCG),
+        ('infAP', 2, infAP)
+    ]
+
+
+# the expert search summaries of trec17/enterprise are regular trec_eval output
+summary_parser(('trec17', 'enterprise', 'expert'))(parse_trec_eval)
+
+
+@summary_parser(('trec25', 'task', None))
+def parse_task_trec25(lines, file_path, measures, eval):
+    for line in lines:
+        s = line.split()
+        if s[0].strip('\t') == 'ERR-IA@10' and s[1] == 'all':
+            err_10 = s[2]
+        if s[0].strip('\t') == 'alpha-nDCG@10' and s[1] == 'all':
+            ndcg_10 = s[2]
+    return [
+        ('ERR-IA@10', 2, err_10),
+        ('alpha-nDCG@10', 1, ndcg_10)
+    ]
+
+
+@summary_parser(('trec26', 'task', None))
+def parse_task_trec26(lines, file_path, measures, eval):
+    df = pd.read_csv(file_path)
+    err_10 = str(df[df['topic'] == 'amean'].iloc[0]['ERR-IA@10'])
+    ndcg_10 = str(df[df['topic'] == 'amean'].iloc[0]['alpha-nDCG@10'])
+    return [
+        ('ERR-IA@10', 2, err_10),
+        ('alpha-nDCG@10', 1, ndcg_10)
+    ]
+
+
+@summary_parser(('trec23', 'microblog', None))
+def parse_microblog_trec23(lines, file_path, measures, eval):
+    for line in lines:
+        s = line.split()
+        if s[1] == 'all':
+            unweighted_recall = s[2]
+            weighted_recall = s[3]
+            precision = s[4]
+
+    return [
+        ('unweighted_recall', 2, unweighted_recall),
+        ('weighted_recall', 3, weighted_recall),
+        ('precision', 4, precision),
+    ]
+
+
+# the adhoc summaries of trec23/microblog are regular trec_eval output
+summary_parser(('trec23', 'microblog', 'adhoc'))(parse_trec_eval)
+
+
+@summary_parser(('trec24', 'microblog', None))
+def parse_microblog_trec24(lines, file_path, measures, eval):
+    for line in lines:
+        s = line.split()
+        if len(s) == 3:
+            if s[1].strip('\t') == 'all':
+                ndcg = s[2]
                 return [
-                    ('unweighted_recall', 2, unweighted_recall),
-                    ('weighted_recall', 3, weighted_recall),
-                    ('precision', 4, precision),
+                    ('nDCG', 2, ndcg),
                 ]
-            if trec == 'trec24':
-                for line in lines:
-                    s = line.split()
-                    if len(s) == 3:
-                        if s[1].strip('\t') == 'all':
-                            ndcg = s[2]
-                            return [
-                                ('nDCG', 2, ndcg),
-                            ]
-                    if len(s) == 4: 
-                        if s[1].strip('\t') == 'all':
-                            elg = s[2]
-                            ncg = s[3]
-                            return [
-                                ('ELG', 2, elg),
-                                ('nCG', 2, ncg),
-                            ]
-
-    if track == 'hp' and trec in ['trec6', 'trec7']:
-        if trec == 'trec6':
-            _all_str = 'Queryid (Num):	all'
-        if trec == 'trec7':
-            _all_str = 'Queryid (Num):       all'
-        idx = 0
-        for line in lines:
-            if _all_str in line:
-                break
-            else:
-                idx += 1
-        P = lines[idx+5].split()[-1]
-        RP = lines[idx+6].split()[-1]
-        AP = lines[idx+7].split()[-1]
-        if trec == 'trec6':
-            return [
-                ('Precision@10', 4, P),
-                ('Relative Precision@10', 2, RP),
-                ('Unranked Avg. Precision@10', 1, AP),
-            ]        
-        if trec == 'trec7':
-            return [
-                ('Precision@15', 4, P),
-                ('Relative Precision@15', 2, RP),
-                ('Unranked Avg. Precision@15', 1, AP),
-            ]
+        if len(s) == 4: 
+            if s[1].strip('\t') == 'all':
+                elg = s[2]
+                ncg = s[3]
+                return [
+                    ('ELG', 2, elg),
+                    ('nCG', 2, ncg),
+                ]
+    return parse_trec_eval(lines, file_path, measures, eval)
 
-    if track == 'genomics' and trec in ['trec14', 'trec15', 'trec16'] :
-        if trec == 'trec14' and len(lines) < 13: # otherwise it's the summary of the categorization task
-            _evaluation_measures = []
-            for line in lines:
-                s = line.split()
-                if len(s) > 1:
-                    if s[0] in ['Precision:', 'Recall:', 'F-score:']:
-                        measure = s[0].strip(':')
-                        score = s[1]
-                        tabs = 2 
-                        if measure == 'Precision':
-                            tabs = 1
-                        _evaluation_measures.append((measure, tabs, score))
-            return _evaluation_measures
-        
-        if trec in ['trec16', 'trec15']:
-            _evaluation_measures = []
-            for line in lines:
-                s = line.split()
-                if s[2] == 'MAP':
-                    measure = ' '.join([s[2], ''.join(['(', s[1], ')'])])
-                    score = s[3]
-                    _evaluation_measures.append((measure, 2, score))
-            return _evaluation_measures
 
+def parse_hp(lines, _all_str):
+    idx = 0
+    for line in lines:
+        if _all_str in line:
+            break
+        else:
+            idx += 1
+    P = lines[idx+5].split()[-1]
+    RP = lines[idx+6].split()[-1]
+    AP = lines[idx+7].split()[-1]
+    return P, RP, AP
+
+
+@summary_parser(('trec6', 'hp', None))
+def parse_hp_trec6(lines, file_path, measures, eval):
+    P, RP, AP = parse_hp(lines, 'Queryid (Num):\tall')
+    return [
+        ('Precision@10', 4, P),
+        ('Relative Precision@10', 2, RP),
+        ('Unranked Avg. Precision@10', 1, AP),
+    ]        
+
+
+@summary_parser(('trec7', 'hp', None))
+def parse_hp_trec7(lines, file_path, measures, eval):
+    P, RP, AP = parse_hp(lines, 'Queryid (Num):       all')
+    return [
+        ('Precision@15', 4, P),
+        ('Relative Precision@15', 2, RP),
+        ('Unranked Avg. Precision@15', 1, AP),
+    ]
+
+
+@summary_parser(('trec14', 'genomics', None))
+def parse_genomics_trec14(lines, file_path, measures, eval):
+    if len(lines) >= 13: # summary of the categorization task
+        return parse_trec_eval(lines, file_path, measures, eval)
     _evaluation_measures = []
     for line in lines:
-        s = line.strip('\n').split('\t')
-        if eval == 'sample-eval':
-            s = line.split()
+        s = line.split()
         if len(s) > 1:
-            measure = s[0].strip().strip('\t')
-            topic = s[1]
-            score = s[2]
-            if measure == 'P10':
-                measure = 'P_10'
-            if measure == 'P100':
-                measure = 'P_100'
-            if measure == 'P1000':
-                measure = 'P_1000'
-            if measure in measures and topic == 'all':
-                tabs = 3
-                if measure == 'map':
-                    tabs = 4
-                elif measure in ['recip_rank', 'ndcg_cut_10', 'recall_10', 'recall_100', 'recall_1000']:
-                    tabs = 2 
-                elif measure in ['ndcg_cut_100', 'ndcg_cut_1000']:
-                    tabs = 1 
+            if s[0] in ['Precision:', 'Recall:', 'F-score:']:
+                measure = s[0].strip(':')
+                score = s[1]
+                tabs = 2 
+                if measure == 'Precision':
+                    tabs = 1
                 _evaluation_measures.append((measure, tabs, score))
     return _evaluation_measures
 
 
+@summary_parser(('trec15', 'genomics', None), ('trec16', 'genomics', None))
+def parse_genomics(lines, file_path, measures, eval):
+    _evaluation_measures = []
+    for line in lines:
+        s = line.split()
+        if s[2] == 'MAP':
+            measure = ' '.join([s[2], ''.join(['(', s[1], ')'])])
+            score = s[3]
+            _evaluation_measures.append((measure, 2, score))
+    return _evaluation_measures
+
+
+def get_summary_parser(trec, track, eval):
+    return summary_parsers.get((trec, track, eval)) or summary_parsers.get((trec, track, None), parse_trec_eval)
+
+
+def get_evaluation_measures(trec, track, lines, file, file_path, measures, eval):
+    parser = get_summary_parser(trec, track, eval)
+    if lines is None:
+        if parser is parse_trec_eval:
+            return [
+                (measure, measure_tabs.get(measure, 3), score)
+                for measure, topic, score in tokenize_trec_eval(file_path, measures, eval)
+            ]
+        lines = read_summary_lines(file_path)
+    return parser(lines, file_path, measures, eval)
+
+
 def parse_summary(data_df, file, lines, trec, track, file_path):
+    # lines are read on demand if not given, trec_eval output is tokenized without reading lines
+    if lines is None and track in ['misinfo', 'session']:
+        lines = read_summary_lines(file_path)
     if track == 'misinfo':
         return parse_summary_misinfo(data_df, file, lines, trec, track)
     if track == 'session':
         return parse_summary_session(data_df, file, lines, trec, track)
-    eval = eval_type(file, trec, track)
+    runid, eval = parse_file_name(file, trec, track)
     measures = track_measures(eval)
-    runid = strip_file_name(file)
     summary = ''
     evaluation_measures = get_evaluation_measures(trec, track, lines, file, file_path, measures, eval)
     for em in evaluation_measures:
@@ -3912,103 +4579,221 @@ def parse_summary(data_df, file, lines, trec, track, file_path):
     return data_df
 
 
-def parse_summary_covid(data_df, trec, tracks):
+def parse_summary_covid(trec, tracks):
+    batches = []
     for track in tracks[tracks['trec'] == trec].track:
-        if track == 'round1':
-            bpref_df = pd.read_csv('./trec/trec-covid/{}/eval/means-bpref'.format(track), sep=' ', names=['runid', 'bpref'])
-            map_df = pd.read_csv('./trec/trec-covid/{}/eval/means-map'.format(track), sep=' ', names=['runid', 'map'])
-            ndcg_df = pd.read_csv('./trec/trec-covid/{}/eval/means-ndcg'.format(track), sep=' ', names=['runid', 'ndcg'])
-            P5_df = pd.read_csv('./trec/trec-covid/{}/eval/means-P5'.format(track), sep=' ', names=['runid', 'P_5'])
-            results = bpref_df
-            for df in [map_df, ndcg_df, P5_df]:
-                results = pd.merge(left=results, right=df, left_on='runid', right_on='runid')
-        if track in ['round2', 'round3']:
-            bpref_df = pd.read_csv('./trec/trec-covid/{}/eval/means-bpref'.format(track), sep=' ', names=['runid', 'bpref'])
-            map_df = pd.read_csv('./trec/trec-covid/{}/eval/means-map'.format(track), sep=' ', names=['runid', 'map'])
-            ndcg_df = pd.read_csv('./trec/trec-covid/{}/eval/means-ndcg'.format(track), sep=' ', names=['runid', 'ndcg'])
-            P5_df = pd.read_csv('./trec/trec-covid/{}/eval/means-P5'.format(track), sep=' ', names=['runid', 'P_5'])
-            rbp_p5_df = pd.read_csv('./trec/trec-covid/{}/eval/means-rbp_p5'.format(track), sep=' ', names=['runid', 'rbp_p5'])
-            results = bpref_df
-            for df in [map_df, ndcg_df, P5_df, rbp_p5_df]:
-                results = pd.merge(left=results, right=df, left_on='runid', right_on='runid')
-        if track in ['round4', 'round5']:
-            bpref_df = pd.read_csv('./trec/trec-covid/{}/eval/mean-bpref'.format(track), sep=' ', names=['runid', 'bpref'])
-            map_df = pd.read_csv('./trec/trec-covid/{}/eval/mean-map'.format(track), sep=' ', names=['runid', 'map'])
-            ndcg_df = pd.read_csv('./trec/trec-covid/{}/eval/mean-ndcg20'.format(track), sep=' ', names=['runid', 'ndcg_20'])
-            P5_df = pd.read_csv('./trec/trec-covid/{}/eval/mean-P20'.format(track), sep=' ', names=['runid', 'P_20'])
-            rbp_p5_df = pd.read_csv('./trec/trec-covid/{}/eval/mean-rbp_p5'.format(track), sep=' ', names=['runid', 'rbp_p5'])
-            results = bpref_df
-            for df in [map_df, ndcg_df, P5_df, rbp_p5_df]:
-                results = pd.merge(left=results, right=df, left_on='runid', right_on='runid')
-        measures = list(results.columns[1:]) 
-        for row in results.iterrows():
-            summary = ''
-            runid = row[1]['runid']
-            for measure in measures:
-                score = str(row[1][measure])
-                tabs = 3 if measure in ['map', 'P_5'] else 2
-                summary += ''.join(['\t', measure, tabs*'\t', 'all\t', score, '\n'])
-                data_df.append(
-                    {
-                        'trec': trec,
-                        'track': track,
-                        'runid': runid,
-                        'eval': 'trec_eval',
-                        'measure': measure,
-                        'topic': 'all',
-                        'score': score
-                    }
-                )
-            if len(summary) > 0:
-                data_df.append(
-                    {
-                        'trec': trec,
-                        'track': track,
-                        'runid': runid,
-                        'eval': 'trec_eval',
-                        'measure': 'summary',
-                        'topic': 'all',
-                        'score': summary
-                    }
-                )
-    return data_df
+        if track not in covid_measures:
+            continue
+        scores = []
+        for order, (file, measure) in enumerate(covid_measures[track]):
+            df = pd.read_csv('./trec/trec-covid/{}/eval/{}'.format(track, file), sep=' ', names=['runid', 'score'])
+            scores.append(df.assign(score=df['score'].astype(str), measure=measure, measure_order=order))
+        # runs with scores for every measure, in the order of the first measure file
+        runids = set.intersection(*(set(df.runid) for df in scores))
+        run_order = {runid: order for order, runid in reversed(list(enumerate(scores[0].runid)))}
+        results = pd.concat(scores, ignore_index=True)
+        results = results[results.runid.isin(runids)]
+        results['run_order'] = results.runid.map(run_order)
+        results = results.sort_values(['run_order', 'measure_order'], kind='stable')
+        tabs = results.measure.isin(['map', 'P_5']).map({True: 3*'\t', False: 2*'\t'})
+        lines = '\t' + results.measure + tabs + 'all\t' + results.score + '\n'
+        summaries = lines.groupby(results.run_order, sort=True).agg(''.join)
+        summaries = pd.DataFrame({
+            'runid': results.drop_duplicates('run_order').runid.values,
+            'score': summaries.values,
+            'measure': 'summary',
+            'measure_order': len(scores),
+            'run_order': summaries.index,
+        })
+        results = pd.concat([results, summaries], ignore_index=True)
+        results = results.sort_values(['run_order', 'measure_order'], kind='stable')
+        batches.append(results.assign(trec=trec, track=track, eval='trec_eval', topic='all'))
+    if not batches:
+        return pd.DataFrame()
+    columns = ['trec', 'track', 'runid', 'eval', 'measure', 'topic', 'score']
+    return pd.concat(batches, ignore_index=True)[columns]
+
+
+def summary_files(trec, track):
+    # summary files of a track in a deterministic order
+    summaries_path = os.path.join('trec', trec, track, 'summaries')
+    if (trec, track) == ('trec28', 'cast'):
+        summaries_path = os.path.join('trec', trec, 'converse', 'summaries')
+    for root, dirs, files in os.walk(summaries_path):
+        dirs.sort(key=str.lower)
+        files.sort(key=str.lower)
+        for file in files:
+            if file.endswith(('.tsv', '.csv', '.rbp', '.tar', '.gz', '.tgz', '.Z', '.pdf', '.eps', '.ps', '.DS_Store')):
+                continue
+            if 'trec_eval(2)' in file: # trec23/clinical
+                continue
+            if 'short' in file.split('.') or 'long' in file.split('.'):
+                continue
+            yield os.path.join(root, file)
+
+
+def parser_hash():
+    # any change to the parsers invalidates the ledgers
+    with open(__file__, 'rb') as f_in:
+        return hashlib.sha256(f_in.read()).hexdigest()
+
+
+def file_hash(file_path):
+    with open(file_path, 'rb') as f_in:
+        return hashlib.sha256(f_in.read()).hexdigest()
+
+
+def load_ledger(ledger_path, parser):
+    try:
+        with open(ledger_path, 'rb') as f_in:
+            ledger = pickle.load(f_in)
+        if ledger['parser'] == parser:
+            return ledger['files']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError):
+        pass
+    return {}
+
 
+def write_ledger(ledger_path, parser, files):
+    os.makedirs(os.path.dirname(ledger_path), exist_ok=True)
+    tmp_path = ledger_path + '.tmp'
+    with open(tmp_path, 'wb') as f_out:
+        pickle.dump({'parser': parser, 'files': files}, f_out, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, ledger_path)
 
-def results_df():
+
+def ingest_summaries(trec, track, parser=None):
+    # parse the summary files of a track, returns the results as a single frame and the per-file errors
+    # files that are unchanged since the last ingest are taken from the track's ledger
+    ledger_path = os.path.join(results_ledger, trec, track + '.pickle')
+    ledger = load_ledger(ledger_path, parser) if parser else {}
+    files = {}
+    changed = False
     data_df = []
+    errors = []
+    for file_path in summary_files(trec, track):
+        file = os.path.basename(file_path)
+        stat = os.stat(file_path)
+        entry = ledger.get(file_path)
+        if entry is not None and (entry['size'], entry['mtime']) != (stat.st_size, stat.st_mtime_ns):
+            # touched, but possibly not changed
+            if entry['size'] == stat.st_size and entry['hash'] == file_hash(file_path):
+                entry['mtime'] = stat.st_mtime_ns
+            else:
+                entry = None
+            changed = True
+        if entry is None:
+            changed = True
+            rows = []
+            try:
+                rows = parse_summary(rows, file, None, trec, track, file_path)
+                entry = {'size': stat.st_size, 'mtime': stat.st_mtime_ns, 'hash': file_hash(file_path), 'rows': rows}
+            except Exception as e:
+                errors.append((trec, track, file, '{}: {}'.format(type(e).__name__, e)))
+            data_df += rows
+        else:
+            data_df += entry['rows']
+        if entry is not None:
+            files[file_path] = entry
+    if parser and (changed or files.keys() != ledger.keys()):
+        write_ledger(ledger_path, parser, files)
+    return pd.DataFrame(data_df), errors
+
+
+def results_df(workers=None, incremental=True):
+    # returns the results of all tracks and the (trec, track, file, error) of the summary files that failed to parse
     tracks = tracks_df()
     trecs = tracks.trec.unique()
+    batches = []
+    partitions = []
     for trec in trecs:
         if trec == 'trec-covid': # "summary files" are different for TREC-COVID 
-            data_df = parse_summary_covid(data_df, trec, tracks)
+            batches.append(parse_summary_covid(trec, tracks))
         _tracks = tracks[(tracks['trec'] == trec)].track.unique()
         for track in _tracks:
-            if (trec, track) in no_summary + no_summary_parsing:
+            if (trec, track) in no_summary | no_summary_parsing:
                 continue
-            summaries_path = os.path.join('trec', trec, track, 'summaries')
-            if (trec, track) == ('trec28', 'cast'):
-                summaries_path = os.path.join('trec', trec, 'converse', 'summaries')
-            for root, dirs, files in os.walk(summaries_path):
-                files.sort(key=str.lower)
-                for file in files:
-                    if file.endswith(('.tsv', '.csv', '.rbp', '.tar', '.gz', '.tgz', '.Z', '.pdf', '.eps', '.ps', '.DS_Store')):
-                        continue
-                    if 'trec_eval(2)' in file: # trec23/clinical
-                        continue
-                    if 'short' in file.split('.') or 'long' in file.split('.'):
-                        continue
-                    else:
-                        try: 
-                            file_path= os.path.join(root, file)
-                            with open(file_path) as f_in:
-                                lines = f_in.readlines()
-                            data_df = parse_summary(data_df, file, lines, trec, track, file_path)
-                        except Exception as e:
-                            print(trec, track, file, e)
-    return pd.DataFrame(data_df)
+            partitions.append((trec, track))
+            # placeholder, filled in with the track's results once they are ingested
+            batches.append(None)
+    parser = parser_hash() if incremental else None
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(partitions) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ingested = list(executor.map(ingest_summaries, *zip(*partitions), [parser] * len(partitions)))
+    else:
+        ingested = [ingest_summaries(trec, track, parser) for trec, track in partitions]
+    ingested = iter(ingested)
+    errors = []
+    for i, batch in enumerate(batches):
+        if batch is None:
+            batches[i], track_errors = next(ingested)
+            errors += track_errors
+    for error in errors:
+        print(*error)
+    batches = [batch for batch in batches if not batch.empty]
+    if not batches:
+        return pd.DataFrame(), errors
+    return pd.concat(batches, ignore_index=True), errors
+
+
+def summary_partitions(tracks):
+    for trec in tracks.trec.unique():
+        for track in tracks[(tracks['trec'] == trec)].track.unique():
+            if (trec, track) not in no_summary | no_summary_parsing:
+                yield trec, track
+
+
+def ingest_topic_results(trec, track):
+    # per-topic scores of the track's trec_eval summaries, written to a single columnar file
+    columns = {'runid': [], 'eval': [], 'measure': [], 'topic': [], 'score': []}
+    errors = []
+    for file_path in summary_files(trec, track):
+        file = os.path.basename(file_path)
+        runid, eval = parse_file_name(file, trec, track)
+        if track in ['misinfo', 'session'] or get_summary_parser(trec, track, eval) is not parse_trec_eval:
+            continue
+        try:
+            for measure, topic, score in tokenize_trec_eval(file_path, track_measures(eval), eval, topics=True):
+                if topic != 'all':
+                    columns['runid'].append(runid)
+                    columns['eval'].append(eval)
+                    columns['measure'].append(measure)
+                    columns['topic'].append(topic)
+                    columns['score'].append(score)
+        except Exception as e:
+            errors.append((trec, track, file, '{}: {}'.format(type(e).__name__, e)))
+    file_path = topic_results_path.format(trec=trec, track=track)
+    if not columns['runid']:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+        return 0, errors
+    table = pd.DataFrame({col: pd.Categorical(values) for col, values in columns.items() if col != 'score'})
+    table['score'] = pd.to_numeric(pd.Series(columns['score']), errors='coerce').astype('float32')
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    table.to_feather(file_path)
+    return len(table), errors
+
+
+def write_topic_results(workers=None):
+    # opt-in, the per-topic scores are kept out of the database and loaded by the page builder on demand
+    partitions = list(summary_partitions(tracks_df()))
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(partitions) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            ingested = list(executor.map(ingest_topic_results, *zip(*partitions)))
+    else:
+        ingested = [ingest_topic_results(trec, track) for trec, track in partitions]
+    for _, errors in ingested:
+        for error in errors:
+            print(*error)
+    return sum(rows for rows, _ in ingested)
 
 
 def add_tables(engine):
+    # returns the summary files that failed to parse, the results table holds the others
+    tables = {}
+    errors = []
     table_names = ['tracks', 'runs', 'results', 'publications', 'participants', 'datasets']
     for tn in table_names:
         print(tn)
@@ -4023,19 +4808,24 @@ def add_tables(engine):
         if tn == 'datasets':
             table = datasets_df()    
         if tn == 'results':
-            table = results_df()       
-        table = table.replace(r'', np.nan, regex=True)
-        table.to_sql(tn, engine, if_exists='replace')
+            table, errors = results_df()
+        tables[tn] = normalize_empty_strings(table)
+    bulk_load(engine, tables, index=True)
+    return errors
 
 
-def main():
+def main(topics=False):
     write_publications_json()
     sqlite_filepath = 'trec.sqlite'
     engine = create_engine(f"sqlite:///{sqlite_filepath}")
     Base = declarative_base()
     Base.metadata.drop_all(engine)
-    add_tables(engine)
+    errors = add_tables(engine)
+    if topics:
+        write_topic_results()
+    if errors:
+        sys.exit('{} summary files could not be parsed'.format(len(errors)))
 
 
 if __name__ == '__main__':
-    main()
+    main(topics='--topics' in sys.argv[1:])
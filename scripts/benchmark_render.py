@@ -0,0 +1,104 @@
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+from builders import PageBuilder, load_all_tables
+
+
+base_path = Path("./metadata")
+
+# Track pages to time: page type -> (generator, pairs of PageBuilder for which the page is not built)
+page_types = {
+    'publications': ('proceedings_page_content', 'no_proceedings'),
+    'runs': ('runs_page_content', 'no_runs'),
+    'results': ('results_page_content', 'no_summary'),
+    'participants': ('participants_page_content', 'no_participants'),
+}
+
+
+def load_builders(revision):
+    """Import scripts/builders.py as of a git revision as a separate module."""
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:scripts/builders.py'],
+        cwd=Path(__file__).parent, check=True, capture_output=True
+    ).stdout
+    module_path = Path(tempfile.mkdtemp()) / 'builders_baseline.py'
+    module_path.write_bytes(source)
+    spec = importlib.util.spec_from_file_location('builders_baseline', module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def baseline_page_builder(module, tables):
+    """Build the baseline PageBuilder on the shared tables, or from the metadata files for revisions that cannot take them."""
+    try:
+        return module.PageBuilder(base_path=base_path, tables=tables)
+    except TypeError:
+        return module.PageBuilder(base_path=base_path)
+
+
+def largest_tracks(tables, n):
+    """Return the n (trec, track) pairs with the most runs and publications."""
+    sizes = (
+        tables['runs'].groupby(['trec', 'track']).size()
+        .add(tables['publications'].groupby(['trec', 'track']).size(), fill_value=0)
+        .sort_values(ascending=False, kind='stable')
+    )
+    return list(sizes.index[:n])
+
+
+def render(page_builder, method, trec, track):
+    """Render a page to a string (the page generators either return it or yield its fragments)."""
+    page = getattr(page_builder, method)(trec, track)
+    return page if isinstance(page, str) else ''.join(page)
+
+
+def render_time(page_builder, method, trec, track, repeat):
+    """Best time in milliseconds to render a page."""
+    return 1000 * min(timeit.repeat(lambda: render(page_builder, method, trec, track), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Compare per-page render times against a baseline revision of the page builder.',
+        epilog='Pages are checked against the baseline before they are timed. Against revisions from before the '
+               'anchor maps, the proceedings pages differ in their run and participant anchors only (e.g. #cmu.lira '
+               'is now #cmulira); that is expected, pass --allow-diff to time them anyway. Revisions whose '
+               'PageBuilder does not take tables load the baseline tables from the metadata files.'
+    )
+    parser.add_argument('--baseline', required=True, help='git revision of the page builder to compare against, from the one that indexed the tables '
+                             'by (trec, track) onwards, as older page builders render pages from other arguments')
+    parser.add_argument('--tracks', type=int, default=5, help='number of (largest) tracks to render')
+    parser.add_argument('--repeat', type=int, default=5, help='renders per page, the best one is reported')
+    parser.add_argument('--allow-diff', action='store_true', help='report pages that differ from the baseline instead of failing')
+    args = parser.parse_args()
+
+    tables = load_all_tables(base_path)
+    before = baseline_page_builder(load_builders(args.baseline), tables)
+    after = PageBuilder(base_path=base_path, tables=tables)
+
+    print(f"{'trec':<12} {'track':<16} {'page':<14} {'before (ms)':>12} {'after (ms)':>12} {'speedup':>8}")
+    total_before, total_after = 0.0, 0.0
+    for trec, track in largest_tracks(tables, args.tracks):
+        for page_type, (method, missing) in page_types.items():
+            if (trec, track) in getattr(after, missing):
+                continue
+            if render(before, method, trec, track) != render(after, method, trec, track):
+                if not args.allow_diff:
+                    sys.exit(f'{trec}/{track}/{page_type}: page differs from the baseline')
+                print(f'{trec}/{track}/{page_type}: page differs from the baseline', file=sys.stderr)
+            t_before = render_time(before, method, trec, track, args.repeat)
+            t_after = render_time(after, method, trec, track, args.repeat)
+            total_before += t_before
+            total_after += t_after
+            print(f"{trec:<12} {track:<16} {page_type:<14} {t_before:>12.2f} {t_after:>12.2f} {t_before / t_after:>7.2f}x")
+
+    print(f"{'total':<44} {total_before:>12.2f} {total_after:>12.2f} {total_before / total_after:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,17 +1,16 @@
+import os
 from pathlib import Path
 from builders import PageBuilder
 
 
 base_path = Path("./metadata")
 build_path = Path("./browser/src/docs")
+workers = os.cpu_count()
 
 
 def main():
     page_builder = PageBuilder(base_path=base_path)
-    page_builder.build_all(build_path=build_path, overwrite=False)
-    page_builder.create_index_page()
-    page_builder.create_data_page()
-    page_builder.create_mkdocs_config()
+    page_builder.build_all(build_path=build_path, overwrite=False, workers=workers)
 
 
 if __name__ == '__main__':
@@ -1,8 +1,13 @@
 import os
 import re 
 import json
-from typing import List, Tuple
+import hashlib
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, Tuple
+import ijson
 import pandas as pd
+from pyarrow import feather
 from tqdm import tqdm
 import yaml
 from sqlalchemy import create_engine
@@ -10,6 +15,17 @@ from docutils.nodes import make_id
 import numpy as np
 from pathlib import Path
 from sqlalchemy.orm import declarative_base
+from tables import ColumnBuffer, bulk_load, frame_from_records, normalize_empty_strings
+
+
+# Directory (below the metadata directory) with the binary snapshot of the loaded tables
+SNAPSHOT_DIR = '.snapshot'
+
+# Directory (below a conference's metadata directory) with the optional per-topic scores of each track
+TOPICS_DIR = 'topics'
+
+# Hash of this module, so that changes to the page templates invalidate the build manifest
+BUILDER_HASH = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
 
 
 # ---> begin: utility functions <---
@@ -33,19 +49,54 @@ def extract_trec_name(file_path: Path) -> str:
     return file_path.parent.name
 
 
-def load_from_files(base_path: Path, pattern: str, parse_fn) -> pd.DataFrame:
-    """Load and parse JSONs using a given function from matching files."""
-    records = []
-    for file_path in base_path.glob(pattern):
-        records.extend(parse_fn(file_path))
-    return pd.DataFrame(records)
+def iter_json_records(file_path: Path, depth: int) -> Iterator[Tuple[tuple, object]]:
+    """Stream the values nested `depth` containers deep in a JSON file, with the map keys leading to them.
+
+    The file is parsed incrementally, so only one record is held in memory at a time.
+    """
+    path = []  # keys of the enclosing containers (None for arrays)
+    builder = None
+    with open(file_path, 'rb') as f:
+        for _, event, value in ijson.parse(f, use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    nesting += 1
+                elif event in ('end_map', 'end_array'):
+                    nesting -= 1
+                    if nesting == 0:
+                        yield tuple(path), builder.value
+                        builder = None
+            elif event == 'map_key':
+                path[-1] = value
+            elif event in ('start_map', 'start_array'):
+                if len(path) == depth:
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    nesting = 1
+                else:
+                    path.append(None)
+            elif event in ('end_map', 'end_array'):
+                path.pop()
+            elif len(path) == depth:
+                yield tuple(path), value
+
+
+def load_from_files(base_path: Path, pattern: str, parse_fn, keep_empty=()) -> pd.DataFrame:
+    """Load and parse JSONs using a given function from matching files.
+
+    Records are turned into columns in batches (see frame_from_records()). Empty strings become
+    missing values, except in the `keep_empty` columns.
+    """
+    df = frame_from_records(record for file_path in base_path.glob(pattern) for record in parse_fn(file_path))
+    return normalize_empty_strings(df, [col for col in df.columns if col not in keep_empty])
 
 
 def dump_columns(df, cols):
     for col in cols:
         if col in df.columns:
             df[col] = df[col].apply(safe_json_dumps)
-    return df.replace(r"", np.nan, regex=True)
+    return normalize_empty_strings(df, cols)
 
 
 def convert(json_data: str, bold: bool = False, single_key: str = None) -> str:
@@ -69,6 +120,17 @@ def trec_year(trec_name: str) -> int:
     return 1991 + int(match.group()) if match else None
 
 
+@lru_cache(maxsize=None)
+def title_anchor(title: str) -> str:
+    """Return the anchor of a paper heading (memoized, as the same titles are linked from several pages)."""
+    return make_id(title)
+
+
+def name_anchor(name: str) -> str:
+    """Return the anchor of a run or participant heading."""
+    return name.lower().replace('.', '')
+
+
 def track_map(tracks) -> dict:
     """Return a nested dictionary mapping TREC -> track -> full name."""
     result = {}
@@ -80,6 +142,84 @@ def track_map(tracks) -> dict:
     return result
 
 
+def group_index(df: pd.DataFrame, keys) -> dict:
+    """Partition a table once into a dict of sub-frames keyed by the given column(s)."""
+    if df.empty or not set([keys] if isinstance(keys, str) else keys).issubset(df.columns):
+        return {}
+    return {key: group for key, group in df.groupby(keys, sort=False, observed=True)}
+
+
+def group_positions(df: pd.DataFrame, keys) -> dict:
+    """Index the row positions of a table by the given column(s), without copying any rows."""
+    if df.empty or not set([keys] if isinstance(keys, str) else keys).issubset(df.columns):
+        return {}
+    return df.groupby(keys, sort=False, observed=True).indices
+
+
+def hash_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_frame(df: pd.DataFrame) -> str:
+    """Return a stable hash of the content of a table."""
+    return hash_text(df.to_json(orient='split', index=False, default_handler=str))
+
+
+def write_if_changed(file_path: Path, content: str) -> bool:
+    """Write a text file unless it already holds the same bytes, so that unchanged files keep their mtime."""
+    data = content.encode('utf-8')
+    if file_path.exists() and file_path.read_bytes() == data:
+        return False
+    file_path.write_bytes(data)
+    return True
+
+
+def write_fragments(file_path: Path, fragments) -> str:
+    """Write text fragments to a file as they are produced and return the SHA-256 hex digest of the text.
+
+    A file that could not be written completely is removed again, so that no truncated file is left behind.
+    """
+    digest = hashlib.sha256()
+    try:
+        with open(file_path, 'w') as f_out:
+            for fragment in fragments:
+                digest.update(fragment.encode('utf-8'))
+                f_out.write(fragment)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest()
+
+
+def write_json_stream(file_path: Path, items):
+    """Write (key, value) pairs as one JSON object, formatted like json.dump(..., indent=4), one pair at a time."""
+    with open(file_path, 'w') as f:
+        f.write('{')
+        separator = '\n    '
+        for key, value in items:
+            f.write(separator + json.dumps(key) + ': ' + json.dumps(value, indent=4).replace('\n', '\n    '))
+            separator = ',\n    '
+        f.write('}' if separator == '\n    ' else '\n}')
+
+
+def nest_results(results: pd.DataFrame):
+    """Yield (track, runid -> eval -> topic -> measure -> score) mappings in a single pass over the sorted table."""
+    keys = ['track', 'runid', 'eval', 'topic']
+    results = results.dropna(subset=keys).sort_values(keys, kind='stable')
+    current_track, track_output = None, None
+    for track, runid, eval_name, topic, measure, score in zip(
+        results['track'], results['runid'], results['eval'], results['topic'], results['measure'], results['score']
+    ):
+        if track != current_track:
+            if track_output is not None:
+                yield current_track, track_output
+            current_track, track_output = track, {}
+        track_output.setdefault(runid, {}).setdefault(eval_name, {}).setdefault(topic, {})[measure] = score
+    if track_output is not None:
+        yield current_track, track_output
+
+
 def trec_sort_key(x):
     if x == 'trec-covid':
         return (0, 0)  # Highest priority
@@ -91,16 +231,17 @@ def trec_sort_key(x):
 # ---> begin: table loaders <---
 def load_all_runs(base_path):
     def parse(file_path):
-        runs = load_json(file_path)
-        return [run for track_runs in runs.values() for run in track_runs]
+        for _, run in iter_json_records(file_path, depth=2):
+            yield run
 
-    return load_from_files(base_path, 'trec*/runs.json', parse)
+    # An empty 'other' is stored as '""' in the database (see DBBuilder.load_tables), unlike a missing one
+    return load_from_files(base_path, 'trec*/runs.json', parse, keep_empty=['other'])
 
 
 def load_all_participants(base_path):
     def parse(file_path):
-        participants = load_json(file_path)
-        return list(participants.values())
+        for _, participant in iter_json_records(file_path, depth=1):
+            yield participant
 
     return load_from_files(base_path, 'trec*/participants.json', parse)
 
@@ -108,12 +249,9 @@ def load_all_participants(base_path):
 def load_all_publications(base_path):
     def parse(file_path):
         trec = extract_trec_name(file_path)
-        records = []
-        for track, track_pubs in load_json(file_path).items():
-            for metadata in track_pubs.values():
-                metadata.update({'trec': trec, 'track': track})
-                records.append(metadata)
-        return records
+        for (track, _), metadata in iter_json_records(file_path, depth=2):
+            metadata.update({'trec': trec, 'track': track})
+            yield metadata
 
     return load_from_files(base_path, 'trec*/publications.json', parse)
 
@@ -121,8 +259,8 @@ def load_all_publications(base_path):
 def load_all_datasets(base_path):
     def parse(file_path):
         trec = extract_trec_name(file_path)
-        datasets = load_json(file_path)
-        return [{**metadata, 'trec': trec, 'track': track} for track, metadata in datasets.items()]
+        for (track,), metadata in iter_json_records(file_path, depth=1):
+            yield {**metadata, 'trec': trec, 'track': track}
 
     return load_from_files(base_path, 'trec*/datasets.json', parse)
 
@@ -130,61 +268,263 @@ def load_all_datasets(base_path):
 def load_all_tracks(base_path):
     def parse(file_path):
         trec = extract_trec_name(file_path)
-        tracks = load_json(file_path)
-        return [{**metadata, 'trec': trec, 'track': track} for track, metadata in tracks.items()]
+        for (track,), metadata in iter_json_records(file_path, depth=1):
+            yield {**metadata, 'trec': trec, 'track': track}
 
     return load_from_files(base_path, 'trec*/tracks.json', parse)
 
 
-def load_all_results(base_path):
-    def parse(file_path):
+RESULT_KEYS = ['trec', 'track', 'runid', 'eval', 'topic', 'measure']
+
+
+def load_all_results(base_path) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Load the results into a table of float32 scores and a separate table of text cells (summaries).
+
+    The scores table also keeps the original score values as a categorical 'score_text' column,
+    so that the database and JSON exports write the scores exactly as they were read.
+    """
+    scores = ColumnBuffer(RESULT_KEYS + ['score_text'], np.float32)
+    texts = ColumnBuffer(RESULT_KEYS, object)
+
+    for file_path in base_path.glob('trec*/results.json'):
         trec = extract_trec_name(file_path)
-        results = load_json(file_path)
-        records = [
-            {
-                'trec': trec,
-                'track': track,
-                'runid': runid,
-                'eval': evaluation,
-                'topic': topic,
-                'measure': measure,
-                'score': score
-            }
-            for track, track_results in results.items()
-            for runid, evaluations in track_results.items()
-            for evaluation, topics in evaluations.items()
-            for topic, measures in topics.items()
-            for measure, score in measures.items()
+        # (track, runid, eval, topic, measure) -> score
+        for keys, score in iter_json_records(file_path, depth=5):
+            keys = (trec,) + keys
+            # The 'summary' pseudo-measure and non-numeric scores go to the text table
+            if keys[-1] == 'summary':
+                texts.append(keys, score)
+                continue
+            try:
+                # Missing scores get an empty text, which normalize_empty_strings() drops again
+                scores.append(keys + ('' if score is None else score,), np.nan if score is None else float(score))
+            except (TypeError, ValueError):
+                texts.append(keys, score)
+
+    return normalize_empty_strings(scores.to_frame('score')), normalize_empty_strings(texts.to_frame('text'))
+
+
+TABLE_NAMES = ['runs', 'participants', 'publications', 'datasets', 'tracks', 'results', 'summaries']
+
+
+def snapshot_key(base_path: Path) -> str:
+    """Key of a snapshot: this module plus the path, size and mtime of every metadata JSON file."""
+    stats = []
+    for file_path in sorted(base_path.glob('trec*/*.json')):
+        stat = file_path.stat()
+        stats.append([file_path.relative_to(base_path).as_posix(), stat.st_size, stat.st_mtime_ns])
+    return hash_text(json.dumps([BUILDER_HASH, stats]))
+
+
+def read_snapshot(base_path: Path, key: str) -> dict:
+    """Memory-map the tables of the snapshot if it was written for the given key, else return None."""
+    snapshot_path = base_path / SNAPSHOT_DIR
+    manifest_path = snapshot_path / 'snapshot.json'
+    if not manifest_path.exists():
+        return None
+    manifest = load_json(manifest_path)
+    if manifest.get('key') != key:
+        return None
+
+    tables = {}
+    for name in TABLE_NAMES:
+        df = feather.read_table(snapshot_path / f'{name}.feather', memory_map=True).to_pandas()
+        for col in manifest['encoded'][name]:
+            df[col] = df[col].map(json.loads)
+        tables[name] = df
+    return tables
+
+
+def write_snapshot(base_path: Path, key: str, tables: dict):
+    """Write the tables as Feather files, JSON-encoding object columns that hold more than strings."""
+    snapshot_path = base_path / SNAPSHOT_DIR
+    snapshot_path.mkdir(exist_ok=True)
+
+    encoded = {}
+    for name, df in tables.items():
+        encoded[name] = [
+            col for col in df.columns
+            if df[col].dtype == object and not df[col].map(type).isin([str, type(None)]).all()
         ]
-        return records
-
-    return load_from_files(base_path, 'trec*/results.json', parse)
+        df = df.assign(**{col: df[col].map(json.dumps) for col in encoded[name]})
+        feather.write_feather(df, snapshot_path / f'{name}.feather')
+
+    # The manifest is written last, so an interrupted write never leaves a snapshot that looks valid
+    (snapshot_path / 'snapshot.json').write_text(json.dumps({'key': key, 'encoded': encoded}, indent=4))
+
+
+def load_all_tables(base_path, use_snapshot=True) -> dict:
+    """Load all metadata tables, keyed by table name.
+
+    Unless the metadata JSON files changed since the last load, the tables are read from a
+    binary snapshot in `base_path/.snapshot` instead of being parsed again.
+    """
+    if use_snapshot:
+        key = snapshot_key(base_path)
+        tables = read_snapshot(base_path, key)
+        if tables is not None:
+            return tables
+
+    results, summaries = load_all_results(base_path)
+    tables = {
+        'runs': load_all_runs(base_path),
+        'participants': load_all_participants(base_path),
+        'publications': load_all_publications(base_path),
+        'datasets': load_all_datasets(base_path),
+        'tracks': load_all_tracks(base_path),
+        'results': results,
+        'summaries': summaries,
+    }
+
+    if use_snapshot:
+        write_snapshot(base_path, key, tables)
+    return tables
+
+
+def load_topic_results(base_path: Path, trec: str, track: str) -> pd.DataFrame:
+    """Memory-map the per-topic scores of a track (written by `create_db.py --topics`), or return None."""
+    file_path = base_path / trec / TOPICS_DIR / f'{track}.feather'
+    if not file_path.exists():
+        return None
+    return feather.read_table(file_path, memory_map=True).to_pandas()
+
+
+def results_to_long_format(results: pd.DataFrame, summaries: pd.DataFrame) -> pd.DataFrame:
+    """Combine scores and text cells into the long (trec, track, runid, eval, topic, measure, score) format."""
+    scores = results[RESULT_KEYS].astype(object)
+    scores['score'] = results['score_text'].astype(object).where(results['score_text'].notna(), None)
+    texts = summaries[RESULT_KEYS].astype(object)
+    texts['score'] = summaries['text']
+    return pd.concat([scores, texts], ignore_index=True)
 # ---> end: table loaders <---
 
 
+# ---> begin: missing metadata <---
+# Tracks with online summaries but no implemented parser
+NO_SUMMARY_PARSING = frozenset([
+    ('trec33', 'avs'), ('trec33', 'atomic'), ('trec33', 'biogen'), 
+    ('trec33', 'ikat'), ('trec33', 'lateral'), ('trec33', 'medvidqa'), 
+    ('trec33', 'neuclir'), ('trec33', 'plaba'), ('trec33', 'product'), 
+    ('trec33', 'rag'), ('trec33', 'tot'), ('trec33', 'vtt'), 
+    ('trec32', 'crisis'), ('trec32', 'trials'), ('trec32', 'deep'), 
+    ('trec32', 'ikat'), ('trec32', 'neuclir'), ('trec32', 'atomic'), 
+    ('trec32', 'product'), ('trec32', 'tot'), ('trec31', 'crisis'), 
+    ('trec31', 'fair'), ('trec30', 'fair'), ('trec29', 'fair'), 
+    ('trec28', 'fair'), ('trec27', 'incident'), ('trec26', 'rts'), 
+    ('trec25', 'realtime'), ('trec24', 'domain'), ('trec24', 'tempsumm'), 
+    ('trec21', 'crowd'), ('trec19', 'session'), ('trec17', 'relfdbk'), 
+    ('trec17', 'million-query'), ('trec16', 'qa'), ('trec15', 'qa'), 
+    ('trec14', 'qa'), ('trec13', 'qa'), ('trec12', 'qa'), 
+    ('trec11', 'qa'), ('trec10', 'qa'), ('trec9', 'qa'), 
+    ('trec8', 'qa'), ('trec8', 'xlingual'), ('trec7', 'filtering'), 
+    ('trec4', 'filtering')
+])
+
+# Known exceptions that should not be flagged as missing summaries
+SUMMARY_EXCEPTIONS = frozenset(
+    [('trec-covid', f'round{i}') for i in range(1, 6)] +
+    [('trec19', 'chemical'), ('trec11', 'xlingual'), ('trec5', 'dbmerge')]
+)
+# ---> end: missing metadata <---
+
+
+# ---> begin: page templates <---
+# Page fragments as bound str.format methods, so that the format strings are parsed once at import time
+# and the page generators only append the filled-in fragments to a list that is joined once per page.
+SEARCH_EXCLUDE = "---\nsearch:\n  exclude: true\n---\n\n"
+SECTION_END = "---\n\n"
+
+PAGE_TITLE = "# {} - {} {}\n\n".format
+SECTION_TITLE = "## {}\n\n".format
+TRACK_SUMMARY = "{}\n\n{{==\n\n{}\n\n==}}\n\n".format
+COORDINATORS = ":fontawesome-solid-user-group: **Track coordinator(s):**\n\n{}\n\n".format
+COORDINATOR = "- {}".format
+TASK = "- `{}`: {}\n".format
+WEBPAGE = ":fontawesome-solid-globe: **Track Web Page:** [`{0}`]({0})\n\n".format
+QUICK_LINK = "[`{}`](./{}{}.md)".format
+ROUND_LINKS = "**{}:** {}\n\n".format
+
+PAPER_HEADER = "#### {}\n\n_{}_\n\n".format
+PAPER_LINK = "- :material-file-pdf-box: **Paper:** [{0}]({0})\n".format
+PARTICIPANT_LINK = "- :fontawesome-solid-user-group: **Participant:** [{}](./{}participants.md#{})\n".format
+RUN_LINKS = "- :material-file-search: **Runs:** {}\n".format
+RUN_REF = "[{}](./{}runs.md#{})".format
+ABSTRACT = '??? abstract "Abstract"\n\t\n\t{}\n\t\n\n'.format
+BIBTEX = '??? quote "Bibtex [:material-link-variant:]({}){}"\n\t```\n\t{}\n\t```\n\n'.format
+
+RESULT_HEADER = "#### {}\n".format
+RESULT_SUMMARY = '??? example "summary ({})"\n\t```\n{}\n\t```\n'.format
+METADATA_LINK = "[**`{}`**](./{}.md#{})".format
+
+RUN_HEADER = (
+    "#### {0}  \n{1}  \n\n"
+    "- :material-rename: **Run ID:** {0}  \n"
+    "- :fontawesome-solid-user-group: **Participant:** {2}  \n"
+    "- :material-format-text: **Track:** {3}  \n"
+    "- :material-calendar: **Year:** {4}  \n"
+).format
+RUN_SUBMISSION = "- :material-upload: **Submission:** {}  \n".format
+RUN_TYPE = "- :fontawesome-solid-user-gear: **Type:** {}  \n".format
+RUN_TASK = "- :material-text-search: **Task:** {}  \n".format
+RUN_MD5 = "- :material-fingerprint: **MD5:** `{}`  \n".format
+RUN_DESCRIPTION = "- :material-text: **Run description:** {}  \n".format
+RUN_CODE = "- :material-code-tags: **Code:** [{0}]({0})  \n".format
+BLOCK_END = "\n---\n"
+
+PARTICIPANT_HEADER = "#### {}\n".format
+PARTICIPANT_NAME = "- :fontawesome-solid-user-group: **Name:** {}\n".format
+PARTICIPANT_ORGANIZATION = "- :octicons-organization-16: **Organization:** {}\n".format
+
+DATA_WEBPAGE = ":fontawesome-solid-globe: **`trec.nist.gov`**: [`{0}`]({0})\n\n".format
+DATA_RESOURCE = "- {} **{}**: {}\n".format
+DATA_OTHER = "**Other:** {}\n".format
+
+# Quick access links of a track: (label, page, attribute with the (trec, track) pairs that do not have the page)
+QUICK_ACCESS = [
+    ('Proceedings', 'proceedings', 'no_proceedings'),
+    ('Data', 'data', 'no_data'),
+    ('Results', 'results', 'no_summary'),
+    ('Runs', 'runs', 'no_runs'),
+    ('Participants', 'participants', 'no_participants'),
+]
+
+# Primary resources listed on the data page: (column, icon, label)
+DATA_RESOURCES = [
+    ('corpus', ':material-database:', 'Corpus'),
+    ('topics', ':octicons-question-16:', 'Topics'),
+    ('qrels', ':material-label:', 'Qrels'),
+    ('ir_datasets', ':material-database-outline:', 'ir_datasets'),
+]
+# ---> end: page templates <---
+
+
 class DBBuilder:
     def __init__(self, base_path=Path("./metadata")):
         self.base_path=base_path
-        self.runs = load_all_runs(self.base_path)
-        self.participants = load_all_participants(self.base_path)
-        self.publications = load_all_publications(self.base_path)
-        self.datasets = load_all_datasets(self.base_path)
-        self.tracks = load_all_tracks(self.base_path)
-        self.results = load_all_results(self.base_path)
+        tables = load_all_tables(self.base_path)
+        self.runs = tables['runs']
+        self.participants = tables['participants']
+        self.publications = tables['publications']
+        self.datasets = tables['datasets']
+        self.tracks = tables['tracks']
+        self.results = tables['results']
+        self.summaries = tables['summaries']
 
 
     def load_tables(self, engine):
         if 'other' in self.runs.columns:
             self.runs['other'] = self.runs['other'].apply(json.dumps)
-        self.runs = self.runs.replace(r"", np.nan, regex=True)
-        self.runs.to_sql('runs', engine, if_exists='replace', index=False)
-        self.participants.replace(r"", np.nan, regex=True).to_sql('participants', engine, if_exists='replace', index=False)
-        self.publications.replace(r"", np.nan, regex=True).to_sql('publications', engine, if_exists='replace', index=False)
         self.datasets = dump_columns(self.datasets, ['corpus', 'topics', 'qrels', 'ir_datasets', 'trec_webpage', 'other'])
-        self.datasets.to_sql('datasets', engine, if_exists='replace', index=False)
         self.tracks = dump_columns(self.tracks, ['tasks'])
-        self.tracks.to_sql('tracks', engine, if_exists='replace', index=False)
-        self.results.replace(r"", np.nan, regex=True).to_sql('results', engine, if_exists='replace', index=False)
+        results = results_to_long_format(self.results, self.summaries)
+        bulk_load(engine, {
+            'runs': self.runs,
+            'participants': self.participants,
+            'publications': self.publications,
+            'datasets': self.datasets,
+            'tracks': self.tracks,
+            'results': results,
+        })
 
 
     def create_db_from_json(self, sqlite_filepath):
@@ -195,125 +535,152 @@ class DBBuilder:
 
 
 class PageBuilder:
-    def __init__(self, base_path: Path = Path("./metadata"), build_path: Path = Path("./browser/src/docs")):
+    def __init__(self, base_path: Path = Path("./metadata"), build_path: Path = Path("./browser/src/docs"), tables: dict = None):
         self.base_path=base_path
         self.build_path=build_path
 
-        # Load metadata
-        self.runs = load_all_runs(self.base_path)
-        self.participants = load_all_participants(self.base_path)
-        self.publications = load_all_publications(self.base_path)
-        self.datasets = load_all_datasets(self.base_path)
-        self.tracks = load_all_tracks(self.base_path)
-        self.results = load_all_results(self.base_path)
-
-        # Initialize missing metadata
-        self.no_input = self._init_missing_input()
-        self.no_appendix = self._init_missing_appendix()
-        self.no_proceedings = self._init_missing_proceedings()
-        self.no_runs = self._init_missing_runs()
-        self.no_participants = self._init_missing_participants()
-        self.no_data = self._init_missing_data()
-        self.no_summary = self._init_missing_summary()
-
-
-    def _get_trec_track_pairs(self) -> List[Tuple[str, str]]:
-        return [(row.trec, row.track) for row in self.tracks.itertuples(index=False)]
-
-
-    def _init_missing_input(self) -> List[Tuple[str, str]]:
-        no_input = []
-        for trec, track in self._get_trec_track_pairs():
-            r = self.runs[(self.runs['trec'] == trec) & (self.runs['track'] == track)]
-            if r['input_url'].isna().all():
-                no_input.append((trec, track))
-        return no_input
-
-
-    def _init_missing_appendix(self) -> List[Tuple[str, str]]:
-        no_appendix = []
-        for trec, track in self._get_trec_track_pairs():
-            r = self.runs[(self.runs['trec'] == trec) & (self.runs['track'] == track)]
-            if r['appendix_url'].isna().all():
-                no_appendix.append((trec, track))
-        return no_appendix
-
-
-    def _init_missing_participants(self) -> List[Tuple[str, str]]:
-        no_participants = []
-        for trec, track in self._get_trec_track_pairs():
-            r = self.runs[(self.runs['trec'] == trec) & (self.runs['track'] == track)]
-            if r.empty:
-                no_participants.append((trec, track))
-        return no_participants
-
-
-    def _init_missing_runs(self) -> List[Tuple[str, str]]:
-        no_runs = []
-        for trec, track in self._get_trec_track_pairs():
-            r = self.runs[(self.runs['trec'] == trec) & (self.runs['track'] == track)]
-            if r.empty:
-                no_runs.append((trec, track))
-        return no_runs
-
-
-    def _init_missing_proceedings(self) -> List[Tuple[str, str]]:
-        no_proceedings = []
-        for trec, track in self._get_trec_track_pairs():
-            p = self.publications[(self.publications['trec'] == trec) & (self.publications['track'] == track)]
-            if p.empty:
-                no_proceedings.append((trec, track))
-        return no_proceedings
-
-
-    def _init_missing_data(self) -> List[Tuple[str, str]]:
-        no_data = []
+        # Load metadata (build workers pass in their conference's partition instead)
+        if tables is None:
+            tables = load_all_tables(self.base_path)
+        self.runs = tables['runs']
+        self.participants = tables['participants']
+        self.publications = tables['publications']
+        self.datasets = tables['datasets']
+        self.tracks = tables['tracks']
+        self.results = tables['results']
+        self.summaries = tables['summaries']
+
+        # Index metadata by (trec), (trec, track) and (trec, track, pid)
+        self._init_indexes()
+
+        # Index the anchors that the pages link to
+        self._init_anchors()
+
+        # Build manifest of the conference that is currently built (see build())
+        self.manifest = {}
+        self.manifest_updates = {}
+        self._inputs_hashes = {}
+
+        # Initialize missing metadata (frozensets of (trec, track) pairs)
+        self.availability = self._init_availability()
+        self.no_input = self._missing('input')
+        self.no_appendix = self._missing('appendix')
+        self.no_proceedings = self._missing('proceedings')
+        self.no_runs = self._missing('runs')
+        self.no_participants = self._missing('participants')
+        self.no_data = self._missing('data')
+        self.no_summary = self._missing('summary') | NO_SUMMARY_PARSING
+
+
+    def _init_indexes(self):
+        # Row positions only, the rows are sliced when a partition is asked for (see partition())
+        self.trec_index = {name: group_positions(getattr(self, name), 'trec') for name in TABLE_NAMES}
+        self.track_index = {name: group_positions(getattr(self, name), ['trec', 'track']) for name in TABLE_NAMES}
+        self.pid_index = {
+            'runs': group_positions(self.runs, ['trec', 'track', 'pid']),
+            'publications': group_positions(self.publications, ['trec', 'track', 'pid']),
+            'participants': group_positions(self.participants, ['trec', 'pid']),
+        }
+
+
+    def _init_anchors(self):
+        # (trec, track, pid) -> anchor of the participant's paper on the proceedings page
+        pubs = self.publications.drop_duplicates(subset=['trec', 'track', 'pid'])
+        self.publication_anchors = {
+            (trec, track, pid): title_anchor(title or '')
+            for trec, track, pid, title in zip(pubs['trec'], pubs['track'], pubs['pid'], pubs['title'])
+        }
+
+        # (trec, track, runid) -> anchors of the run on the results, participants and runs pages
+        runs = self.runs.drop_duplicates(subset=['trec', 'track', 'runid'])
+        self.run_anchors = {}
+        for trec, track, runid, pid in zip(runs['trec'], runs['track'], runs['runid'], runs['pid']):
+            self.run_anchors[(trec, track, runid)] = {
+                # Session runs share the results of their base run id
+                'results': ''.join(runid.lower().split('.')[:-1]) if track == 'session' else name_anchor(runid),
+                'participants': name_anchor(pid),
+                'runs': name_anchor(runid),
+            }
+
+
+    def partition(self, table: str, trec: str, track: str = None, pid: str = None) -> pd.DataFrame:
+        """Return the indexed rows of a table for a trec, (trec, track) or (trec, track, pid) key."""
+        if pid is not None:
+            key = (trec, pid) if table == 'participants' else (trec, track, pid)
+            positions = self.pid_index[table].get(key)
+        elif track is not None:
+            positions = self.track_index[table].get((trec, track))
+        else:
+            positions = self.trec_index[table].get(trec)
+        return getattr(self, table).iloc[positions if positions is not None else slice(0, 0)]
+
+
+    def conference_tables(self, trec: str) -> dict:
+        """Return the partition of every metadata table that belongs to one conference."""
+        return {name: self.partition(name, trec) for name in TABLE_NAMES}
+
+
+    def page_inputs_hash(self, trec: str, track: str = None) -> str:
+        """Hash the metadata a conference page (track=None) or a track page is rendered from."""
+        key = (trec, track)
+        if key not in self._inputs_hashes:
+            if track is None:
+                frames = list(self.conference_tables(trec).values())
+                pairs = [(trec, t) for t in self.partition('tracks', trec).track.unique()]
+            else:
+                frames = [self.partition(name, trec, track) for name in TABLE_NAMES if name != 'participants']
+                # Only the participants with runs in the track appear on its pages
+                participants = self.partition('participants', trec)
+                frames.append(participants[participants['pid'].isin(self.partition('runs', trec, track)['pid'])])
+                pairs = [key]
+
+            missing = [
+                self.no_input, self.no_appendix, self.no_proceedings, self.no_runs,
+                self.no_participants, self.no_data, self.no_summary
+            ]
+            flags = [[pair in no_metadata for no_metadata in missing] for pair in pairs]
+
+            digest = hashlib.sha256(BUILDER_HASH.encode('utf-8'))
+            for frame in frames:
+                digest.update(hash_frame(frame).encode('utf-8'))
+            digest.update(json.dumps(flags).encode('utf-8'))
+            self._inputs_hashes[key] = digest.hexdigest()
+        return self._inputs_hashes[key]
+
+
+    def _init_availability(self) -> pd.DataFrame:
+        """Flag per (trec, track) which metadata is available, using one grouped pass per table."""
+        pairs = pd.MultiIndex.from_frame(self.tracks[['trec', 'track']].drop_duplicates())
+        availability = pd.DataFrame(index=pairs)
+
+        runs = self.runs.groupby(['trec', 'track']).agg(
+            runs=('runid', 'size'),
+            input=('input_url', 'count'),
+            appendix=('appendix_url', 'count'),
+            summary=('summary_url', 'count'),
+        ).reindex(pairs, fill_value=0) > 0
+        publications = self.publications.groupby(['trec', 'track']).size().reindex(pairs, fill_value=0) > 0
+
+        availability['input'] = runs['input']
+        availability['appendix'] = runs['appendix']
+        availability['proceedings'] = publications
+        availability['runs'] = runs['runs']
+        availability['participants'] = runs['runs']
+        availability['data'] = ~pairs.isin(self._init_missing_data())
+        availability['summary'] = (runs['summary'] | pairs.isin(SUMMARY_EXCEPTIONS)) & ~pairs.isin(NO_SUMMARY_PARSING)
+        return availability
+
+
+    def _init_missing_data(self) -> frozenset:
         nd = self.datasets[
             self.datasets[['corpus', 'topics', 'qrels', 'ir_datasets', 'trec_webpage', 'other']].isna().all(axis=1)
         ]
-        no_data = [(row.trec, row.track) for row in nd.itertuples(index=False)]
-        return no_data
-
-
-    def _init_missing_summary(self) -> List[Tuple[str, str]]:
-
-        no_summary = []
-
-        # Tracks with online summaries but no implemented parser
-        no_parsing = [ 
-            ('trec33', 'avs'), ('trec33', 'atomic'), ('trec33', 'biogen'), 
-            ('trec33', 'ikat'), ('trec33', 'lateral'), ('trec33', 'medvidqa'), 
-            ('trec33', 'neuclir'), ('trec33', 'plaba'), ('trec33', 'product'), 
-            ('trec33', 'rag'), ('trec33', 'tot'), ('trec33', 'vtt'), 
-            ('trec32', 'crisis'), ('trec32', 'trials'), ('trec32', 'deep'), 
-            ('trec32', 'ikat'), ('trec32', 'neuclir'), ('trec32', 'atomic'), 
-            ('trec32', 'product'), ('trec32', 'tot'), ('trec31', 'crisis'), 
-            ('trec31', 'fair'), ('trec30', 'fair'), ('trec29', 'fair'), 
-            ('trec28', 'fair'), ('trec27', 'incident'), ('trec26', 'rts'), 
-            ('trec25', 'realtime'), ('trec24', 'domain'), ('trec24', 'tempsumm'), 
-            ('trec21', 'crowd'), ('trec19', 'session'), ('trec17', 'relfdbk'), 
-            ('trec17', 'million-query'), ('trec16', 'qa'), ('trec15', 'qa'), 
-            ('trec14', 'qa'), ('trec13', 'qa'), ('trec12', 'qa'), 
-            ('trec11', 'qa'), ('trec10', 'qa'), ('trec9', 'qa'), 
-            ('trec8', 'qa'), ('trec8', 'xlingual'), ('trec7', 'filtering'), 
-            ('trec4', 'filtering')
-        ]
-
-        # Known exceptions that should not be flagged as missing summaries
-        summary_exceptions = {
-            ('trec-covid', f'round{i}') for i in range(1, 6)
-        }.union({
-            ('trec19', 'chemical'), ('trec11', 'xlingual'), ('trec5', 'dbmerge')
-        })
-
-        for trec, track in self._get_trec_track_pairs():
-            r = self.runs[(self.runs['trec'] == trec) & (self.runs['track'] == track)]
-            if r['summary_url'].isna().all() and (trec, track) not in summary_exceptions:
-                no_summary.append((trec, track))
+        return frozenset((row.trec, row.track) for row in nd.itertuples(index=False))
 
-        no_summary += no_parsing
 
-        return no_summary
+    def _missing(self, metadata: str) -> frozenset:
+        """Return the (trec, track) pairs for which the given metadata is not available."""
+        return frozenset(self.availability.index[~self.availability[metadata]])
 
 
     def metadata_to_json(self, json_input, db_input):
@@ -355,8 +722,7 @@ class PageBuilder:
                 json.dump(data, f, indent=4)
 
         # Process runs
-        for trec_conf in tables['runs']['trec'].unique():
-            df_runs = tables['runs'][tables['runs']['trec'] == trec_conf]
+        for trec_conf, df_runs in tables['runs'].groupby('trec', sort=False):
             output = {}
             for track, group in df_runs.groupby('track'):
                 output[track] = []
@@ -368,577 +734,459 @@ class PageBuilder:
             write_json(output, trec_conf, 'runs.json')
 
         # Process participants
-        for trec_conf in tables['participants']['trec'].unique():
-            df_participants = tables['participants'][tables['participants']['trec'] == trec_conf]
+        for trec_conf, df_participants in tables['participants'].groupby('trec', sort=False):
             output = {
                 row['pid']: {k: v for k, v in row.items() if k != 'index'}
                 for row in df_participants.to_dict(orient='records')
             }
             write_json(output, trec_conf, 'participants.json')
 
-        # Process results
-        for trec_conf in tables['results']['trec'].unique():
-            df_results = tables['results'][tables['results']['trec'] == trec_conf]
-            output = {}
-            for track, track_df in df_results.groupby('track'):
-                runs_output = {}
-                for runid, run_df in track_df.groupby('runid'):
-                    evals_output = {}
-                    for eval_name, eval_df in run_df.groupby('eval'):
-                        topics_output = {}
-                        for topic, topic_df in eval_df.groupby('topic'):
-                            measures_scores = {
-                                row['measure']: row['score']
-                                for _, row in topic_df.iterrows()
-                            }
-                            topics_output[topic] = measures_scores
-                        evals_output[eval_name] = topics_output
-                    runs_output[runid] = evals_output
-                output[track] = runs_output
-            write_json(output, trec_conf, 'results.json')
+        # Process results (streamed to disk one track at a time)
+        for trec_conf, df_results in tables['results'].groupby('trec', sort=False):
+            write_json_stream(self.base_path / trec_conf / 'results.json', nest_results(df_results))
+
 
+    # Empty text fields are loaded as missing values (see normalize_empty_strings()), so the page
+    # helpers below render missing values as empty strings, like the empty strings they replace
 
     def format_bibtex(self, bibtex: str) -> str:
-        return bibtex.strip().replace('\n', '\n\t')
+        return (bibtex or '').strip().replace('\n', '\n\t')
 
 
     def format_abstract(self, abstract: str) -> str:
-        return f'??? abstract "Abstract"\n\t\n\t{abstract}\n\t\n\n' if abstract else ''
+        return ABSTRACT(abstract) if abstract else ''
 
 
     def format_bibtex_block(self, bibtex: str, biburl: str) -> str:
-        return f'??? quote "Bibtex [:material-link-variant:]({biburl}) "\n\t```\n\t{bibtex}\n\t```\n\n'
+        return BIBTEX(biburl or '', ' ', bibtex)
+
 
+    def format_paper_header(self, pub) -> str:
+        return PAPER_HEADER(pub.title or '', pub.author or '') + PAPER_LINK(pub.url or '')
 
-    def proceedings_page_content(self, trec, track, publications, runs, tracks):
+
+    def quick_access_links(self, trec, track, prefix=''):
+        """Return the links to the existing pages of a track, relative to the directory `prefix` of the track."""
+        return [
+            QUICK_LINK(label, prefix, page)
+            for label, page, missing in QUICK_ACCESS
+            if (trec, track) not in getattr(self, missing)
+        ]
+
+
+    def proceedings_page_content(self, trec, track):
         """Generate the proceedings page of a track."""
         
-        pubs = publications[(publications['track'] == track) & (publications['trec'] == trec)]
-        track_row = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].iloc[0]
-        track_fullname = track_row.fullname
+        pubs = self.partition('publications', trec, track)
+        track_row = self.partition('tracks', trec, track).iloc[0]
 
-        content = f"# Proceedings - {track_fullname} {trec_year(trec)}\n\n"
+        yield PAGE_TITLE('Proceedings', track_row.fullname, trec_year(trec))
 
         # Add overview paper if available
         overview = pubs[pubs['pid'] == 'overview']
         if not overview.empty:
             o = overview.iloc[0]
-            content += f"#### {o.title}\n\n"
-            content += f"_{o.author}_\n\n"
-            content += f"- :material-file-pdf-box: **Paper:** [{o.url}]({o.url})\n"
-            content += self.format_abstract(o.abstract)
-            content += self.format_bibtex_block(self.format_bibtex(o.bibtex), o.get('biburl', ''))
+            yield self.format_paper_header(o)
+            yield self.format_abstract(o.abstract)
+            yield self.format_bibtex_block(self.format_bibtex(o.bibtex), o.get('biburl', ''))
 
         # Add individual papers
+        link_participants = (trec, track) not in self.no_participants
         for pub in pubs.itertuples():
             if pub.pid == 'overview':
                 continue
 
-            content += f"#### {pub.title}\n\n"
-            content += f"_{pub.author}_\n\n"
+            yield PAPER_HEADER(pub.title or '', pub.author or '')
 
             # Link to participants page
-            if (trec, track) not in self.no_participants:
-                content += f"- :fontawesome-solid-user-group: **Participant:** [{pub.pid}](./participants.md#{pub.pid.lower()})\n"
+            if link_participants:
+                yield PARTICIPANT_LINK(pub.pid, '', name_anchor(pub.pid))
 
             # Link to paper
-            content += f"- :material-file-pdf-box: **Paper:** [{pub.url}]({pub.url})\n"
+            yield PAPER_LINK(pub.url or '')
 
             # Link to runs
-            track_runs = runs[(runs['trec'] == trec) & (runs['track'] == track) & (runs['pid'] == pub.pid)]
+            track_runs = self.partition('runs', trec, track, pub.pid)
             if not track_runs.empty:
-                run_links = ' | '.join(
-                    f"[{r.runid}](./runs.md#{r.runid.lower()})" for r in track_runs.itertuples()
-                )
-                content += f"- :material-file-search: **Runs:** {run_links}\n\n"
-            else:
-                content += '\n'
-
-            content += self.format_abstract(pub.abstract)
-            content += self.format_bibtex_block(self.format_bibtex(pub.bibtex), pub.biburl)
-
-        return content
+                yield RUN_LINKS(' | '.join(RUN_REF(runid, '', self.run_anchors[(trec, track, runid)]['runs']) for runid in track_runs.runid))
+            yield '\n'
 
+            yield self.format_abstract(pub.abstract)
+            yield self.format_bibtex_block(self.format_bibtex(pub.bibtex), pub.biburl)
 
-    def get_run_metadata_links(self, run_row, trec, track, publications):
-        links = []
-        run_url_id = run_row.runid.lower().replace('.', '')
-        links.append(f'[**`Metadata`**](./runs.md#{run_url_id})')
 
-        participant_id = run_row.pid.lower().replace('.', '')
-        links.append(f'[**`Participants`**](./participants.md#{participant_id})')
-
-        pub_match = publications[
-            (publications['trec'] == trec) & 
-            (publications['track'] == track) & 
-            (publications['pid'] == run_row.pid)
+    def get_run_metadata_links(self, run_row, trec, track):
+        anchors = self.run_anchors[(trec, track, run_row.runid)]
+        links = [
+            METADATA_LINK('Metadata', 'runs', anchors['runs']),
+            METADATA_LINK('Participants', 'participants', anchors['participants']),
         ]
-        if not pub_match.empty:
-            title_id = make_id(pub_match.iloc[0].title)
-            links.append(f'[**`Proceedings`**](./proceedings.md#{title_id})')
 
-        if run_row.input_url:
-            links.append(convert(run_row.input_url, bold=True, single_key='Input'))
-        if run_row.summary_url:
-            links.append(convert(run_row.summary_url, bold=True, single_key='Summary'))
-        if run_row.appendix_url:
-            links.append(convert(run_row.appendix_url, bold=True, single_key='Appendix'))
+        title_id = self.publication_anchors.get((trec, track, run_row.pid))
+        if title_id is not None:
+            links.append(METADATA_LINK('Proceedings', 'proceedings', title_id))
+
+        for label, url in [('Input', run_row.input_url), ('Summary', run_row.summary_url), ('Appendix', run_row.appendix_url)]:
+            if url:
+                links.append(convert(url, bold=True, single_key=label))
 
         return ' | '.join(links)
 
 
-    def results_page_content(self, trec, track, tracks, runs, results, publications):
+    def results_page_content(self, trec, track):
         """Generate the results page of a track."""
 
-        track_row = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].iloc[0]
-        track_fullname = track_row.fullname
+        track_row = self.partition('tracks', trec, track).iloc[0]
 
-        content = "---\nsearch:\n  exclude: true\n---\n\n"
-        content += f"# Results - {track_fullname} {trec_year(trec)}\n\n"
+        yield SEARCH_EXCLUDE
+        yield PAGE_TITLE('Results', track_row.fullname, trec_year(trec))
 
         # Get run IDs and summary results
-        runids = runs[(runs['trec'] == trec) & (runs['track'] == track)].runid.unique()
+        track_runs = self.partition('runs', trec, track)
+        runids = track_runs.runid.unique()
 
         if track == 'session':
             runids = set(''.join(runid.split('.')[:-1]) for runid in runids)
 
-        summaries = results[
-            (results['trec'] == trec) & 
-            (results['track'] == track) & 
-            (results['measure'] == 'summary')
-        ]
+        track_summaries = self.partition('summaries', trec, track)
+        summaries = group_index(track_summaries[track_summaries['measure'] == 'summary'], 'runid')
+        runs_by_id = {}
+        for run_row in track_runs.itertuples():
+            runs_by_id.setdefault(run_row.runid, run_row)
 
         for runid in runids:
-            _summaries = summaries[summaries['runid'] == runid]
-            if _summaries.empty:
+            _summaries = summaries.get(runid)
+            if _summaries is None:
                 continue
 
-            content += f"#### {runid}\n"
-
-            run_query = (runs['trec'] == trec) & (runs['track'] == track)
-            run = runs[run_query & (runs['runid'] == (runid + '.RL1' if track == 'session' else runid))]
-            if not run.empty:
-                run_row = run.iloc[0]
-                content += self.get_run_metadata_links(run_row, trec, track, publications) + "\n"
+            yield RESULT_HEADER(runid)
 
-            for summary in _summaries.itertuples():
-                content += f'??? example "summary ({summary.eval})"\n\t```\n{summary.score}\n\t```\n'
+            run_row = runs_by_id.get(runid + '.RL1' if track == 'session' else runid)
+            if run_row is not None:
+                yield self.get_run_metadata_links(run_row, trec, track)
+                yield '\n'
 
-            content += "---\n"
+            yield from (RESULT_SUMMARY(eval_name, text or '') for eval_name, text in zip(_summaries['eval'], _summaries['text']))
+            yield "---\n"
 
-        return content
 
-
-    def runs_page_content(self, trec, track, publications, runs, tracks):
+    def runs_page_content(self, trec, track):
         """Generate the runs page of a track."""
 
-        _runs = runs[(runs['trec'] == trec) & (runs['track'] == track)]
+        _runs = self.partition('runs', trec, track)
         _runs = _runs.sort_values(by='runid', key=lambda col: col.str.lower())
 
         # Track title and year
-        track_fullname = tracks[
-            (tracks['trec'] == trec) & (tracks['track'] == track)
-        ].fullname.iloc[0]
-        
-        content = f"# Runs - {track_fullname} {trec_year(trec)}\n\n"
+        track_fullname = self.partition('tracks', trec, track).fullname.iloc[0]
+
+        yield PAGE_TITLE('Runs', track_fullname, trec_year(trec))
 
+        link_results = (trec, track) not in self.no_summary
         for run in _runs.itertuples():
-            # Base reference to participant
-            participant_url_id = run.pid.lower().replace('.', '')
-            # if (trec, track) in no_summary or runid not in results[(results['trec'] == trec) & (results['track'] == track)]['runid']:
-            if (trec, track) in self.no_summary:
-                ref = f"[**`Participants`**](./participants.md#{participant_url_id})"
-            else:
-                result_url_id = ''.join(run.runid.lower().split('.')[:-1]) if track == 'session' else run.runid.lower().replace('.', '')
-                ref = f"[**`Results`**](./results.md#{result_url_id}) | [**`Participants`**](./participants.md#{participant_url_id})"
+            anchors = self.run_anchors[(trec, track, run.runid)]
+            refs = []
+
+            # Reference to results and participant
+            if link_results:
+                refs.append(METADATA_LINK('Results', 'results', anchors['results']))
+            refs.append(METADATA_LINK('Participants', 'participants', anchors['participants']))
 
             # Reference to proceeding paper
-            pub = publications[
-                (publications['trec'] == trec) & 
-                (publications['track'] == track) & 
-                (publications['pid'] == run.pid)
-            ]
-            if not pub.empty:
-                title_id = make_id(pub.iloc[0].title)
-                ref += f" | [**`Proceedings`**](./proceedings.md#{title_id})"
+            title_id = self.publication_anchors.get((trec, track, run.pid))
+            if title_id is not None:
+                refs.append(METADATA_LINK('Proceedings', 'proceedings', title_id))
 
             # Input/Summary/Appendix links
             for label, url in [('Input', run.input_url), ('Summary', run.summary_url), ('Appendix', run.appendix_url)]:
                 if url:
-                    ref += f" | {convert(url, bold=True, single_key=label)}"
+                    refs.append(convert(url, bold=True, single_key=label))
 
             # Metadata block
-            content += f"""#### {run.runid}  
-{ref}  
-
-- :material-rename: **Run ID:** {run.runid}  
-- :fontawesome-solid-user-group: **Participant:** {run.pid}  
-- :material-format-text: **Track:** {track_fullname}  
-- :material-calendar: **Year:** {run.year}  
-"""
+            yield RUN_HEADER(run.runid, ' | '.join(refs), run.pid, track_fullname, run.year)
             if run.date:
-                content += f"- :material-upload: **Submission:** {run.date}  \n"
+                yield RUN_SUBMISSION(run.date)
             if run.type:
-                content += f"- :fontawesome-solid-user-gear: **Type:** {run.type}  \n"
+                yield RUN_TYPE(run.type)
             if run.task:
-                content += f"- :material-text-search: **Task:** {run.task}  \n"
+                yield RUN_TASK(run.task)
             if run.md5 and len(run.md5) == 32:
-                content += f"- :material-fingerprint: **MD5:** `{run.md5.strip()}`  \n"
+                yield RUN_MD5(run.md5.strip())
             if run.description:
-                content += f"- :material-text: **Run description:** {run.description.strip()}  \n"
+                yield RUN_DESCRIPTION(run.description.strip())
             if run.other:
                 try:
                     repository = json.loads(run.other).get("repository")
                     if repository:
-                        content += f"- :material-code-tags: **Code:** [{repository}]({repository})  \n"
+                        yield RUN_CODE(repository)
                 except Exception:
                     pass
 
-            content += "\n---\n"
-
-        return content
+            yield BLOCK_END
 
 
-    def participants_page_content(self, trec, track, participants, runs, tracks):
+    def participants_page_content(self, trec, track):
         """Generate the participants page of a track."""
 
-        # Filter relevant runs
-        _runs = runs[(runs['trec'] == trec)]
-        pids = _runs.sort_values(by='pid', key=lambda col: col.str.lower()).pid.unique()
+        # Group the runs of the track by participant in one pass (the stable sort keeps the order of each participant's runs)
+        _runs = self.partition('runs', trec, track)
+        _runs = _runs.sort_values(by='pid', key=lambda col: col.str.lower(), kind='stable')
+        runs_by_pid = group_index(_runs, 'pid')
 
-        # Track title and year
-        track_fullname = tracks[
-            (tracks['trec'] == trec) & (tracks['track'] == track)
-        ].fullname.iloc[0]
-        
-        content = f"# Participants - {track_fullname} {trec_year(trec)}\n\n"
+        # Participant metadata of the conference: pid -> (name, organization)
+        participants = self.partition('participants', trec).drop_duplicates(subset='pid')
+        part_info = dict(zip(participants['pid'], zip(participants['name'], participants['organization'])))
 
-        for pid in pids:
-            p_runs = runs[
-                (runs['pid'] == pid) & 
-                (runs['trec'] == trec) & 
-                (runs['track'] == track)
-            ]
+        # Track title and year
+        track_fullname = self.partition('tracks', trec, track).fullname.iloc[0]
 
-            if p_runs.empty:
-                continue
+        yield PAGE_TITLE('Participants', track_fullname, trec_year(trec))
 
-            # Get participant metadata
-            part_info = participants[
-                (participants['trec'] == trec) & 
-                (participants['pid'] == pid)
-            ]
-            name = part_info.name.iloc[0] if not part_info.empty else ""
-            organization = part_info.organization.iloc[0] if not part_info.empty else ""
+        for pid, p_runs in runs_by_pid.items():
+            name, organization = part_info.get(pid, ("", ""))
 
             # Format run references
-            run_refs = [
-                f"[{row.runid}](./runs.md#{row.runid.lower().replace('.', '')})"
-                for row in p_runs.itertuples()
-            ]
-            run_list = " | ".join(run_refs)
+            run_list = " | ".join(RUN_REF(runid, '', self.run_anchors[(trec, track, runid)]['runs']) for runid in p_runs.runid)
 
             # Add participant section
-            content += f"#### {pid}\n"
+            yield PARTICIPANT_HEADER(pid)
             if name:
-                content += f"- :fontawesome-solid-user-group: **Name:** {name}\n"
+                yield PARTICIPANT_NAME(name)
             if organization:
-                content += f"- :octicons-organization-16: **Organization:** {organization}\n"
+                yield PARTICIPANT_ORGANIZATION(organization)
             if run_list:
-                content += f"- :material-file-search: **Runs:** {run_list}\n"
-            content += "\n---\n"
-
-        return content
+                yield RUN_LINKS(run_list)
+            yield BLOCK_END
 
 
-    def track_overview_page_content(self, trec, track, tracks):
+    def track_overview_page_content(self, trec, track):
         """Generate the content of a track overview page."""
 
         # Extract the track row once
-        track_row = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].iloc[0]
-
-        # Quick access links
-        quick_access_parts = []
-        if (trec, track) not in self.no_proceedings:
-            quick_access_parts.append('[`Proceedings`](./proceedings.md)')
-        if (trec, track) not in self.no_data:
-            quick_access_parts.append('[`Data`](./data.md)')
-        if (trec, track) not in self.no_summary:
-            quick_access_parts.append('[`Results`](./results.md)')
-        if (trec, track) not in self.no_runs:
-            quick_access_parts.append('[`Runs`](./runs.md)')
-        if (trec, track) not in self.no_participants:
-            quick_access_parts.append('[`Participants`](./participants.md)')
-        quick_access = ' | '.join(quick_access_parts)
-
-        # Page header and description
-        heading = f"# Overview - {track_row.fullname} {trec_year(trec)}"
-        description = track_row.description or ""
-        content = f"{heading}\n\n{quick_access}\n\n{{==\n\n{description}\n\n==}}\n\n"
+        track_row = self.partition('tracks', trec, track).iloc[0]
+
+        # Page header, quick access links and description
+        quick_access = ' | '.join(self.quick_access_links(trec, track))
+        yield PAGE_TITLE('Overview', track_row.fullname, trec_year(trec))
+        yield TRACK_SUMMARY(quick_access, track_row.description or "")
 
         # Track coordinators
         if track_row.coordinators:
-            coordinators_md = "\n".join(f"- {coord.strip()}" for coord in track_row.coordinators.split(':') if coord.strip())
+            coordinators_md = "\n".join(COORDINATOR(coord.strip()) for coord in track_row.coordinators.split(':') if coord.strip())
             if coordinators_md:
-                content += f":fontawesome-solid-user-group: **Track coordinator(s):**\n\n{coordinators_md}\n\n"
+                yield COORDINATORS(coordinators_md)
 
         # Track tasks
         if track_row.tasks:
-            try:
-                # task_dict = json.loads(track_row.tasks)
-                task_dict = track_row.tasks
-                if task_dict:
-                    content += ":material-text-search: **Tasks:**\n\n"
-                    for task, description in task_dict.items():
-                        content += f"- `{task}`: {description}\n"
-                    content += "\n"
-            except json.JSONDecodeError:
-                pass  # Silently skip malformed JSON
+            yield ":material-text-search: **Tasks:**\n\n"
+            yield from (TASK(task, description) for task, description in track_row.tasks.items())
+            yield "\n"
 
         # Web page
         if track_row.webpage:
-            content += f":fontawesome-solid-globe: **Track Web Page:** [`{track_row.webpage}`]({track_row.webpage})\n\n"
+            yield WEBPAGE(track_row.webpage)
 
-        content += "---\n\n"
-        return content
+        yield SECTION_END
 
 
-    def overview_page_covid(self, trec, tracks):
+    def overview_page_covid(self, trec):
         """Generate the overview page of TREC-COVID."""
 
         # Title
-        content = f"# TREC-COVID {trec_year(trec)}\n\n"
+        yield f"# TREC-COVID {trec_year(trec)}\n\n"
 
         # Quick access links for each round (track)
-        quick_access = ''
-        for track in tracks[tracks['trec'] == trec].track.unique():
-            quick_access_parts = [f"[`Overview`](./{track}/overview.md)"]
-            if (trec, track) not in self.no_proceedings:
-                quick_access_parts.append(f"[`Proceedings`](./{track}/proceedings.md)")
-            if (trec, track) not in self.no_data:
-                quick_access_parts.append(f"[`Data`](./{track}/data.md)")
-            if (trec, track) not in self.no_summary:
-                quick_access_parts.append(f"[`Results`](./{track}/results.md)")
-            if (trec, track) not in self.no_runs:
-                quick_access_parts.append(f"[`Runs`](./{track}/runs.md)")
-            if (trec, track) not in self.no_participants:
-                quick_access_parts.append(f"[`Participants`](./{track}/participants.md)")
-            
-            round_name = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].fullname.iloc[0]
-            quick_access_round = f"**{round_name}:** " + " | ".join(quick_access_parts) + "\n\n"
-            quick_access += quick_access_round
+        quick_access = []
+        for track in self.partition('tracks', trec).track.unique():
+            quick_access_parts = [QUICK_LINK('Overview', f'{track}/', 'overview')]
+            quick_access_parts.extend(self.quick_access_links(trec, track, f'{track}/'))
+            round_name = self.partition('tracks', trec, track).fullname.iloc[0]
+            quick_access.append(ROUND_LINKS(round_name, " | ".join(quick_access_parts)))
 
         # Use round1 as the main reference for general description, coordinators, and webpage
         base_track = 'round1'
-        base_row = tracks[(tracks['trec'] == trec) & (tracks['track'] == base_track)].iloc[0]
+        base_row = self.partition('tracks', trec, base_track).iloc[0]
 
         # Description
-        description = base_row.description or ""
-        content += f"{quick_access}\n\n{{==\n\n{description}\n\n==}}\n\n"
+        yield TRACK_SUMMARY(''.join(quick_access), base_row.description or "")
 
         # Coordinators
         if base_row.coordinators:
-            coordinators_md = "\n".join(f"- {c.strip()}" for c in base_row.coordinators.split(":") if c.strip())
-            content += f":fontawesome-solid-user-group: **Track coordinator(s):**\n\n{coordinators_md}\n\n"
+            coordinators_md = "\n".join(COORDINATOR(c.strip()) for c in base_row.coordinators.split(":") if c.strip())
+            yield COORDINATORS(coordinators_md)
 
         # Webpage
         if base_row.webpage:
-            content += f":fontawesome-solid-globe: **Track Web Page:** [`{base_row.webpage}`]({base_row.webpage})\n\n"
+            yield WEBPAGE(base_row.webpage)
 
-        content += "---\n\n"
-        return content
+        yield SECTION_END
 
 
-    def overview_page_content(self, trec, tracks):
+    def overview_page_content(self, trec):
         """Generate the overview page of a TREC with all track overviews."""
 
         if trec == 'trec-covid':
-            return self.overview_page_covid(trec, tracks)
+            yield from self.overview_page_covid(trec)
+            return
 
         # Title
-        content = f"# Text REtrieval Conference (TREC) {trec_year(trec)}\n\n"
+        yield f"# Text REtrieval Conference (TREC) {trec_year(trec)}\n\n"
 
-        for track in tracks[tracks['trec'] == trec].track.unique():
-            row = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].iloc[0]
+        for track in self.partition('tracks', trec).track.unique():
+            row = self.partition('tracks', trec, track).iloc[0]
 
             # Quick access navigation
-            quick_access_parts = [f"[`Overview`](./{track}/overview.md)"]
-            if (trec, track) not in self.no_proceedings:
-                quick_access_parts.append(f"[`Proceedings`](./{track}/proceedings.md)")
-            if (trec, track) not in self.no_data:
-                quick_access_parts.append(f"[`Data`](./{track}/data.md)")
-            if (trec, track) not in self.no_summary:
-                quick_access_parts.append(f"[`Results`](./{track}/results.md)")
-            if (trec, track) not in self.no_runs:
-                quick_access_parts.append(f"[`Runs`](./{track}/runs.md)")
-            if (trec, track) not in self.no_participants:
-                quick_access_parts.append(f"[`Participants`](./{track}/participants.md)")
-            quick_access = " | ".join(quick_access_parts)
+            quick_access_parts = [QUICK_LINK('Overview', f'{track}/', 'overview')]
+            quick_access_parts.extend(self.quick_access_links(trec, track, f'{track}/'))
 
             # Track details
-            fullname = row.fullname
-            description = row.description or ""
-
-            content += f"## {fullname}\n\n{quick_access}\n\n{{==\n\n{description}\n\n==}}\n\n"
+            yield SECTION_TITLE(row.fullname)
+            yield TRACK_SUMMARY(" | ".join(quick_access_parts), row.description or "")
 
             # Coordinators
             if row.coordinators:
-                coordinators_md = "\n".join(f"- {c.strip()}" for c in row.coordinators.split(":") if c.strip())
-                content += f":fontawesome-solid-user-group: **Track coordinator(s):**\n\n{coordinators_md}\n\n"
+                coordinators_md = "\n".join(COORDINATOR(c.strip()) for c in row.coordinators.split(":") if c.strip())
+                yield COORDINATORS(coordinators_md)
 
             # Web page
             if row.webpage:
-                content += f":fontawesome-solid-globe: **Track Web Page:** [`{row.webpage}`]({row.webpage})\n\n"
-
-            content += "---\n\n"
+                yield WEBPAGE(row.webpage)
 
-        return content
+            yield SECTION_END
 
 
-    def data_page_content(self, trec, track, tracks, datasets):
+    def data_page_content(self, trec, track):
         """Generate the content of a data page."""
 
         # Get metadata for the track and dataset
-        track_row = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].iloc[0]
-        dataset_row = datasets[(datasets['trec'] == trec) & (datasets['track'] == track)].iloc[0]
+        track_row = self.partition('tracks', trec, track).iloc[0]
+        dataset_row = self.partition('datasets', trec, track).iloc[0]
 
-        track_fullname = track_row.fullname
-        year = trec_year(trec)
-
-        content = f"# Data - {track_fullname} {year}\n\n"
+        yield PAGE_TITLE('Data', track_row.fullname, trec_year(trec))
 
         # Add TREC webpage if available
-        trec_webpage = dataset_row.trec_webpage
-        if trec_webpage:
-            content += f":fontawesome-solid-globe: **`trec.nist.gov`**: [`{trec_webpage}`]({trec_webpage})\n\n"
+        if dataset_row.trec_webpage:
+            yield DATA_WEBPAGE(dataset_row.trec_webpage)
 
-        content += "---\n\n"
+        yield SECTION_END
 
         # Add links to primary resources
-        task_content = []
-
-        if dataset_row.corpus:
-            task_content.append(f"- :material-database: **Corpus**: {convert(dataset_row.corpus)}\n")
-        if dataset_row.topics:
-            task_content.append(f"- :octicons-question-16: **Topics**: {convert(dataset_row.topics)}\n")
-        if dataset_row.qrels:
-            task_content.append(f"- :material-label: **Qrels**: {convert(dataset_row.qrels)}\n")
-        if dataset_row.ir_datasets:
-            task_content.append(f"- :material-database-outline: **ir_datasets**: {convert(dataset_row.ir_datasets)}\n")
-
-        if task_content:
-            content += ''.join(task_content) + "\n---\n\n"
+        resources = [
+            DATA_RESOURCE(icon, label, convert(dataset_row[column]))
+            for column, icon, label in DATA_RESOURCES
+            if dataset_row[column]
+        ]
+        if resources:
+            yield from resources
+            yield "\n---\n\n"
 
         # Add "Other" resources if available
         if dataset_row.other:
-            content += f"**Other:** {convert(dataset_row.other)}\n"
+            yield DATA_OTHER(convert(dataset_row.other))
 
-        return content
 
-
-    def format_paper_section(self, pub, trec, runs, track=None):
+    def format_paper_section(self, pub, trec, track=None):
         """Helper to format a paper section including metadata, links, and bibtex."""
-        title = pub.title
-        author = pub.author
-        url = pub.url
-        abstract = pub.abstract
-        bibtex = pub.bibtex.strip().replace('\n', '\n\t')
-        biburl = pub.biburl or ''
-
-        section = f'#### {title}\n\n_{author}_\n\n'
-        section += f'- :material-file-pdf-box: **Paper:** [{url}]({url})\n'
+        section = [self.format_paper_header(pub)]
 
         if track and (trec, track) not in self.no_participants:
-            section += f'- :fontawesome-solid-user-group: **Participant:** [{pub.pid}](./{track}/participants.md#{pub.pid.lower()})\n'
+            section.append(PARTICIPANT_LINK(pub.pid, f'{track}/', name_anchor(pub.pid)))
 
         if track:
-            _runs = runs[(runs['trec'] == trec) & (runs['track'] == track) & (runs['pid'] == pub.pid)]
+            _runs = self.partition('runs', trec, track, pub.pid)
             if len(_runs):
-                run_links = [f"[{r.runid}](./{track}/runs.md#{r.runid.lower()})" for _, r in _runs.iterrows()]
-                section += f'- :material-file-search: **Runs:** {" | ".join(run_links)}\n'
+                section.append(RUN_LINKS(' | '.join(RUN_REF(runid, f'{track}/', self.run_anchors[(trec, track, runid)]['runs']) for runid in _runs.runid)))
 
-        if abstract:
-            section += f'??? abstract "Abstract"\n\t\n\t{abstract}\n\t\n\n'
+        if pub.abstract:
+            section.append(ABSTRACT(pub.abstract))
 
-        section += f'??? quote "Bibtex [:material-link-variant:]({biburl})"\n\t```\n\t{bibtex}\n\t```\n\n'
-        return section
+        section.append(BIBTEX(pub.biburl or '', '', self.format_bibtex(pub.bibtex)))
+        return ''.join(section)
 
 
-    def proceedings_content(self, trec, publications, runs, tracks):
+    def proceedings_content(self, trec):
         """Generate the proceedings page of a TREC including all tracks."""
 
         # Header for the proceedings page
-        content = f"# Proceedings {trec_year(trec)}\n\n"
+        yield f"# Proceedings {trec_year(trec)}\n\n"
 
         # Add general overview paper if it exists
-        overview_pub = publications[(publications['track'] == 'overview') & (publications['trec'] == trec) & (publications['pid'] == 'overview')]
+        overview_pub = self.partition('publications', trec, 'overview', 'overview')
         if not overview_pub.empty:
-            content += "## {}\n\n".format(overview_pub.iloc[0].title)
-            content += self.format_paper_section(overview_pub.iloc[0], trec, runs)
+            yield SECTION_TITLE(overview_pub.iloc[0].title)
+            yield self.format_paper_section(overview_pub.iloc[0], trec)
 
         # Add track-specific papers
-        for track in tracks[tracks['trec'] == trec].track.unique():
-            track_pubs = publications[(publications['track'] == track) & (publications['trec'] == trec)]
+        for track in self.partition('tracks', trec).track.unique():
+            track_pubs = self.partition('publications', trec, track)
             if track_pubs.empty:
                 continue
 
-            track_fullname = tracks[(tracks['trec'] == trec) & (tracks['track'] == track)].fullname.iloc[0]
-            content += f"## {track_fullname}\n\n"
+            track_fullname = self.partition('tracks', trec, track).fullname.iloc[0]
+            yield SECTION_TITLE(track_fullname)
 
             # Track overview paper
-            overview = track_pubs[track_pubs['pid'] == 'overview']
+            overview = self.partition('publications', trec, track, 'overview')
             if not overview.empty:
-                content += self.format_paper_section(overview.iloc[0], trec, runs, track=track)
+                yield self.format_paper_section(overview.iloc[0], trec, track=track)
 
             # Participant papers
-            for _, pub in track_pubs.iterrows():
+            for pub in track_pubs.itertuples():
                 if pub.pid == 'overview':
                     continue
-                content += self.format_paper_section(pub, trec, runs, track=track)
-
-        return content
+                yield self.format_paper_section(pub, trec, track=track)
 
 
     def write_page(self, type, **args):
         """Generate browser pages of different types."""
 
         page_config = {
-            'overview': ('overview.md', lambda a: self.overview_page_content(a['trec'], a['tracks'])),
-            'proceedings': ('proceedings.md', lambda a: self.proceedings_content(
-                trec=a['trec'], publications=a['publications'], runs=a['runs'], tracks=a['tracks'])),
-            'publications': ('proceedings.md', lambda a: self.proceedings_page_content(
-                trec=a['trec'], track=a['track'], publications=a['publications'], runs=a['runs'], tracks=a['tracks'])),
-            'results': ('results.md', lambda a: self.results_page_content(
-                a['trec'], a['track'], a['tracks'], a['runs'], a['results'], a['publications'])),
-            'runs': ('runs.md', lambda a: self.runs_page_content(
-                a['trec'], a['track'], a['publications'], a['runs'], a['tracks'])),
-            'participants': ('participants.md', lambda a: self.participants_page_content(
-                a['trec'], a['track'], a['participants'], a['runs'], a['tracks'])),
-            'track_overview': ('overview.md', lambda a: self.track_overview_page_content(
-                a['trec'], a['track'], a['tracks'])),
-            'data': ('data.md', lambda a: self.data_page_content(
-                a['trec'], a['track'], a['tracks'], a['datasets']))
+            'overview': ('overview.md', lambda a: self.overview_page_content(a['trec'])),
+            'proceedings': ('proceedings.md', lambda a: self.proceedings_content(a['trec'])),
+            'publications': ('proceedings.md', lambda a: self.proceedings_page_content(a['trec'], a['track'])),
+            'results': ('results.md', lambda a: self.results_page_content(a['trec'], a['track'])),
+            'runs': ('runs.md', lambda a: self.runs_page_content(a['trec'], a['track'])),
+            'participants': ('participants.md', lambda a: self.participants_page_content(a['trec'], a['track'])),
+            'track_overview': ('overview.md', lambda a: self.track_overview_page_content(a['trec'], a['track'])),
+            'data': ('data.md', lambda a: self.data_page_content(a['trec'], a['track']))
         }
 
         if type not in page_config:
             raise ValueError(f"Unknown page type: {type}")
 
         file_name, content_func = page_config[type]
-        page_content = content_func(args)
 
         # Determine the write path based on whether it's global (overview/proceedings) or track-specific
         if type in ['overview', 'proceedings']:
-            output_path = os.path.join(args['build_path'], args['trec'])
+            page_key = '/'.join([args['trec'], file_name])
+            inputs_hash = self.page_inputs_hash(args['trec'])
         else:
-            output_path = os.path.join(args['build_path'], args['trec'], args['track'])
-
-        os.makedirs(output_path, exist_ok=True)
-        with open(os.path.join(output_path, file_name), 'w') as f_out:
-            f_out.write(page_content)
+            page_key = '/'.join([args['trec'], args['track'], file_name])
+            inputs_hash = self.page_inputs_hash(args['trec'], args['track'])
+        page_path = Path(args['build_path'], page_key)
+        overwrite = args.get('overwrite', False)
+
+        # Skip pages whose inputs did not change since the last build
+        entry = self.manifest.get(page_key)
+        if not overwrite and entry and entry['inputs'] == inputs_hash and page_path.exists():
+            self.manifest_updates[page_key] = entry
+            return
+
+        # Stream the page to disk while it is rendered (the directories are created by build());
+        # atomic writes go to a temporary file that only replaces the page once it is complete,
+        # in-place writes rewrite the page even if its bytes did not change (see build())
+        if not args.get('atomic', True):
+            output_hash = write_fragments(page_path, content_func(args))
+        else:
+            tmp_path = page_path.with_name(f'.{page_path.name}.tmp')
+            output_hash = write_fragments(tmp_path, content_func(args))
 
+            # Do not replace pages whose rendered bytes did not change
+            if overwrite or not (entry and entry['output'] == output_hash and page_path.exists()):
+                os.replace(tmp_path, page_path)
+            else:
+                tmp_path.unlink()
 
-    def filter_by_trec(self, df, trec):
-        return df[df['trec'] == trec]
+        self.manifest_updates[page_key] = {'inputs': inputs_hash, 'output': output_hash}
 
 
     def create_index_page(self):
@@ -997,7 +1245,7 @@ class PageBuilder:
         index_file_path = os.path.join(self.build_path, 'index.md')
 
         # Write to markdown file
-        Path(index_file_path).write_text(content, encoding='utf-8')
+        write_if_changed(Path(index_file_path), content)
 
 
     def create_data_page(self):
@@ -1050,7 +1298,7 @@ class PageBuilder:
         data_file_path = os.path.join(self.build_path, 'data.md')
 
         # Write to file
-        Path(data_file_path).write_text(content, encoding='utf-8')
+        write_if_changed(Path(data_file_path), content)
 
 
     def create_mkdocs_config(self):
@@ -1140,18 +1388,27 @@ class PageBuilder:
 
         mkdocs_path = os.path.join(self.build_path.parent, 'mkdocs.yml')
 
-        Path(mkdocs_path).write_text(output, encoding='utf-8')
+        write_if_changed(Path(mkdocs_path), output)
 
 
-    def build(self, trec, build_path, overwrite=False):
+    def manifest_path(self, trec, build_path) -> Path:
+        """Location of the build manifest of a conference (kept outside of the mkdocs docs directory)."""
+        return Path(build_path).parent / '.manifest' / f'{trec}.json'
+
+
+    def build(self, trec, build_path, overwrite=False, atomic=True):
+        """Build the pages of a conference, skipping the pages whose inputs did not change since the last build.
+
+        With atomic=True (the default) a re-rendered page goes to a temporary file that only replaces the page
+        if its bytes changed, so unchanged pages keep their mtime. With atomic=False pages are written in place,
+        which saves the temporary file but rewrites every re-rendered page, even if its bytes did not change.
+        """
+
+        # Load the manifest of the previous build to skip unchanged pages
+        manifest_path = self.manifest_path(trec, build_path)
+        self.manifest = load_json(manifest_path) if manifest_path.exists() else {}
+        self.manifest_updates = {}
 
-        runs = self.filter_by_trec(self.runs, trec)
-        participants = self.filter_by_trec(self.participants, trec)
-        publications = self.filter_by_trec(self.publications, trec)
-        datasets = self.filter_by_trec(self.datasets, trec)
-        tracks = self.filter_by_trec(self.tracks, trec)
-        results = self.filter_by_trec(self.results, trec)
-        
         # Mapping from page type to the sets that block their creation for a given (trec, track)
         skip_conditions = {
             'publications': self.no_proceedings,
@@ -1161,42 +1418,65 @@ class PageBuilder:
             'data': self.no_data,
         }
 
-        trec_path = os.path.join('.', 'browser', 'src', 'docs', trec)
-        os.makedirs(trec_path, exist_ok=True)
+        # Create the directories of the conference and its tracks once
+        tracks_for_trec = self.partition('tracks', trec).track.unique()
+        os.makedirs(os.path.join(build_path, trec), exist_ok=True)
+        for track in tracks_for_trec:
+            os.makedirs(os.path.join(build_path, trec, track), exist_ok=True)
 
         # Always write overview page
-        self.write_page(trec=trec, tracks=tracks, type='overview', build_path=build_path)
+        self.write_page(trec=trec, type='overview', build_path=build_path, overwrite=overwrite, atomic=atomic)
 
         # Write proceedings if allowed
         if trec != 'trec-covid':
-            self.write_page(trec=trec, tracks=tracks, publications=publications, runs=runs, type='proceedings', build_path=build_path)
+            self.write_page(trec=trec, type='proceedings', build_path=build_path, overwrite=overwrite, atomic=atomic)
 
-        tracks_for_trec = tracks[tracks['trec'] == trec].track.unique()
         for track in tracks_for_trec:
             trec_track = (trec, track)
             for page_type in ['track_overview', 'publications', 'runs', 'results', 'participants', 'data']:
                 # Skip page if condition matches
                 if page_type in skip_conditions and trec_track in skip_conditions[page_type]:
                     continue
-                self.write_page(
-                    type=page_type,
-                    trec=trec,
-                    track=track,
-                    tracks=tracks,
-                    participants=participants,
-                    runs=runs,
-                    results=results,
-                    publications=publications,
-                    datasets=datasets,
-                    build_path=build_path
-                )
-
-
-    def build_all(self, build_path, overwrite=False):
-
-        trecs = []
-        for file_path in self.base_path.glob('trec*'):
-            trecs.append(file_path.name)
-
-        for trec in tqdm(trecs):
-            self.build(trec=trec, build_path=build_path, overwrite=overwrite)
+                self.write_page(type=page_type, trec=trec, track=track, build_path=build_path, overwrite=overwrite, atomic=atomic)
+
+        # Remove the pages of the previous build that are no longer built (e.g. of removed tracks)
+        for page_key in self.manifest.keys() - self.manifest_updates.keys():
+            page_path = Path(build_path, page_key)
+            page_path.unlink(missing_ok=True)
+            if page_path.parent != Path(build_path, trec) and page_path.parent.is_dir() and not any(page_path.parent.iterdir()):
+                page_path.parent.rmdir()
+
+        # Record the pages of this build
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        write_if_changed(manifest_path, json.dumps(self.manifest_updates, indent=4, sort_keys=True))
+
+
+    def build_all(self, build_path, overwrite=False, workers=1, atomic=True):
+        """Build the pages of all conferences (see build() for overwrite and atomic), then the pages spanning all of them."""
+
+        trecs = sorted((file_path.name for file_path in self.base_path.glob('trec*')), key=trec_sort_key)
+
+        if workers > 1:
+            # Each worker only receives the partition of its own conference
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(build_conference, trec, self.conference_tables(trec), self.base_path, build_path, overwrite, atomic)
+                    for trec in trecs
+                ]
+                for future in tqdm(as_completed(futures), total=len(futures)):
+                    future.result()
+        else:
+            for trec in tqdm(trecs):
+                self.build(trec=trec, build_path=build_path, overwrite=overwrite, atomic=atomic)
+
+        # Merge step: pages spanning all conferences are written once every conference is built
+        self.create_index_page()
+        self.create_data_page()
+        self.create_mkdocs_config()
+
+
+def build_conference(trec, tables, base_path, build_path, overwrite=False, atomic=True):
+    """Build the pages of a single conference from its partition of the metadata (used by build workers)."""
+    page_builder = PageBuilder(base_path=base_path, build_path=build_path, tables=tables)
+    page_builder.build(trec=trec, build_path=build_path, overwrite=overwrite, atomic=atomic)
+    return trec
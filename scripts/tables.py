@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+from itertools import islice
+from typing import Iterable, List
+
+
+# Number of records that are parsed into a batch before it is turned into columns
+BATCH_SIZE = 65536
+
+
+def frame_from_records(records: Iterable[dict], batch_size: int = BATCH_SIZE) -> pd.DataFrame:
+    """Build a table from a stream of records, turning them into columns in batches of `batch_size`.
+
+    The full list of records is never held in memory next to the resulting table.
+    """
+    records = iter(records)
+    chunks = []
+    while batch := list(islice(records, batch_size)):
+        chunks.append(pd.DataFrame(batch))
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+
+def normalize_empty_strings(df: pd.DataFrame, columns=None) -> pd.DataFrame:
+    """Replace empty strings in the string columns of a table with missing values (exact match, no regex)."""
+    for col in df.columns if columns is None else columns:
+        if col not in df.columns:
+            continue
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            if '' in df[col].cat.categories:
+                df[col] = df[col].cat.remove_categories([''])
+        elif df[col].dtype == object:
+            empty = df[col].values == ''
+            if empty.any():
+                df[col] = df[col].mask(empty, None)
+    return df
+
+
+class ColumnBuffer:
+    """Preallocated, fixed-size column buffers of category codes and values, flushed into chunks when full."""
+
+    def __init__(self, keys: List[str], dtype, batch_size: int = BATCH_SIZE):
+        self.keys = keys
+        self.categories = [{} for _ in keys]
+        self.codes = np.empty((batch_size, len(keys)), dtype=np.int32)
+        self.values = np.empty(batch_size, dtype=dtype)
+        self.size = 0
+        self.chunks = []
+
+    def append(self, keys: tuple, value):
+        self.codes[self.size] = [
+            categories.setdefault(key, len(categories)) for categories, key in zip(self.categories, keys)
+        ]
+        self.values[self.size] = value
+        self.size += 1
+        if self.size == len(self.values):
+            self.flush()
+
+    def flush(self):
+        if self.size:
+            self.chunks.append((self.codes[:self.size].copy(), self.values[:self.size].copy()))
+            self.size = 0
+
+    def to_frame(self, value_column: str) -> pd.DataFrame:
+        """Return the buffered rows as a table with categorical key columns."""
+        self.flush()
+        codes = np.concatenate([c for c, _ in self.chunks]) if self.chunks else self.codes[:0]
+        values = np.concatenate([v for _, v in self.chunks]) if self.chunks else self.values[:0]
+        self.chunks = []
+        df = pd.DataFrame({
+            key: pd.Categorical.from_codes(codes[:, i], categories=list(self.categories[i]))
+            for i, key in enumerate(self.keys)
+        })
+        df[value_column] = values
+        return df
+
+
+# Indexes that are built once the tables are loaded into the database
+TABLE_INDEXES = {
+    'runs': [('trec', 'track'), ('trec', 'track', 'runid'), ('trec', 'pid')],
+    'participants': [('trec', 'pid')],
+    'publications': [('trec', 'track'), ('trec', 'pid')],
+    'datasets': [('trec', 'track')],
+    'tracks': [('trec', 'track')],
+    'results': [('trec', 'track'), ('trec', 'track', 'runid')],
+}
+
+
+def bulk_load(engine, tables: dict, index: bool = False):
+    """Replace the given tables in an SQLite database in one transaction, then build their indexes.
+
+    Journaling is turned off during the load and rows are inserted with executemany.
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        cursor.execute('PRAGMA journal_mode=OFF')
+        cursor.execute('PRAGMA synchronous=OFF')
+        cursor.execute('BEGIN')
+        for name, df in tables.items():
+            if index:
+                df = df.reset_index()
+            columns = ', '.join(f'"{col}"' for col in df.columns)
+            placeholders = ', '.join('?' for _ in df.columns)
+            cursor.execute(f'DROP TABLE IF EXISTS "{name}"')
+            cursor.execute(pd.io.sql.get_schema(df, name, con=engine))
+            rows = df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+            cursor.executemany(f'INSERT INTO "{name}" ({columns}) VALUES ({placeholders})', rows)
+            for index_columns in TABLE_INDEXES.get(name, []):
+                if set(index_columns).issubset(df.columns):
+                    index_name = '_'.join(['ix', name] + list(index_columns))
+                    cursor.execute(f'CREATE INDEX "{index_name}" ON "{name}" ({", ".join(index_columns)})')
+        connection.commit()
+    finally:
+        connection.close()
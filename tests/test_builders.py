@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from builders import PageBuilder, RESULT_KEYS, normalize_empty_strings
+
+
+def tables():
+    """Tables of one track with one paper that has no author, biburl or bibtex (as empty strings)."""
+    return {
+        'runs': pd.DataFrame([{
+            'trec': 'trec8', 'track': 'adhoc', 'runid': 'run.a', 'pid': 'lab', 'year': 1999,
+            'input_url': 'https://in/run.a.gz', 'summary_url': '', 'appendix_url': '',
+            'date': '', 'type': 'automatic', 'task': '', 'md5': '', 'description': '', 'other': '',
+        }]),
+        'participants': pd.DataFrame([{'trec': 'trec8', 'pid': 'lab', 'name': '', 'organization': 'Lab'}]),
+        'publications': pd.DataFrame([
+            {
+                'trec': 'trec8', 'track': 'adhoc', 'pid': 'overview', 'title': 'Overview', 'author': '',
+                'url': 'https://p/overview.pdf', 'abstract': '', 'bibtex': '', 'biburl': '',
+            },
+            {
+                'trec': 'trec8', 'track': 'adhoc', 'pid': 'lab', 'title': 'A Paper', 'author': '',
+                'url': 'https://p/lab.pdf', 'abstract': 'Abstract.', 'bibtex': '@inproceedings{lab}', 'biburl': '',
+            },
+        ]),
+        'datasets': pd.DataFrame([{
+            'trec': 'trec8', 'track': 'adhoc', 'corpus': '', 'topics': '', 'qrels': '',
+            'ir_datasets': '', 'trec_webpage': '', 'other': '',
+        }]),
+        'tracks': pd.DataFrame([{
+            'trec': 'trec8', 'track': 'adhoc', 'fullname': 'Ad Hoc', 'description': '',
+            'coordinators': '', 'tasks': None, 'webpage': '',
+        }]),
+        'results': pd.DataFrame(columns=RESULT_KEYS + ['score', 'score_text']),
+        'summaries': pd.DataFrame(columns=RESULT_KEYS + ['text']),
+    }
+
+
+def test_proceedings_pages_render_missing_fields_like_empty_strings():
+    # The tables as loaded before and after empty strings were normalized to missing values at load time
+    before = PageBuilder(tables=tables())
+    after = PageBuilder(tables={name: normalize_empty_strings(df) for name, df in tables().items()})
+
+    track_page = ''.join(after.proceedings_page_content('trec8', 'adhoc'))
+    assert track_page == ''.join(before.proceedings_page_content('trec8', 'adhoc'))
+    assert ''.join(after.proceedings_content('trec8')) == ''.join(before.proceedings_content('trec8'))
+
+    assert 'None' not in track_page
+    assert '#### A Paper\n\n__\n\n' in track_page
+    assert '??? quote "Bibtex [:material-link-variant:]() "\n\t```\n\t@inproceedings{lab}\n\t```\n\n' in track_page
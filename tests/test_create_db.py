@@ -0,0 +1,34 @@
+import random
+import sys
+from itertools import product
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import create_db
+
+
+def strip_file_name_loop(runid):
+    # the original implementation, which removes every affix from anywhere in the file name
+    runid = runid.split('/')[-1]
+    for affix in create_db.summary_affixes:
+        runid = runid.replace(affix, '')
+    return runid
+
+
+def test_strip_file_name_matches_affix_loop():
+    runids = ['', 'X', 'run-1', 'a.b', 'uogTrA1', 'std-run', 'summaryX', 'trec', 'evalH', 'Run_ndcg', 'run.txt2']
+    fragments = list(create_db.summary_affixes) + runids + ['.', '-', 'summary', 'trec_eval', 'nd', 'a-', 'std']
+    names = {
+        directory + prefix + runid + suffix
+        for directory, prefix, runid, suffix in product(
+            ['', 'dir/'], create_db.summary_prefixes + [''], runids, create_db.summary_suffixes + ['']
+        )
+    }
+    # affixes that overlap each other, the runid or the prefix and suffix
+    names.update(a + b for a, b in product(fragments, repeat=2))
+    rng = random.Random(0)
+    names.update(''.join(rng.choices(fragments, k=rng.randint(3, 5))) for _ in range(20000))
+
+    mismatches = [name for name in sorted(names) if create_db.strip_file_name(name) != strip_file_name_loop(name)]
+    assert mismatches == []